@@ -0,0 +1,147 @@
+# benchmarks/bench_parsers.py
+"""
+LLM 응답 파서의 파싱 시간과 복원율(recall)을 함께 측정합니다.
+
+    pip install -r benchmarks/requirements.txt
+    pytest benchmarks                                  # 측정 + 복원율 회귀 검사
+    pytest benchmarks --benchmark-save=before          # 파서 수정 전 결과 저장
+    pytest benchmarks --benchmark-compare              # 저장된 결과와 비교
+    pytest benchmarks --update-recall-baseline         # 복원율이 좋아졌을 때 기준값 갱신
+
+복원율은 benchmark의 extra_info에 기록되고(--benchmark-json 출력에 포함),
+recall_baseline.json의 기준값보다 낮아지면 테스트가 실패합니다.
+"""
+import json
+import os
+
+import pytest
+
+from corpus import CASES, COMPANY, JOB, nested, nested_expected
+from langchain_app.structured_output import (
+    CompanyInfo,
+    JobInfo,
+    Recommendation,
+    StarList,
+    validate_response,
+)
+from langchain_app.utils import flatten_json, parse_company_info, parse_langchain_response
+from user_coverletter.utils import parse_recommended_ids
+from user_experience.utils import parse_star_response
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recall_baseline.json")
+
+SCHEMAS = {"company": CompanyInfo, "job": JobInfo, "star": StarList, "ids": Recommendation}
+
+
+def validate(kind):
+    # 구조화 출력 경로(validate_response)는 실패 시 예외를 던지므로 복원율 0으로 취급
+    schema = SCHEMAS[kind]
+
+    def parse(response):
+        try:
+            return validate_response(response, schema).model_dump(by_alias=True)
+        except ValueError:
+            return None
+    return parse
+
+
+# kind별로 측정할 파서
+PARSERS = {
+    "company": {
+        "parse_company_info": parse_company_info,
+        "parse_langchain_response": parse_langchain_response,
+        "validate_response": validate("company"),
+    },
+    "job": {
+        "parse_company_info": parse_company_info,
+        "parse_langchain_response": parse_langchain_response,
+        "validate_response": validate("job"),
+    },
+    "star": {
+        "parse_star_response": parse_star_response,
+        "validate_response": validate("star"),
+    },
+    "ids": {
+        "parse_recommended_ids": parse_recommended_ids,
+        "validate_response": validate("ids"),
+    },
+}
+
+
+def info_recall(parsed, expected):
+    if not isinstance(parsed, dict):
+        return 0.0
+    values = {str(key).replace("_", " ").strip(): str(value) for key, value in parsed.items()}
+    return sum(1 for key, value in expected.items() if value in values.get(key, "")) / len(expected)
+
+
+def star_recall(parsed, expected):
+    if isinstance(parsed, dict):
+        parsed = parsed.get("experiences", [parsed])
+    if not isinstance(parsed, list):
+        return 0.0
+    titles = [str(item.get("title", "")) for item in parsed if isinstance(item, dict)]
+    return sum(1 for title in expected if any(title in found for found in titles)) / len(expected)
+
+
+def ids_recall(parsed, expected):
+    if isinstance(parsed, dict):
+        parsed = parsed.get("ids")
+    if not isinstance(parsed, list):
+        return 0.0
+    # 순서가 중요하므로 앞에서부터 일치하는 개수로 계산
+    matched = 0
+    for found, wanted in zip(parsed, expected):
+        if found != wanted:
+            break
+        matched += 1
+    return matched / len(expected)
+
+
+RECALL = {"company": info_recall, "job": info_recall, "star": star_recall, "ids": ids_recall}
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def recall_baseline(request):
+    baseline = load_baseline()
+    yield baseline
+    if request.config.getoption("--update-recall-baseline"):
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baseline.items())), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+PARAMS = [
+    pytest.param(case, parser_name, id=f"{case['name']}-{parser_name}")
+    for case in CASES
+    for parser_name in PARSERS[case["kind"]]
+]
+
+
+@pytest.mark.parametrize("case,parser_name", PARAMS)
+def bench_parser(benchmark, recall_baseline, request, case, parser_name):
+    parser = PARSERS[case["kind"]][parser_name]
+    benchmark.group = case["name"]
+    parsed = benchmark(parser, case["response"])
+
+    recall = RECALL[case["kind"]](parsed, case["expected"])
+    benchmark.extra_info["recall"] = recall
+    key = f"{case['name']}::{parser_name}"
+    if request.config.getoption("--update-recall-baseline"):
+        recall_baseline[key] = recall
+        return
+    assert recall >= recall_baseline.get(key, 1.0), f"{key}: recall {recall:.2f} < baseline {recall_baseline.get(key, 1.0):.2f}"
+
+
+@pytest.mark.parametrize("name,data", [("company", COMPANY), ("job", JOB)])
+def bench_flatten_json(benchmark, name, data):
+    benchmark.group = f"flatten_json_{name}"
+    flattened = benchmark(flatten_json, nested(data))
+    assert info_recall(flattened, nested_expected(data)) == 1.0
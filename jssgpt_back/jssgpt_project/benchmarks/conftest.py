@@ -0,0 +1,21 @@
+# benchmarks/conftest.py
+import os
+import sys
+
+import django
+
+# jssgpt_project(manage.py가 있는 디렉터리)를 import 경로에 추가하고 Django 설정을 로드
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jssgpt_project.settings")
+django.setup()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-recall-baseline",
+        action="store_true",
+        default=False,
+        help="현재 파서별 복원율을 recall_baseline.json에 기록합니다.",
+    )
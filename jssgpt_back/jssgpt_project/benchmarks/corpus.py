@@ -0,0 +1,154 @@
+# benchmarks/corpus.py
+"""
+LLM 응답 파서 벤치마크용 코퍼스입니다.
+실제 운영에서 받은 응답 모양(코드 펜스, 펜스 없음, 중첩, 잘림, 설명 문구 섞임)을 재현한 한국어 응답과,
+파싱 결과에 반드시 들어 있어야 하는 값(expected)을 함께 둡니다.
+
+- kind: "company"/"job"(기업/직무 정보 dict), "star"(STAR 경험 목록), "ids"(추천 경험 ID 목록)
+- expected:
+    company/job -> {키: 값에 포함되어야 하는 문자열}
+    star -> 추출되어야 하는 경험 title 목록
+    ids  -> 추출되어야 하는 ID 목록(순서 포함)
+파서별 복원율(recall)은 recall_baseline.json의 값 아래로 떨어지면 실패합니다.
+"""
+import json
+
+COMPANY = {
+    "산업": "반도체 및 디스플레이 제조업으로 메모리 시장 점유율 1위를 유지하고 있다.",
+    "회사 비전": "초격차 기술로 인류 사회에 공헌한다.",
+    "미션": "최고의 제품과 서비스를 창출하여 고객에게 새로운 가치를 제공한다.",
+    "기업 문화와 인재상": "도전과 몰입을 중시하며 변화를 주도하는 인재를 찾는다.",
+    "최근 주요 성과": "HBM3E 양산과 파운드리 2나노 공정 수주를 달성했다.",
+    "현재 주요 이슈": "메모리 수요 둔화와 미국 수출 규제 대응이 과제다.",
+}
+
+JOB = {
+    "직무 설명": "대규모 트래픽을 처리하는 백엔드 서비스를 설계하고 운영한다.",
+    "수행 업무": "API 설계, 데이터 모델링, 장애 대응, 성능 개선",
+    "필요한 기술": "Python, Django, PostgreSQL, Redis, AWS",
+    "관련 소프트 스킬": "문제 해결력, 의사소통, 협업",
+    "필요 강점": "끈기와 꼼꼼함, 빠른 학습 능력",
+}
+
+STARS = [
+    {
+        "title": "교내 해커톤 대상 수상",
+        "situation": "48시간 안에 캠퍼스 분실물 문제를 해결하는 서비스를 만들어야 했다.",
+        "task": "백엔드 리드로서 API와 배포를 책임졌다.",
+        "action": "Django REST API를 설계하고 Docker로 배포 파이프라인을 구축했다.",
+        "result": "30개 팀 중 대상을 수상했고 실제 학생회에 도입되었다.",
+    },
+    {
+        "title": "물류 스타트업 인턴 - 배차 자동화",
+        "situation": "수기 배차로 하루 2시간 이상이 소요되고 있었다.",
+        "task": "배차 업무 자동화 도구 개발을 맡았다.",
+        "action": "주문 데이터를 분석해 규칙 기반 배차 알고리즘을 구현했다.",
+        "result": "배차 시간을 85% 단축하고 오배차를 월 40건에서 3건으로 줄였다.",
+    },
+    {
+        "title": "동아리 회장 - 신입 온보딩 개선",
+        "situation": "신입 부원의 한 학기 이탈률이 50%에 달했다.",
+        "task": "회장으로서 이탈률을 낮추는 것이 목표였다.",
+        "action": "멘토링 짝과 4주 커리큘럼을 만들고 매주 피드백을 받았다.",
+        "result": "이탈률을 15%로 낮췄다.",
+    },
+]
+
+
+def dumps(data, indent=2):
+    return json.dumps(data, ensure_ascii=False, indent=indent)
+
+
+def fenced(text, lang="json"):
+    return f"```{lang}\n{text}\n```"
+
+
+def truncate(text, ratio):
+    return text[: int(len(text) * ratio)]
+
+
+def nested(data):
+    # {"역할": ..., "책임": ...} 처럼 값이 dict/list로 한 번 더 나뉘어 오는 응답
+    result = {}
+    for i, (key, value) in enumerate(data.items()):
+        if i % 2 == 0:
+            head, _, tail = value.partition(" ")
+            result[key] = {"요약": head, "상세": tail}
+        else:
+            result[key] = [part.strip() for part in value.split(",")]
+    return result
+
+
+def nested_expected(data):
+    # 중첩 응답을 평탄화했을 때 값에 남아 있어야 하는 앞부분
+    return {key: value.split(",")[0].split(" ")[0] for key, value in data.items()}
+
+
+def underscore_keys(data):
+    return {key.replace(" ", "_"): value for key, value in data.items()}
+
+
+def markdown_lines(data):
+    # JSON mode가 꺼졌을 때 받은 "- 키: 값" 형태의 목록 응답
+    return "\n".join(f"- {key}: {value}" for key, value in data.items())
+
+
+def star_text_blocks(items):
+    # JSON 대신 빈 줄로 구분된 "키: 값" 블록으로 온 STAR 응답
+    return "\n\n".join(
+        "\n".join(f"{key}: {value}" for key, value in item.items()) for item in items
+    )
+
+
+def star_expected(items):
+    return [item["title"] for item in items]
+
+
+CASES = [
+    # 기업/직무 정보
+    {"name": "company_plain", "kind": "company",
+     "response": dumps(COMPANY), "expected": COMPANY},
+    {"name": "company_fenced", "kind": "company",
+     "response": fenced(dumps(COMPANY)), "expected": COMPANY},
+    {"name": "company_compact_underscore_keys", "kind": "company",
+     "response": dumps(underscore_keys(COMPANY), indent=None), "expected": COMPANY},
+    {"name": "company_wrapped_in_name", "kind": "company",
+     "response": fenced(dumps({"삼성전자": COMPANY})), "expected": COMPANY},
+    {"name": "company_nested_values", "kind": "company",
+     "response": fenced(dumps(nested(COMPANY))), "expected": nested_expected(COMPANY)},
+    {"name": "company_with_preamble", "kind": "company",
+     "response": "다음은 요청하신 삼성전자 정보입니다.\n\n" + fenced(dumps(COMPANY)) + "\n\n추가로 궁금한 점이 있으면 알려주세요.",
+     "expected": COMPANY},
+    {"name": "company_truncated", "kind": "company",
+     "response": fenced(truncate(dumps(COMPANY), 0.7)), "expected": COMPANY},
+    {"name": "company_markdown_lines", "kind": "company",
+     "response": markdown_lines(COMPANY), "expected": COMPANY},
+    {"name": "job_fenced", "kind": "job",
+     "response": fenced(dumps(JOB)), "expected": JOB},
+    {"name": "job_nested_values", "kind": "job",
+     "response": dumps(nested(JOB)), "expected": nested_expected(JOB)},
+    {"name": "job_truncated", "kind": "job",
+     "response": truncate(dumps(JOB), 0.6), "expected": JOB},
+
+    # STAR 경험 목록
+    {"name": "star_object_fenced", "kind": "star",
+     "response": fenced(dumps({"experiences": STARS})), "expected": star_expected(STARS)},
+    {"name": "star_bare_array", "kind": "star",
+     "response": dumps(STARS), "expected": star_expected(STARS)},
+    {"name": "star_long_resume", "kind": "star",
+     "response": fenced(dumps({"experiences": STARS * 10})), "expected": star_expected(STARS)},
+    {"name": "star_truncated", "kind": "star",
+     "response": fenced(truncate(dumps({"experiences": STARS}), 0.8)), "expected": star_expected(STARS)},
+    {"name": "star_text_blocks", "kind": "star",
+     "response": star_text_blocks(STARS), "expected": star_expected(STARS)},
+
+    # 추천 경험 ID
+    {"name": "ids_object", "kind": "ids",
+     "response": '{"ids": [12, 3, 7]}', "expected": [12, 3, 7]},
+    {"name": "ids_fenced_legacy_dicts", "kind": "ids",
+     "response": fenced(dumps([{"STARExperienceID": 12}, {"STARExperienceID": "3"}])), "expected": [12, 3]},
+    {"name": "ids_bare_list", "kind": "ids",
+     "response": "[12, 3]", "expected": [12, 3]},
+    {"name": "ids_truncated", "kind": "ids",
+     "response": '```json\n{"ids": [12, 3, 7', "expected": [12, 3, 7]},
+]
@@ -3,6 +3,11 @@ ASGI config for jssgpt_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Streaming endpoints (e.g. api/cover-letter/stream-draft/) must be served through
+this application with an ASGI server such as uvicorn or daphne:
+
+    uvicorn jssgpt_project.asgi:application
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
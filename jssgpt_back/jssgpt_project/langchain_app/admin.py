@@ -5,12 +5,21 @@ from django.shortcuts import render, redirect
 import datetime
 from .models import Company, Recruitment, RecruitJob, CoverLetterPrompt
 from .tasks import crawl_recruitments_task  # 새로 만든 Celery 태스크
-from .models import CoverLetterGuide
+from .models import CoverLetterGuide, EnrichmentLease
 
 # 크롤링 폼 정의 (기업명 필드 추가 - 여러 개는 쉼표로 구분)
 class CrawlForm(forms.Form):
-    date = forms.DateField(label="크롤링할 날짜", widget=forms.SelectDateWidget)
+    date = forms.DateField(label="크롤링할 날짜 (기간 크롤링 시 시작일)", widget=forms.SelectDateWidget)
+    end_date = forms.DateField(label="종료일 (선택, 입력 시 기간 전체를 한 번에 크롤링)", widget=forms.SelectDateWidget, required=False)
     company_name = forms.CharField(label="기업명 (선택, 여러 개는 쉼표로 구분)", required=False)
+    refresh_changed = forms.BooleanField(label="이미 저장된 공고도 캘린더 정보가 바뀌었으면 다시 크롤링", required=False)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date, end_date = cleaned_data.get("date"), cleaned_data.get("end_date")
+        if date and end_date and end_date < date:
+            raise forms.ValidationError("종료일은 시작일 이후여야 합니다.")
+        return cleaned_data
 
 # RecruitmentAdmin에 커스텀 URL을 추가하여 크롤링 뷰를 제공
 class RecruitmentAdmin(admin.ModelAdmin):
@@ -29,16 +38,21 @@ class RecruitmentAdmin(admin.ModelAdmin):
             if form.is_valid():
                 date = form.cleaned_data["date"]
                 target_date_str = date.strftime("%Y%m%d")
+                end_date = form.cleaned_data.get("end_date")
+                end_date_str = end_date.strftime("%Y%m%d") if end_date else None
                 company_names_str = form.cleaned_data.get("company_name")
                 if company_names_str:
                     company_names = [name.strip() for name in company_names_str.split(",") if name.strip()]
                 else:
                     company_names = None
                 # Celery 태스크에 날짜와 기업명 리스트 함께 전달
-                crawl_recruitments_task.delay(target_date_str, company_names)
+                crawl_recruitments_task.delay(
+                    target_date_str, company_names, form.cleaned_data.get("refresh_changed", False), end_date_str
+                )
+                period = f"{target_date_str}~{end_date_str}" if end_date_str else target_date_str
                 self.message_user(
                     request, 
-                    f"{target_date_str}의 크롤링 작업이 큐에 등록되었습니다. (기업: {company_names_str or '전체'})", 
+                    f"{period}의 크롤링 작업이 큐에 등록되었습니다. (기업: {company_names_str or '전체'})", 
                     level=messages.INFO
                 )
                 return redirect("..")
@@ -70,6 +84,11 @@ class CoverLetterGuideAdmin(admin.ModelAdmin):
     list_display = ('title', 'created_at', 'updated_at')
     search_fields = ('title', 'content')
 
+@admin.register(EnrichmentLease)
+class EnrichmentLeaseAdmin(admin.ModelAdmin):
+    list_display = ('task_type', 'object_id', 'expires_at', 'created_at')
+    list_filter = ('task_type',)
+
 admin.site.register(Company)
 admin.site.register(RecruitJob, RecruitJobAdmin)
 admin.site.register(Recruitment, RecruitmentAdmin)
@@ -1,13 +1,40 @@
 import sys
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright
 
 logging.basicConfig(stream=sys.stderr, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 디테일 페이지를 동시에 열어둘 최대 탭 수
+DETAIL_CONCURRENCY = int(os.getenv("CRAWLER_DETAIL_CONCURRENCY", 4))
+# true이면 DOM 대신 페이지가 XHR로 받아오는 JSON 응답에서 데이터를 추출 (실패 시 DOM 방식으로 대체)
+USE_API_CAPTURE = os.getenv("CRAWLER_USE_API", "false").lower() == "true"
+
+# 캘린더 페이지가 달을 이동할 때마다 호출하는 채용 공고 목록 API
+# 응답: {"employment": [{"id", "name"(기업명), "title", "start_time", "end_time", "employments": [직무...]}, ...]}
+CALENDAR_API_PATH = "/employment/calendar_list.json"
+CALENDAR_LIST_KEY = "employment"
+CALENDAR_REQUIRED_KEYS = ("id", "name", "start_time")
+# "2025-03-16T14:59", "2025.03.16", "2025년 3월 16일 14:59" 형태의 날짜
+DATE_RE = re.compile(r"(\d{4})\D{1,3}(\d{1,2})\D{1,3}(\d{1,2})")
+
+# 자소설닷컴 디테일 JSON 응답의 키 이름 후보 (API 버전에 따라 snake_case/camelCase가 섞여 있음)
+# 디테일 응답에서는 이미 알고 있는 employment_id와 값이 같은 항목만 찾으므로 id 키도 후보에 둠
+DETAIL_ID_KEYS = ("employment_id", "employmentId", "id")
+END_TIME_KEYS = ("end_time", "endTime", "end_date", "endDate")
+JOB_LIST_KEYS = ("employments", "jobs", "recruits", "employment_jobs")
+JOB_TYPE_KEYS = ("division", "recruit_type", "recruitType", "type", "career_type")
+JOB_TITLE_KEYS = ("field", "title", "name", "job_title")
+QUESTION_LIST_KEYS = ("questions", "resume_questions", "resumeQuestions", "essay_questions")
+QUESTION_TEXT_KEYS = ("question", "title", "content")
+QUESTION_LIMIT_KEYS = ("max_length", "maxLength", "limit", "length")
+
 async def ensure_logged_in(playwright):
     if os.path.exists("state.json"):
         logger.info("이미 로그인 상태가 저장되어 있습니다.")
@@ -168,7 +195,479 @@ async def extract_modal_data(page, calendar_item):
         await page.screenshot(path="error_screenshot_modal_fail.png")
         return []
 
-async def integrated_crawler(target_date, filter_company=None):
+def first_value(data, keys):
+    """
+    dict에서 keys 순서대로 처음으로 값이 있는 항목을 반환합니다.
+    """
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+def compact_date(value):
+    """
+    "2025-03-01T10:00:00+09:00", "20250301", "2025년 3월 1일 14:59" 등을 YYYYMMDD 문자열로 바꿉니다.
+    """
+    if not value:
+        return None
+    text = str(value).strip()
+    if text[:8].isdigit():
+        return text[:8]
+    match = DATE_RE.search(text)
+    return f"{match[1]}{int(match[2]):02d}{int(match[3]):02d}" if match else None
+
+def iter_json_dicts(payload):
+    """
+    JSON 응답 안의 모든 dict를 깊이 우선으로 순회합니다. (디테일 응답에서 employment_id 항목을 찾을 때 사용)
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+def is_calendar_response(url):
+    return urlparse(url).path.endswith(CALENDAR_API_PATH)
+
+def calendar_entries(payload):
+    """
+    캘린더 API 응답의 채용 공고 목록을 반환합니다.
+    응답 구조가 예상과 다르면(목록이 없거나 필수 키가 빠진 항목이 있으면) None을 반환하여 DOM 방식으로 대체하게 합니다.
+    """
+    entries = payload.get(CALENDAR_LIST_KEY) if isinstance(payload, dict) else None
+    if not isinstance(entries, list):
+        return None
+    for entry in entries:
+        if not isinstance(entry, dict) or any(entry.get(key) in (None, "") for key in CALENDAR_REQUIRED_KEYS):
+            return None
+    return entries
+
+def companies_from_calendar_json(responses, start_date, end_date):
+    """
+    캘린더 API(CALENDAR_API_PATH) 응답에서 start_date~end_date(YYYYMMDD)에 시작하는 채용 공고를
+    collect_calendar_companies()와 같은 형태의 기업 dict 목록으로 만듭니다.
+    responses는 JsonResponseCollector.drain()이 반환한 (url, payload) 목록이며, 다른 API의 응답은 무시합니다.
+    """
+    companies = {}
+    for url, payload in responses:
+        if not is_calendar_response(url):
+            continue
+        entries = calendar_entries(payload)
+        if entries is None:
+            logger.warning("캘린더 JSON 구조가 예상과 다릅니다: %s", url)
+            continue
+        for entry in entries:
+            start = compact_date(entry["start_time"])
+            if not start or not start_date <= start <= end_date:
+                continue
+            employment_id = str(entry["id"])
+            if employment_id in companies:
+                continue
+            company_name = str(entry["name"]).strip()
+            title = entry.get("title")
+            companies[employment_id] = {
+                "start_date": start,
+                "end_date": entry.get("end_time"),
+                "employment_id": employment_id,
+                "link": f"https://jasoseol.com/recruit/{employment_id}",
+                "company_name": company_name,
+                "recruitment_title": title if title and title != company_name else f"{company_name} 채용 공고",
+                "jobs": []
+            }
+    return list(companies.values())
+
+def jobs_from_detail_json(responses, employment_id):
+    """
+    디테일 페이지 API 응답(JSON)에서 직무와 자기소개서 문항을 추출합니다.
+    crawl_detail_page()가 만드는 jobs 목록과 같은 형태를 반환하며, 찾지 못하면 빈 목록을 반환합니다.
+    """
+    for _, payload in responses:
+        for entry in iter_json_dicts(payload):
+            if str(first_value(entry, DETAIL_ID_KEYS)) != str(employment_id):
+                continue
+            raw_jobs = first_value(entry, JOB_LIST_KEYS)
+            if not isinstance(raw_jobs, list):
+                continue
+            jobs = []
+            for raw_job in raw_jobs:
+                if not isinstance(raw_job, dict):
+                    continue
+                essay_questions = []
+                for raw_question in first_value(raw_job, QUESTION_LIST_KEYS) or []:
+                    if not isinstance(raw_question, dict):
+                        continue
+                    question = first_value(raw_question, QUESTION_TEXT_KEYS)
+                    if not question:
+                        continue
+                    limit = first_value(raw_question, QUESTION_LIMIT_KEYS)
+                    essay_questions.append({
+                        "question": str(question).strip(),
+                        # DOM 방식과 같은 "(700자)" 형태로 맞춤
+                        "limit": f"({limit}자)" if limit else None
+                    })
+                jobs.append({
+                    "recruitment_type": first_value(raw_job, JOB_TYPE_KEYS),
+                    "recruitment_title": first_value(raw_job, JOB_TITLE_KEYS),
+                    "essay_questions": essay_questions
+                })
+            if jobs:
+                return entry, jobs
+    return None, []
+
+class JsonResponseCollector:
+    """
+    page.on("response")로 페이지가 받아오는 JSON 응답을 모아둡니다.
+    """
+
+    def __init__(self, page):
+        self.responses = []
+        self._pending = set()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response):
+        try:
+            self.responses.append((response.url, await response.json()))
+        except Exception as e:
+            logger.info("JSON 응답 파싱 실패: %s - %s", response.url, e)
+
+    async def drain(self):
+        """
+        아직 읽는 중인 응답 본문을 모두 기다린 뒤, 지금까지 모은 (url, payload) 목록을 반환하고 비웁니다.
+        """
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        responses, self.responses = self.responses, []
+        return responses
+
+async def crawl_detail_api(context, company):
+    """
+    디테일 페이지를 열고 페이지가 받아오는 JSON 응답에서 직무/자기소개서 문항을 채웁니다.
+    JSON에서 직무를 찾지 못하면 기존 DOM 방식(crawl_detail_page)으로 대체합니다.
+    """
+    detail_page = None
+    try:
+        detail_page = await context.new_page()
+        collector = JsonResponseCollector(detail_page)
+        await detail_page.route("**/*", block_heavy_resources)
+        await detail_page.goto(company["link"], wait_until="networkidle")
+        entry, jobs = jobs_from_detail_json(await collector.drain(), company["employment_id"])
+    except Exception as e:
+        logger.info("디테일 JSON 수집 오류: %s - %s", company['link'], e)
+        entry, jobs = None, []
+    finally:
+        if detail_page and not detail_page.is_closed():
+            await detail_page.close()
+
+    if not jobs:
+        logger.info("디테일 JSON에서 직무를 찾지 못해 DOM 방식으로 크롤링: %s", company['company_name'])
+        return await crawl_detail_page(context, company)
+
+    company["end_date"] = first_value(entry, END_TIME_KEYS) or company.get("end_date")
+    company["recruitment_link"] = first_value(entry, ("recruitment_link", "homepage", "url", "link"))
+    company["jobs"] = jobs
+    logger.info("디테일 JSON 수집 완료: %s (직무 %s개)", company['company_name'], len(jobs))
+    return company
+
+def block_heavy_resources(route):
+    if route.request.resource_type in ["image", "media", "font"]:
+        return route.abort()
+    return route.continue_()
+
+def filter_companies(companies, filter_company):
+    if isinstance(filter_company, list):
+        return [
+            company for company in companies
+            if any(name.lower() in company.get("company_name", "").lower() for name in filter_company)
+        ]
+    return [
+        company for company in companies
+        if filter_company.lower() in company.get("company_name", "").lower()
+    ]
+
+async def collect_calendar_companies(page, calendar_items, filter_company=None):
+    """
+    캘린더 아이템들에서 기업 목록(디테일 크롤링 전)을 추출합니다.
+    모달 처리 등 메인 페이지와 상호작용이 필요하므로 순차적으로 수행합니다.
+    """
+    companies = []
+    for idx, item in enumerate(calendar_items):
+        companies_from_item = []
+        company_links = await item.query_selector_all("a.company")
+        for comp in company_links:
+            label_elem = await comp.query_selector("div.calendar-label.start")
+            if label_elem:
+                label_text = (await label_elem.inner_text()).strip()
+                if label_text == "시":
+                    href = await comp.get_attribute("href")
+                    company_elem = await comp.query_selector("div.company-name span")
+                    company_name = await company_elem.inner_text() if company_elem else "N/A"
+                    start_date = await item.get_attribute("day")
+                    employment_id = await item.get_attribute("employment_id")
+                    recruitment_title = f"{company_name} 채용 공고"
+                    companies_from_item.append({
+                        "start_date": start_date,
+                        "end_date": None,
+                        "employment_id": employment_id,
+                        "link": "https://jasoseol.com" + href if href and href.startswith("/") else href,
+                        "company_name": company_name,
+                        "recruitment_title": recruitment_title,
+                        "jobs": []
+                    })
+        if not companies_from_item:
+            logger.info("캘린더 아이템 #%s: a.company 방식으로 기업을 찾지 못함. 모달 방식으로 처리", idx+1)
+            companies_from_item = await extract_modal_data(page, item)
+            logger.info("캘린더 아이템 #%s: 모달 방식으로 탐지된 기업 수 = %s", idx+1, len(companies_from_item))
+        if filter_company:
+            companies_from_item = filter_companies(companies_from_item, filter_company)
+            if not companies_from_item:
+                logger.info("캘린더 아이템 #%s에서 주어진 기업 목록에 해당하는 기업을 찾지 못함", idx+1)
+                continue
+        companies.extend(companies_from_item)
+    return companies
+
+async def collect_calendar_end_dates(page):
+    """
+    현재 캘린더 화면의 마감("끝") 라벨에서 {공고 링크: 마감일(YYYYMMDD)}을 수집합니다.
+    DOM 방식은 캘린더에서 마감일을 알 수 있어야 지문으로 마감 연장을 감지할 수 있습니다.
+    """
+    end_dates = {}
+    for item in await page.query_selector_all("div.calendar-item[day]"):
+        day = await item.get_attribute("day")
+        for comp in await item.query_selector_all("a.company"):
+            label_elem = await comp.query_selector("div.calendar-label.end")
+            if label_elem and (await label_elem.inner_text()).strip() == "끝":
+                href = await comp.get_attribute("href")
+                if href:
+                    end_dates["https://jasoseol.com" + href if href.startswith("/") else href] = day
+    return end_dates
+
+def calendar_fingerprint(company):
+    """
+    캘린더 항목(디테일 크롤링 전 정보)으로 만든 가벼운 지문입니다.
+    이전 크롤링 때와 지문이 같으면 디테일 페이지 내용도 바뀌지 않았다고 간주합니다.
+    API/DOM 방식이 같은 값으로 추출하는 항목(시작일, 마감일, 기업명, 공고 링크 경로)만 사용하므로
+    크롤링 방식을 바꿔도 지문이 같고, 마감 연장도 변경으로 감지합니다.
+    DOM 방식이 만들어 붙이는 공고 제목("... 채용 공고")은 포함하지 않습니다.
+    """
+    raw = "|".join([
+        compact_date(company.get("start_date")) or "",
+        compact_date(company.get("end_date")) or "",
+        (company.get("company_name") or "").strip(),
+        urlparse(company.get("link") or "").path.rstrip("/"),
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def skip_known_companies(companies, known_recruitments, refresh_changed=False):
+    """
+    이미 저장된 employment_id의 기업은 디테일 크롤링 대상에서 제외합니다.
+    refresh_changed가 True이면 저장된 지문과 캘린더 지문이 다른 기업은 다시 크롤링합니다.
+    """
+    remaining = []
+    for company in companies:
+        employment_id = company.get("employment_id")
+        if employment_id and employment_id in known_recruitments:
+            if not refresh_changed or known_recruitments[employment_id] == company["fingerprint"]:
+                logger.info("이미 저장된 채용 공고 건너뜀: %s (%s)", company["company_name"], employment_id)
+                continue
+            logger.info("변경된 채용 공고 재크롤링: %s (%s)", company["company_name"], employment_id)
+        remaining.append(company)
+    return remaining
+
+async def crawl_detail_page(context, company):
+    """
+    기업 디테일 페이지를 새 탭에서 열어 종료일, 채용 사이트 링크, 직무 및 자기소개서 문항을 채웁니다.
+    실패 시 None을 반환합니다.
+    """
+    logger.info("디테일 크롤링 시작: %s - %s", company['company_name'], company['link'])
+    detail_page = None
+    try:
+        detail_page = await context.new_page()
+        try:
+            await detail_page.route("**/*", block_heavy_resources)
+            await detail_page.goto(company["link"])
+            try:
+                await detail_page.click("div.popup-close, div[data-sentry-component='PopupAdvertise'] button", timeout=5000)
+                logger.info("디테일 페이지 팝업 닫기 완료")
+            except Exception as e:
+                logger.info("디테일 페이지 팝업 없음 또는 닫기 실패: %s", e)
+            try:
+                await detail_page.evaluate("""() => {
+                    const popup = document.querySelector("div[data-sentry-component='PopupAdvertise']");
+                    if (popup) { popup.remove(); }
+                }""")
+                logger.info("디테일 페이지 광고 배너 강제 제거 완료")
+            except Exception as e:
+                logger.info("광고 배너 강제 제거 실패: %s", e)
+        except Exception as e:
+            logger.info("디테일 페이지 접속 오류: %s - %s", company['link'], e)
+            await detail_page.close()
+            return None
+
+        try:
+            selector_end_date = r"div.flex.gap-\[4px\].mb-\[20px\].body5"
+            await detail_page.wait_for_selector(selector_end_date, timeout=15000)
+            date_div = await detail_page.query_selector(selector_end_date)
+            spans = await date_div.query_selector_all("span")
+            end_date = (await spans[2].inner_text()).strip() if len(spans) >= 4 else None
+        except Exception as e:
+            logger.info("종료일 크롤링 오류: %s - %s", company['link'], e)
+            end_date = None
+        company["end_date"] = end_date or company.get("end_date")
+
+        try:
+            link_elem = await detail_page.query_selector("a.flex-grow:has(button:has-text('채용 사이트'))")
+            recruitment_link = await link_elem.get_attribute("href") if link_elem else None
+        except Exception as e:
+            logger.info("채용 사이트 링크 크롤링 오류: %s - %s", company['link'], e)
+            recruitment_link = None
+        company["recruitment_link"] = recruitment_link
+
+        try:
+            await detail_page.wait_for_selector("ul.shadow2", timeout=5000)
+            container = await detail_page.query_selector("ul.shadow2")
+            job_elements = await container.query_selector_all("li.flex.justify-center")
+        except Exception as e:
+            logger.info("ul.shadow2 not found, fallback to li.flex.justify-center: %s", e)
+            job_elements = await detail_page.query_selector_all("li.flex.justify-center")
+
+        jobs = []
+        for idx, li_elem in enumerate(job_elements):
+            recruitment_type = recruitment_title = None
+            try:
+                spans = await li_elem.query_selector_all("span")
+                if len(spans) >= 2:
+                    recruitment_type = (await spans[0].inner_text()).strip()
+                    recruitment_title = (await spans[1].inner_text()).strip()
+            except Exception as e:
+                logger.info("Error extracting job type/title for job #%s: %s", idx+1, e)
+
+            essay_questions = []
+            try:
+                button = await li_elem.query_selector("button:has-text('자기소개서 쓰기')")
+                if button:
+                    await button.click()
+                    essay_blocks = await li_elem.query_selector_all("div.font-normal.mb-\\[8px\\]")
+                    visible_blocks = [block for block in essay_blocks if await block.is_visible()]
+                    if visible_blocks:
+                        for block in visible_blocks:
+                            q_elem = await block.query_selector("div.text-\\[14px\\]")
+                            l_elem = await block.query_selector("div.text-\\[10px\\]")
+                            if q_elem and l_elem:
+                                q_text = (await q_elem.inner_text()).strip()
+                                l_text = (await l_elem.inner_text()).strip()
+                                essay_questions.append({
+                                    "question": q_text,
+                                    "limit": l_text
+                                })
+                    else:
+                        logger.info("No visible essay section found for job #%s", idx+1)
+                else:
+                    logger.info("Job #%s: '자기소개서 쓰기' button not found.", idx+1)
+            except Exception as e:
+                logger.info("Error extracting essay questions for job #%s: %s", idx+1, e)
+
+            jobs.append({
+                "recruitment_type": recruitment_type,
+                "recruitment_title": recruitment_title,
+                "essay_questions": essay_questions
+            })
+        company["jobs"] = jobs
+        logger.info("디테일 크롤링 완료: %s", company['company_name'])
+        await detail_page.close()
+        return company
+    except Exception as e:
+        logger.info("디테일 페이지 처리 중 예외 발생: %s", e)
+        if detail_page and not detail_page.is_closed():
+            await detail_page.close()
+        return None
+
+async def crawl_details_concurrently(context, companies, detail_concurrency=DETAIL_CONCURRENCY, use_api=False):
+    """
+    하나의 브라우저 컨텍스트를 공유하는 디테일 페이지들을 최대 detail_concurrency개까지 동시에 크롤링하고,
+    끝나는 순서대로 기업 데이터를 yield 합니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, detail_concurrency))
+    crawl_detail = crawl_detail_api if use_api else crawl_detail_page
+
+    async def _crawl(company):
+        async with semaphore:
+            return await crawl_detail(context, company)
+
+    tasks = [asyncio.create_task(_crawl(company)) for company in companies]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            company = await finished
+            if company:
+                yield company
+    finally:
+        # 소비자가 중간에 중단한 경우 남은 디테일 크롤링 취소
+        for task in tasks:
+            task.cancel()
+
+def month_range(start_date, end_date):
+    """
+    YYYYMMDD 형식의 시작일~종료일이 걸쳐 있는 달을 YYYYMM 문자열로 순서대로 반환합니다.
+    """
+    year, month = int(start_date[:4]), int(start_date[4:6])
+    end_year, end_month = int(end_date[:4]), int(end_date[4:6])
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+async def current_calendar_month(page):
+    """
+    현재 캘린더에 표시된 달(YYYYMM)을 반환합니다. 앞뒤 달의 날짜가 섞여 있으므로 가운데 날짜를 기준으로 합니다.
+    """
+    days = [
+        await item.get_attribute("day")
+        for item in await page.query_selector_all("div.calendar-item[day]")
+    ]
+    days = sorted(day for day in days if day)
+    return days[len(days) // 2][:6] if days else None
+
+async def navigate_to_month(page, year_month, max_attempts=12):
+    """
+    캘린더를 year_month(YYYYMM) 달로 이동합니다. 해당 달의 15일이 보이면 이동 완료로 간주합니다.
+    """
+    anchor = f"div.calendar-item[day='{year_month}15']"
+    attempts = 0
+    while not await page.query_selector(anchor) and attempts < max_attempts:
+        current = await current_calendar_month(page)
+        step = -1 if current and current > year_month else 1
+        logger.info("캘린더에 %s가 없습니다. %s 이동합니다. (시도 %s)", year_month, "이전 달로" if step < 0 else "다음 달로", attempts + 1)
+        month_button = await page.query_selector(f'[ng-click="addMonth({step})"]')
+        if not month_button:
+            logger.info("달 이동 버튼을 찾을 수 없습니다.")
+            break
+        await month_button.click()
+        await page.wait_for_timeout(1000)
+        attempts += 1
+    return await page.query_selector(anchor) is not None
+
+async def integrated_range_crawler(start_date, end_date, filter_company=None, detail_concurrency=DETAIL_CONCURRENCY,
+                                   known_recruitments=None, refresh_changed=False, use_api=USE_API_CAPTURE):
+    """
+    start_date~end_date(YYYYMMDD) 사이의 채용 공고를 하나의 브라우저 세션으로 크롤링하여 기업 단위로 yield 합니다.
+    달마다 캘린더를 한 번만 이동하고, 그 달에서 범위에 속하는 모든 날짜의 캘린더 아이템을 한 번에 수집합니다.
+    known_recruitments({employment_id: fingerprint})에 있는 공고는 디테일 크롤링을 건너뜁니다.
+    use_api가 True이면 캘린더/디테일 페이지가 받아오는 JSON 응답에서 데이터를 만들고,
+    JSON에서 찾지 못한 달/기업만 DOM 방식으로 크롤링합니다.
+    """
     async with async_playwright() as p:
         await ensure_logged_in(p)
         browser = await p.chromium.launch(
@@ -180,179 +679,80 @@ async def integrated_crawler(target_date, filter_company=None):
             viewport={"width": 800, "height": 600}
         )
         page = await context.new_page()
-        await page.route("**/*", lambda route: route.abort() if route.request.resource_type in ["image", "media", "font"] else route.continue_())
+        collector = JsonResponseCollector(page) if use_api else None
+        await page.route("**/*", block_heavy_resources)
         await page.goto("https://jasoseol.com/recruit")
         try:
             await page.click("div.popup-close, div[data-sentry-component='PopupAdvertise'] button", timeout=5000)
             logger.info("메인 페이지 팝업 닫기 완료")
         except Exception as e:
             logger.info("메인 페이지 팝업 없음 또는 닫기 실패: %s", e)
-        logger.info("선택한 날짜: %s", target_date)
-        calendar_items = await page.query_selector_all(f"div.calendar-item[day='{target_date}']")
-        max_attempts = 12
-        attempts = 0
-        while not calendar_items and attempts < max_attempts:
-            logger.info("캘린더에 %s가 없습니다. 다음 달로 이동합니다. (시도 %s)", target_date, attempts + 1)
-            next_button = await page.query_selector('[ng-click="addMonth(1)"]')
-            if not next_button:
-                logger.info("다음 달 버튼을 찾을 수 없습니다.")
-                break
-            await next_button.click()
-            await page.wait_for_timeout(1000)
-            calendar_items = await page.query_selector_all(f"div.calendar-item[day='{target_date}']")
-            attempts += 1
-
-        if not calendar_items:
-            logger.info("%s에 해당하는 캘린더 아이템을 찾을 수 없습니다.", target_date)
-            await browser.close()
-            return
+        logger.info("선택한 기간: %s ~ %s", start_date, end_date)
 
-        for idx, item in enumerate(calendar_items):
-            companies_from_item = []
-            company_links = await item.query_selector_all("a.company")
-            for comp in company_links:
-                label_elem = await comp.query_selector("div.calendar-label.start")
-                if label_elem:
-                    label_text = (await label_elem.inner_text()).strip()
-                    if label_text == "시":
-                        href = await comp.get_attribute("href")
-                        company_elem = await comp.query_selector("div.company-name span")
-                        company_name = await company_elem.inner_text() if company_elem else "N/A"
-                        start_date = await item.get_attribute("day")
-                        employment_id = await item.get_attribute("employment_id")
-                        recruitment_title = f"{company_name} 채용 공고"
-                        companies_from_item.append({
-                            "start_date": start_date,
-                            "end_date": None,
-                            "employment_id": employment_id,
-                            "link": "https://jasoseol.com" + href if href and href.startswith("/") else href,
-                            "company_name": company_name,
-                            "recruitment_title": recruitment_title,
-                            "jobs": []
-                        })
-            if not companies_from_item:
-                logger.info("캘린더 아이템 #%s: a.company 방식으로 기업을 찾지 못함. 모달 방식으로 처리", idx+1)
-                companies_from_item = await extract_modal_data(page, item)
-                logger.info("캘린더 아이템 #%s: 모달 방식으로 탐지된 기업 수 = %s", idx+1, len(companies_from_item))
-            if filter_company:
-                if isinstance(filter_company, list):
-                    companies_from_item = [
-                        company for company in companies_from_item 
-                        if any(name.lower() in company.get("company_name", "").lower() for name in filter_company)
-                    ]
-                else:
-                    companies_from_item = [
-                        company for company in companies_from_item 
-                        if filter_company.lower() in company.get("company_name", "").lower()
-                    ]
-                if not companies_from_item:
-                    logger.info("캘린더 아이템 #%s에서 주어진 기업 목록에 해당하는 기업을 찾지 못함", idx+1)
+        companies = []
+        seen_days = set()
+        end_dates = {}
+        for year_month in month_range(start_date, end_date):
+            if not await navigate_to_month(page, year_month):
+                logger.info("%s 달로 이동하지 못했습니다.", year_month)
+                continue
+            if collector:
+                await page.wait_for_load_state("networkidle")
+                month_start = max(start_date, f"{year_month}01")
+                month_end = min(end_date, f"{year_month}31")
+                api_companies = [
+                    company
+                    for company in companies_from_calendar_json(await collector.drain(), month_start, month_end)
+                    if company["start_date"] not in seen_days
+                ]
+                if filter_company:
+                    api_companies = filter_companies(api_companies, filter_company)
+                if api_companies:
+                    seen_days |= {company["start_date"] for company in api_companies}
+                    logger.info("%s: 캘린더 JSON에서 탐지된 기업 수 = %s", year_month, len(api_companies))
+                    companies.extend(api_companies)
                     continue
-            for company in companies_from_item:
-                logger.info("디테일 크롤링 시작: %s - %s", company['company_name'], company['link'])
-                try:
-                    detail_page = await context.new_page()
-                    try:
-                        await detail_page.route("**/*", lambda route: route.abort() if route.request.resource_type in ["image", "media", "font"] else route.continue_())
-                        await detail_page.goto(company["link"])
-                        try:
-                            await detail_page.click("div.popup-close, div[data-sentry-component='PopupAdvertise'] button", timeout=5000)
-                            logger.info("디테일 페이지 팝업 닫기 완료")
-                        except Exception as e:
-                            logger.info("디테일 페이지 팝업 없음 또는 닫기 실패: %s", e)
-                        try:
-                            await detail_page.evaluate("""() => {
-                                const popup = document.querySelector("div[data-sentry-component='PopupAdvertise']");
-                                if (popup) { popup.remove(); }
-                            }""")
-                            logger.info("디테일 페이지 광고 배너 강제 제거 완료")
-                        except Exception as e:
-                            logger.info("광고 배너 강제 제거 실패: %s", e)
-                    except Exception as e:
-                        logger.info("디테일 페이지 접속 오류: %s - %s", company['link'], e)
-                        await detail_page.close()
-                        continue
+                logger.info("%s: 캘린더 JSON에서 기업을 찾지 못해 DOM 방식으로 수집합니다.", year_month)
+            # 앞뒤 달 날짜도 함께 보이므로, 이미 처리한 날짜는 제외
+            calendar_items = []
+            month_days = set()
+            for item in await page.query_selector_all("div.calendar-item[day]"):
+                day = await item.get_attribute("day")
+                if day and start_date <= day <= end_date and day not in seen_days:
+                    calendar_items.append(item)
+                    month_days.add(day)
+            seen_days |= month_days
+            end_dates.update(await collect_calendar_end_dates(page))
+            logger.info("%s: 범위 내 캘린더 아이템 수 = %s", year_month, len(calendar_items))
+            companies.extend(await collect_calendar_companies(page, calendar_items, filter_company))
 
-                    try:
-                        selector_end_date = r"div.flex.gap-\[4px\].mb-\[20px\].body5"
-                        await detail_page.wait_for_selector(selector_end_date, timeout=15000)
-                        date_div = await detail_page.query_selector(selector_end_date)
-                        spans = await date_div.query_selector_all("span")
-                        end_date = (await spans[2].inner_text()).strip() if len(spans) >= 4 else None
-                    except Exception as e:
-                        logger.info("종료일 크롤링 오류: %s - %s", company['link'], e)
-                        end_date = None
-                    company["end_date"] = end_date
-
-                    try:
-                        link_elem = await detail_page.query_selector("a.flex-grow:has(button:has-text('채용 사이트'))")
-                        recruitment_link = await link_elem.get_attribute("href") if link_elem else None
-                    except Exception as e:
-                        logger.info("채용 사이트 링크 크롤링 오류: %s - %s", company['link'], e)
-                        recruitment_link = None
-                    company["recruitment_link"] = recruitment_link
-
-                    try:
-                        await detail_page.wait_for_selector("ul.shadow2", timeout=5000)
-                        container = await detail_page.query_selector("ul.shadow2")
-                        job_elements = await container.query_selector_all("li.flex.justify-center")
-                    except Exception as e:
-                        logger.info("ul.shadow2 not found, fallback to li.flex.justify-center: %s", e)
-                        job_elements = await detail_page.query_selector_all("li.flex.justify-center")
-
-                    jobs = []
-                    for idx, li_elem in enumerate(job_elements):
-                        recruitment_type = recruitment_title = None
-                        try:
-                            spans = await li_elem.query_selector_all("span")
-                            if len(spans) >= 2:
-                                recruitment_type = (await spans[0].inner_text()).strip()
-                                recruitment_title = (await spans[1].inner_text()).strip()
-                        except Exception as e:
-                            logger.info("Error extracting job type/title for job #%s: %s", idx+1, e)
-
-                        essay_questions = []
-                        try:
-                            button = await li_elem.query_selector("button:has-text('자기소개서 쓰기')")
-                            if button:
-                                await button.click()
-                                essay_blocks = await li_elem.query_selector_all("div.font-normal.mb-\\[8px\\]")
-                                visible_blocks = [block for block in essay_blocks if await block.is_visible()]
-                                if visible_blocks:
-                                    for block in visible_blocks:
-                                        q_elem = await block.query_selector("div.text-\\[14px\\]")
-                                        l_elem = await block.query_selector("div.text-\\[10px\\]")
-                                        if q_elem and l_elem:
-                                            q_text = (await q_elem.inner_text()).strip()
-                                            l_text = (await l_elem.inner_text()).strip()
-                                            essay_questions.append({
-                                                "question": q_text,
-                                                "limit": l_text
-                                            })
-                                else:
-                                    logger.info("No visible essay section found for job #%s", idx+1)
-                            else:
-                                logger.info("Job #%s: '자기소개서 쓰기' button not found.", idx+1)
-                        except Exception as e:
-                            logger.info("Error extracting essay questions for job #%s: %s", idx+1, e)
-
-                        jobs.append({
-                            "recruitment_type": recruitment_type,
-                            "recruitment_title": recruitment_title,
-                            "essay_questions": essay_questions
-                        })
-                    company["jobs"] = jobs
-                    logger.info("디테일 크롤링 완료: %s", company['company_name'])
-                    await detail_page.close()
-                    yield company
-                except Exception as e:
-                    logger.info("디테일 페이지 처리 중 예외 발생: %s", e)
-                    continue
+        if not companies:
+            logger.info("%s ~ %s에 해당하는 기업을 찾을 수 없습니다.", start_date, end_date)
+            await browser.close()
+            return
+
+        for company in companies:
+            # DOM 방식으로 수집한 기업은 캘린더의 마감 라벨로 마감일을 채움 (화면에 보이지 않은 마감일은 알 수 없음)
+            if not company.get("end_date"):
+                company["end_date"] = end_dates.get(company["link"])
+            company["fingerprint"] = calendar_fingerprint(company)
+        if known_recruitments:
+            companies = skip_known_companies(companies, known_recruitments, refresh_changed)
+        logger.info("디테일 크롤링 대상 기업 수: %s (동시 페이지 수: %s)", len(companies), detail_concurrency)
+        async for company in crawl_details_concurrently(context, companies, detail_concurrency, use_api):
+            yield company
 
         await browser.close()
-        
-async def main(target_date, filter_company=None):
-    async for company in integrated_crawler(target_date, filter_company):
+
+async def integrated_crawler(target_date, filter_company=None, **kwargs):
+    """
+    target_date(YYYYMMDD) 하루의 채용 공고를 크롤링하여 기업 단위로 yield 합니다.
+    """
+    async for company in integrated_range_crawler(target_date, target_date, filter_company, **kwargs):
+        yield company
+
+async def main(target_date, filter_company=None, end_date=None, **kwargs):
+    async for company in integrated_range_crawler(target_date, end_date or target_date, filter_company, **kwargs):
         yield company
 
 if __name__ == "__main__":
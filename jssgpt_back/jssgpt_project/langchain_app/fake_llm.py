@@ -0,0 +1,113 @@
+# langchain_app/fake_llm.py
+import asyncio
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+from django.conf import settings
+
+
+class FakeLLMError(RuntimeError):
+    """LLM_FAKE_FAILURE_RATE 확률로 발생하는 가짜 API 오류 (429/5xx 대용)"""
+
+
+def company_info_response(prompt):
+    name = prompt.strip().split("에 대해", 1)[0].strip() or "회사"
+    return json.dumps({
+        "산업": f"{name}이 속한 산업은 안정적으로 성장하고 있다.",
+        "회사 비전": f"{name}은 고객에게 새로운 가치를 제공하는 것을 비전으로 한다.",
+        "미션": "기술과 사람을 연결한다.",
+        "기업 문화와 인재상": "도전과 협업을 중시하며 주도적으로 일하는 인재를 찾는다.",
+        "최근 주요 성과": "신규 서비스 출시와 매출 성장을 달성했다.",
+        "현재 주요 이슈": "시장 경쟁 심화와 비용 효율화가 과제다.",
+    }, ensure_ascii=False)
+
+
+def job_info_response(prompt):
+    return json.dumps({
+        "직무 설명": "서비스를 설계하고 운영하며 품질을 책임진다.",
+        "수행 업무": "요구사항 분석, 기능 개발, 운영 모니터링",
+        "필요한 기술": "Python, SQL, 클라우드 인프라",
+        "관련 소프트 스킬": "의사소통, 문제 해결, 협업",
+        "필요 강점": "꼼꼼함과 빠른 학습 능력",
+    }, ensure_ascii=False)
+
+
+def star_response(prompt):
+    # 프롬프트에 들어온 이력서 청크 문단 수만큼 경험을 만들어 청크 크기에 비례한 응답을 흉내냄
+    text = prompt.split("텍스트:", 1)[-1].split("너의 목표는", 1)[0]
+    lines = [line.strip() for line in text.splitlines() if line.strip()][:5] or ["이력서 경험"]
+    return json.dumps({"experiences": [
+        {
+            "title": line[:30],
+            "situation": f"{line} 상황에서 팀의 목표를 달성해야 했다.",
+            "task": "주어진 과제를 기한 내에 해결해야 했다.",
+            "action": "문제를 분석하고 팀원과 협업하여 개선안을 실행했다.",
+            "result": "목표 대비 20% 이상의 성과를 냈다.",
+        }
+        for line in lines
+    ]}, ensure_ascii=False)
+
+
+def recommendation_response(prompt):
+    section = prompt.split("STAR 형식의 경험 목록", 1)[-1]
+    ids = [int(match) for match in re.findall(r"^\s*(\d+):", section, re.MULTILINE)]
+    return json.dumps({"ids": ids[:3]})
+
+
+def text_response(prompt):
+    return "가짜 LLM 응답입니다. " * 40
+
+
+# (프롬프트에 포함된 문구, 응답 생성 함수). 위에서부터 처음 맞는 항목을 사용
+RESPONSE_TEMPLATES = [
+    ("직무에 대해 조사해줘", job_info_response),
+    ("에 대해 조사해줘", company_info_response),
+    ("STAR 구조로 정리", star_response),
+    ("경험 ID", recommendation_response),
+]
+
+
+class FakeChatModel:
+    """
+    네트워크 없이 프롬프트 종류에 맞는 고정 형식의 응답을 돌려주는 ChatOpenAI 대체 모델입니다. (LLM_BACKEND=fake)
+    - LLM_FAKE_LATENCY_MS(평균) ± LLM_FAKE_LATENCY_JITTER_MS 만큼 지연
+    - LLM_FAKE_FAILURE_RATE 확률로 FakeLLMError 발생
+    부하 테스트(loadtest 명령)와 로컬 개발에서 OpenAI 키 없이 전체 파이프라인을 실행할 때 사용합니다.
+    """
+
+    def __init__(self, model_name, temperature=None):
+        self.model_name = model_name
+        self.temperature = temperature
+
+    def respond(self, text):
+        handler = next((func for marker, func in RESPONSE_TEMPLATES if marker in text), text_response)
+        return handler(text)
+
+    def latency(self):
+        mean = settings.LLM_FAKE_LATENCY_MS
+        jitter = settings.LLM_FAKE_LATENCY_JITTER_MS
+        return max(0.0, random.uniform(mean - jitter, mean + jitter)) / 1000
+
+    def maybe_fail(self):
+        if random.random() < settings.LLM_FAKE_FAILURE_RATE:
+            raise FakeLLMError("Injected fake LLM failure")
+
+    def predict(self, text, **kwargs):
+        time.sleep(self.latency())
+        self.maybe_fail()
+        return self.respond(text)
+
+    async def apredict(self, text, **kwargs):
+        await asyncio.sleep(self.latency())
+        self.maybe_fail()
+        return self.respond(text)
+
+    async def astream(self, text, **kwargs):
+        tokens = self.respond(text).split(" ")
+        delay = self.latency() / max(1, len(tokens))
+        self.maybe_fail()
+        for i, token in enumerate(tokens):
+            await asyncio.sleep(delay)
+            yield SimpleNamespace(content=token if i == 0 else " " + token)
@@ -0,0 +1,144 @@
+# langchain_app/json_stream.py
+import json
+import re
+from typing import Any, NamedTuple
+
+# 응답 앞의 ```json 코드 블록 시작 표시 (JSON은 그 뒤에서 찾음)
+CODE_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s*")
+
+# strict=False: LLM이 문자열 안에 이스케이프하지 않은 줄바꿈을 넣는 경우도 허용
+_decoder = json.JSONDecoder(strict=False)
+
+
+class PartialJSON(NamedTuple):
+    value: Any
+    complete: bool  # False면 응답이 잘렸거나 중간에 JSON이 아닌 내용이 있어 일부만 복구한 결과
+
+
+class _Incomplete(Exception):
+    """복구할 수 없는(잘린) 문자열/숫자 값"""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def find_json_start(text):
+    """
+    응답에서 JSON 값이 시작하는 위치({ 또는 [)를 찾습니다. 코드 블록이 있으면 그 안에서 찾습니다.
+    """
+    fence = CODE_FENCE_RE.search(text)
+    start = fence.end() if fence else 0
+    positions = [pos for pos in (text.find("{", start), text.find("[", start)) if pos != -1]
+    if not positions and fence:
+        positions = [pos for pos in (text.find("{"), text.find("[")) if pos != -1]
+    return min(positions) if positions else -1
+
+
+def _skip_whitespace(text, pos):
+    return WHITESPACE_RE.match(text, pos).end()
+
+
+def _parse_value(text, pos):
+    """
+    (값, 끝 위치, 완전 여부)를 반환합니다.
+    완전한 값은 C 구현 디코더(raw_decode)가 한 번에 읽고, 실패했을 때만 컨테이너 안으로 내려가
+    원소 단위로 다시 읽습니다. 그래서 완전한 응답은 한 번에, 잘린 응답도 잘린 경로만 다시 읽습니다.
+    """
+    try:
+        value, end = _decoder.raw_decode(text, pos)
+    except json.JSONDecodeError:
+        pass
+    else:
+        # 입력 끝에 있는 숫자는 잘렸을 수 있음 ({"a": 12 -> 원래 123일 수 있음)
+        if _is_number(value) and _skip_whitespace(text, end) == len(text):
+            raise _Incomplete(pos)
+        return value, end, True
+    char = text[pos:pos + 1]
+    if char == "{":
+        return _parse_object(text, pos + 1)
+    if char == "[":
+        return _parse_array(text, pos + 1)
+    raise _Incomplete(pos)
+
+
+def _parse_object(text, pos):
+    result = {}
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if text.startswith("}", pos):
+            return result, pos + 1, True
+        try:
+            key, pos = _decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return result, pos, False
+        pos = _skip_whitespace(text, pos)
+        if not isinstance(key, str) or not text.startswith(":", pos):
+            return result, pos, False
+        pos = _skip_whitespace(text, pos + 1)
+        try:
+            value, pos, complete = _parse_value(text, pos)
+        except _Incomplete:
+            return result, pos, False
+        if not complete:
+            # 잘린 컨테이너는 완성된 항목만 남긴 채 유지 ({"experiences": [..잘림] }). 비어 있으면 버림
+            if value:
+                result[key] = value
+            return result, pos, False
+        result[key] = value
+        pos = _skip_whitespace(text, pos)
+        if text.startswith(",", pos):
+            pos += 1  # 뒤따르는 쉼표(trailing comma)도 다음 반복에서 '}'로 처리됨
+        elif text.startswith("}", pos):
+            return result, pos + 1, True
+        else:
+            return result, pos, False
+
+
+def _parse_array(text, pos):
+    result = []
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if text.startswith("]", pos):
+            return result, pos + 1, True
+        try:
+            value, pos, complete = _parse_value(text, pos)
+        except _Incomplete:
+            return result, pos, False
+        if not complete:
+            # 잘린 마지막 원소는 버리고 완성된 원소만 유지 (필드가 빠진 STAR 경험이 저장되지 않도록)
+            return result, pos, False
+        result.append(value)
+        pos = _skip_whitespace(text, pos)
+        if text.startswith(",", pos):
+            pos += 1
+        elif text.startswith("]", pos):
+            return result, pos + 1, True
+        else:
+            return result, pos, False
+
+
+def loads_partial(text):
+    """
+    LLM 응답에서 첫 번째 JSON 값을 읽어 PartialJSON(value, complete)으로 반환합니다.
+    - 코드 블록, 앞뒤 설명 문구, 뒤따르는 쉼표를 허용합니다.
+    - 응답이 잘렸으면 완성된 키/배열 원소만 복구하고 complete=False를 돌려줍니다.
+      잘린 지점의 문자열/숫자 값과 빈 컨테이너, 잘린 배열의 마지막 원소는 버리므로,
+      잘린 STAR 목록은 완성된 경험만 남습니다.
+    JSON 값을 찾지 못하거나 복구한 내용이 없으면 json.JSONDecodeError(ValueError)를 발생시킵니다.
+    """
+    text = text or ""
+    start = find_json_start(text)
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object or array found", text, 0)
+    value, end, complete = _parse_value(text, start)
+    if not complete and not value:
+        # 복구한 내용이 없으면 JSON 응답이 아닌 것으로 간주 (예: "- 산업: [반도체]" 같은 텍스트)
+        raise json.JSONDecodeError("Incomplete JSON with nothing recoverable", text, end)
+    return PartialJSON(value, complete)
+
+
+def loads(text):
+    """loads_partial의 값만 반환합니다."""
+    return loads_partial(text).value
@@ -0,0 +1,97 @@
+# langchain_app/llm_cache.py
+import hashlib
+import json
+import logging
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# settings.CACHES에 정의된 LLM 응답 전용 캐시 alias
+LLM_CACHE_ALIAS = "llm"
+
+
+def make_cache_key(model_name, temperature, prompt, **kwargs):
+    """
+    모델명, temperature, 렌더링된 프롬프트(및 추가 호출 인자)를 해시하여 캐시 키를 만듭니다.
+    같은 입력이면 어떤 채용 공고에서 호출하더라도 같은 키가 생성됩니다.
+    """
+    payload = json.dumps(
+        {
+            "model": model_name,
+            "temperature": temperature,
+            "prompt": prompt,
+            "kwargs": kwargs,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return "llm:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedChatModel:
+    """
+    ChatOpenAI 인스턴스 앞단에 위치하는 응답 캐시입니다.
+    동일한 (모델, temperature, 프롬프트) 조합은 OpenAI를 다시 호출하지 않고 저장된 응답을 반환합니다.
+    TTL과 최대 항목 수는 settings.CACHES["llm"]의 TIMEOUT / MAX_ENTRIES로 조절합니다.
+    """
+
+    def __init__(self, llm, alias=LLM_CACHE_ALIAS):
+        self.llm = llm
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def cache_key(self, text, **kwargs):
+        # fake 백엔드 응답이 실제 응답 캐시와 섞이지 않도록 백엔드 구분값을 키에 포함
+        namespace = getattr(self.llm, "cache_namespace", None)
+        if namespace:
+            kwargs["backend"] = namespace
+        return make_cache_key(
+            getattr(self.llm, "model_name", None),
+            getattr(self.llm, "temperature", None),
+            text,
+            **kwargs,
+        )
+
+    @staticmethod
+    def is_valid(response, validate):
+        if validate is None:
+            return True
+        try:
+            validate(response)
+            return True
+        except ValueError:
+            return False
+
+    def predict(self, text, use_cache=True, validate=None, **kwargs):
+        """
+        validate(response)를 주면 검증을 통과한 응답만 캐시에 저장하고, 캐시된 응답도 검증에 실패하면 무시합니다.
+        (형식이 잘못된 응답이 캐시되어 TTL 동안 계속 재사용되는 것을 막음)
+        """
+        key = self.cache_key(text, **kwargs)
+        if use_cache:
+            try:
+                cached = self.cache.get(key)
+            except Exception as e:
+                logger.warning("LLM cache read failed: %s", e)
+                cached = None
+            if cached is not None and self.is_valid(cached, validate):
+                logger.info("LLM cache hit (%s)", key)
+                return cached
+
+        response = self.llm.predict(text, **kwargs)
+        if not self.is_valid(response, validate):
+            logger.info("Not caching LLM response that failed validation (%s)", key)
+            return response
+        try:
+            self.cache.set(key, response)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+        return response
+
+    def __getattr__(self, name):
+        # predict 외의 속성(model_name, temperature 등)은 원본 모델로 위임
+        return getattr(self.llm, name)
@@ -0,0 +1,289 @@
+# langchain_app/llm_gateway.py
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from django.conf import settings
+from .llm_cache import CachedChatModel
+
+logger = logging.getLogger(__name__)
+
+# 비ASCII(한국어) 텍스트는 글자당 토큰이 많으므로, tokenizer가 없을 때는 UTF-8 바이트 수 / 3으로 넉넉하게 추정
+BYTES_PER_TOKEN_ESTIMATE = 3
+
+
+class TokenBucket:
+    """
+    분당 한도(rate_per_minute)를 초 단위로 채우는 토큰 버킷입니다. 여러 스레드가 함께 사용합니다.
+    reserve()는 토큰을 먼저 차감(부족하면 음수까지 허용)하고 기다려야 할 시간을 돌려주므로,
+    대기 중인 호출들이 도착 순서대로 차례를 예약하고 한꺼번에 몰리지 않습니다.
+    """
+
+    def __init__(self, rate_per_minute, clock=time.monotonic):
+        self.capacity = float(rate_per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self, amount=1):
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    요청 수(RPM)와 토큰 수(TPM) 버킷을 함께 적용합니다. 두 버킷 중 더 오래 기다려야 하는 쪽만큼 대기합니다.
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def reserve(self, tokens):
+        return max(self.requests.reserve(1), self.tokens.reserve(tokens))
+
+    def acquire(self, tokens):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info("LLM rate limit: waiting %.2fs", wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info("LLM rate limit: waiting %.2fs", wait)
+            await asyncio.sleep(wait)
+
+
+class CallerLimiter:
+    """
+    호출 주체(caller)별 동시 실행 수 제한입니다. 동기/비동기 호출이 같은 세마포어를 공유합니다.
+    """
+
+    def __init__(self, limits):
+        self.limits = dict(limits)
+        self.semaphores = {}
+        self.lock = threading.Lock()
+
+    def semaphore(self, caller):
+        with self.lock:
+            if caller not in self.semaphores:
+                limit = self.limits.get(caller, self.limits.get("default", 8))
+                self.semaphores[caller] = threading.BoundedSemaphore(max(1, limit))
+            return self.semaphores[caller]
+
+    async def acquire_async(self, caller):
+        semaphore = self.semaphore(caller)
+        if semaphore.acquire(blocking=False):
+            return semaphore
+        # 빈 슬롯이 없으면 이벤트 루프를 막지 않도록 스레드에서 대기 (폴링 없이 반납되는 즉시 깨어남)
+        acquiring = asyncio.ensure_future(asyncio.to_thread(semaphore.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # 호출이 취소되어도 대기 중인 스레드는 결국 슬롯을 잡으므로, 잡는 즉시 반납
+            acquiring.add_done_callback(lambda _: semaphore.release())
+            raise
+        return semaphore
+
+
+_lock = threading.Lock()
+_rate_limiter = None
+_caller_limiter = None
+_http_client = None
+_openai_client = None
+# httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 하나씩 유지
+_async_openai_clients = weakref.WeakKeyDictionary()
+_encoding = None
+
+
+def get_rate_limiter():
+    global _rate_limiter
+    with _lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(settings.LLM_REQUESTS_PER_MINUTE, settings.LLM_TOKENS_PER_MINUTE)
+        return _rate_limiter
+
+
+def get_caller_limiter():
+    global _caller_limiter
+    with _lock:
+        if _caller_limiter is None:
+            _caller_limiter = CallerLimiter(settings.LLM_CALLER_CONCURRENCY)
+        return _caller_limiter
+
+
+def reset_limiters():
+    """설정을 바꾼 뒤(테스트 등) 한도를 다시 읽도록 리미터를 초기화합니다."""
+    global _rate_limiter, _caller_limiter
+    with _lock:
+        _rate_limiter = None
+        _caller_limiter = None
+
+
+def http_limits():
+    import httpx
+    return httpx.Limits(
+        max_connections=settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+    )
+
+
+def get_openai_client():
+    """
+    프로세스 전체에서 공유하는 동기 OpenAI 클라이언트 (커넥션 풀 재사용)
+    """
+    global _http_client, _openai_client
+    with _lock:
+        if _openai_client is None:
+            import httpx
+            import openai
+            _http_client = httpx.Client(limits=http_limits(), timeout=settings.LLM_REQUEST_TIMEOUT)
+            _openai_client = openai.OpenAI(api_key=settings.OPENAI_API_KEY, http_client=_http_client)
+        return _openai_client
+
+
+def get_async_openai_client():
+    """
+    현재 이벤트 루프에서 공유하는 비동기 OpenAI 클라이언트
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_openai_clients.get(loop)
+        if client is None:
+            import httpx
+            import openai
+            client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(limits=http_limits(), timeout=settings.LLM_REQUEST_TIMEOUT),
+            )
+            _async_openai_clients[loop] = client
+        return client
+
+
+def estimate_tokens(text):
+    """
+    프롬프트 토큰 수를 추정합니다. tiktoken 인코딩을 쓸 수 없으면(오프라인 등) 바이트 수로 넉넉하게 추정합니다.
+    """
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(text.encode("utf-8")) // BYTES_PER_TOKEN_ESTIMATE + 1
+
+
+class GatewayChatModel:
+    """
+    모든 LLM 호출이 거치는 공용 게이트웨이입니다.
+    - ChatOpenAI는 첫 호출 때 생성되며, 공유 HTTP 커넥션 풀을 사용합니다.
+      LLM_BACKEND=fake면 네트워크 없이 응답하는 FakeChatModel을 사용합니다.
+    - 호출 전에 프로세스 공용 RPM/TPM 토큰 버킷과 caller별 동시 실행 제한을 통과해야 합니다.
+    - predict(동기), apredict / astream(비동기) 경로를 제공합니다.
+    """
+
+    def __init__(self, model, temperature=None, caller="default", **model_kwargs):
+        self.model_name = model
+        self.temperature = temperature
+        self.caller = caller
+        self.model_kwargs = model_kwargs
+        self._chat_model = None
+        self._backend = None
+        self._async_chat_models = weakref.WeakKeyDictionary()
+
+    def build_chat_model(self, async_client=None):
+        if settings.LLM_BACKEND == "fake":
+            from .fake_llm import FakeChatModel
+            return FakeChatModel(self.model_name, self.temperature)
+        from langchain_community.chat_models import ChatOpenAI
+        client = get_openai_client()
+        return ChatOpenAI(
+            model=self.model_name,
+            temperature=self.temperature,
+            openai_api_key=settings.OPENAI_API_KEY,
+            client=client.chat.completions,
+            async_client=async_client.chat.completions if async_client else None,
+            **self.model_kwargs,
+        )
+
+    @property
+    def cache_namespace(self):
+        return "fake" if settings.LLM_BACKEND == "fake" else None
+
+    def check_backend(self):
+        # 실행 중에 LLM_BACKEND가 바뀌면(부하 테스트 등) 모델을 다시 생성
+        if self._backend != settings.LLM_BACKEND:
+            self._chat_model = None
+            self._async_chat_models = weakref.WeakKeyDictionary()
+            self._backend = settings.LLM_BACKEND
+
+    @property
+    def chat_model(self):
+        self.check_backend()
+        if self._chat_model is None:
+            self._chat_model = self.build_chat_model()
+        return self._chat_model
+
+    def async_chat_model(self):
+        self.check_backend()
+        loop = asyncio.get_running_loop()
+        chat_model = self._async_chat_models.get(loop)
+        if chat_model is None:
+            async_client = None if settings.LLM_BACKEND == "fake" else get_async_openai_client()
+            chat_model = self.build_chat_model(async_client=async_client)
+            self._async_chat_models[loop] = chat_model
+        return chat_model
+
+    def reserve_tokens(self, text):
+        return estimate_tokens(text) + settings.LLM_EXPECTED_COMPLETION_TOKENS
+
+    def predict(self, text, **kwargs):
+        semaphore = get_caller_limiter().semaphore(self.caller)
+        with semaphore:
+            get_rate_limiter().acquire(self.reserve_tokens(text))
+            return self.chat_model.predict(text, **kwargs)
+
+    async def apredict(self, text, **kwargs):
+        semaphore = await get_caller_limiter().acquire_async(self.caller)
+        try:
+            await get_rate_limiter().acquire_async(self.reserve_tokens(text))
+            return await self.async_chat_model().apredict(text, **kwargs)
+        finally:
+            semaphore.release()
+
+    async def astream(self, text, **kwargs):
+        # 스트리밍이 끝날 때까지 동시 실행 슬롯을 점유
+        semaphore = await get_caller_limiter().acquire_async(self.caller)
+        try:
+            await get_rate_limiter().acquire_async(self.reserve_tokens(text))
+            async for chunk in self.async_chat_model().astream(text, **kwargs):
+                yield chunk
+        finally:
+            semaphore.release()
+
+
+_models = {}
+
+
+def get_chat_model(model, temperature=None, caller="default", cache=False):
+    """
+    (모델, temperature, caller) 조합별로 공유되는 게이트웨이 모델을 반환합니다. ChatOpenAI는 첫 호출 때 생성됩니다.
+    cache=True면 응답 캐시(CachedChatModel)를 앞단에 둡니다.
+    """
+    key = (model, temperature, caller, cache)
+    with _lock:
+        if key not in _models:
+            gateway = GatewayChatModel(model, temperature=temperature, caller=caller)
+            _models[key] = CachedChatModel(gateway) if cache else gateway
+        return _models[key]
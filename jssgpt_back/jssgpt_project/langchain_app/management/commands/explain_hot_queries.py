@@ -0,0 +1,143 @@
+# langchain_app/management/commands/explain_hot_queries.py
+import datetime
+import re
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from langchain_app.models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from user_coverletter.models import UserCoverLetter
+from user_experience.models import RawExperience, STARExperience
+
+
+class SeedRollback(Exception):
+    """시드 데이터를 롤백하기 위해 트랜잭션 블록을 빠져나올 때 사용합니다."""
+
+
+def seed_dataset(recruitments, users):
+    """
+    실행 계획 확인용 데이터를 bulk_create로 생성하고, 조회에 사용할 (user, month_start) 을 반환합니다.
+    """
+    month_start = datetime.date(2030, 1, 1)
+    companies = Company.objects.bulk_create(
+        [Company(name=f"__explain_company_{i}", industry="seed") for i in range(max(1, recruitments // 20))]
+    )
+    Recruitment.objects.bulk_create([
+        Recruitment(
+            company=companies[i % len(companies)],
+            title=f"__explain_recruitment_{i}",
+            start_date=month_start + datetime.timedelta(days=i % 720),
+            end_date=month_start + datetime.timedelta(days=i % 720 + 14),
+            custom_id=f"__explain-{i}",
+        )
+        for i in range(recruitments)
+    ])
+    recruitment_objs = list(Recruitment.objects.filter(custom_id__startswith="__explain-"))
+    jobs = RecruitJob.objects.bulk_create(
+        [RecruitJob(recruitment=r, title="백엔드", description="seed") for r in recruitment_objs]
+    )
+    prompts = CoverLetterPrompt.objects.bulk_create(
+        [CoverLetterPrompt(recruit_job=job, question_text="지원 동기", outline="seed") for job in jobs]
+    )
+
+    User.objects.bulk_create([User(username=f"__explain_user_{i}") for i in range(users)])
+    seeded_users = list(User.objects.filter(username__startswith="__explain_user_"))
+    raws = RawExperience.objects.bulk_create([RawExperience(user=u, extracted_text="seed") for u in seeded_users])
+    STARExperience.objects.bulk_create([
+        STARExperience(raw_experience=raw, user=raw.user, title=f"경험 {i}",
+                       situation="s", task="t", action="a", result="r")
+        for raw in raws for i in range(10)
+    ])
+    UserCoverLetter.objects.bulk_create([
+        UserCoverLetter(user=u, recruit_job=prompts[i].recruit_job, prompt=prompts[i])
+        for u in seeded_users for i in range(0, len(prompts), max(1, len(prompts) // 20))
+    ])
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            for model in (Recruitment, RecruitJob, CoverLetterPrompt, STARExperience, UserCoverLetter):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+    return seeded_users[0], month_start
+
+
+def hot_queries(user, month_start):
+    """
+    (이름, queryset, Seq Scan이 나오면 안 되는 테이블) 목록. 캘린더/상세/목록 화면에서 자주 호출되는 쿼리입니다.
+    """
+    month_end = month_start + datetime.timedelta(days=41)
+    recruitment = Recruitment.objects.filter(start_date__gte=month_start).order_by("start_date", "id").first()
+    return [
+        (
+            "calendar window",
+            Recruitment.objects.filter(
+                Q(start_date__range=(month_start, month_end)) | Q(end_date__range=(month_start, month_end))
+            ).select_related("company").order_by("start_date", "id")[:500],
+            [Recruitment._meta.db_table],
+        ),
+        (
+            "recruitment detail jobs",
+            RecruitJob.objects.filter(recruitment=recruitment),
+            [RecruitJob._meta.db_table],
+        ),
+        (
+            "cover letter list",
+            UserCoverLetter.objects.filter(user=user).order_by("-updated_at"),
+            [UserCoverLetter._meta.db_table],
+        ),
+        (
+            "cover letters by job",
+            UserCoverLetter.objects.filter(user=user, recruit_job=recruitment.recruit_jobs.first()),
+            [UserCoverLetter._meta.db_table],
+        ),
+        (
+            "star experience list",
+            STARExperience.objects.filter(user=user).order_by("-updated_at"),
+            [STARExperience._meta.db_table],
+        ),
+    ]
+
+
+def find_seq_scans(plan, tables):
+    """
+    실행 계획에서 테이블 전체를 읽는 노드를 찾습니다. (PostgreSQL: "Seq Scan on", SQLite: "SCAN <table>")
+    """
+    return [
+        table for table in tables
+        if f"Seq Scan on {table}" in plan or re.search(rf"\bSCAN {table}\b(?! USING)", plan)
+    ]
+
+
+class Command(BaseCommand):
+    help = '시드 데이터를 넣고 캘린더/목록 화면의 주요 쿼리를 EXPLAIN ANALYZE 하여 Seq Scan 여부를 보고합니다. (데이터는 롤백됩니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recruitments', type=int, default=20000, help='시드할 채용 공고 수')
+        parser.add_argument('--users', type=int, default=50, help='시드할 사용자 수')
+        parser.add_argument('--verbose-plans', action='store_true', help='전체 실행 계획 출력')
+
+    def handle(self, *args, **options):
+        analyze = connection.vendor == "postgresql"
+        if not analyze:
+            self.stdout.write(self.style.WARNING(
+                f"[WARN] {connection.vendor}에서는 EXPLAIN ANALYZE를 지원하지 않아 EXPLAIN만 실행합니다."
+            ))
+
+        regressions = []
+        try:
+            with transaction.atomic():
+                user, month_start = seed_dataset(options['recruitments'], options['users'])
+                for name, queryset, tables in hot_queries(user, month_start):
+                    plan = queryset.explain(analyze=True) if analyze else queryset.explain()
+                    seq_scans = find_seq_scans(plan, tables)
+                    status = self.style.ERROR("SEQ SCAN") if seq_scans else self.style.SUCCESS("OK")
+                    self.stdout.write(f"[{status}] {name}")
+                    if seq_scans or options['verbose_plans']:
+                        self.stdout.write(plan)
+                    regressions += [f"{name}: {table}" for table in seq_scans]
+                raise SeedRollback()
+        except SeedRollback:
+            pass
+
+        if regressions:
+            raise CommandError("인덱스를 사용하지 않는 쿼리가 있습니다: " + ", ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("[INFO] 모든 주요 쿼리가 인덱스를 사용합니다."))
@@ -0,0 +1,279 @@
+# langchain_app/management/commands/loadtest.py
+import datetime
+import io
+import math
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client, override_settings
+from jssgpt_project.celery import app as celery_app
+from langchain_app.llm_gateway import reset_limiters
+from langchain_app.models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from langchain_app.utils import generate_and_save_company_info, generate_and_save_job_info
+from user_coverletter.models import UserCoverLetter
+from user_experience.models import RawExperience, STARExperience
+
+SEED_PREFIX = "__loadtest"
+SCENARIOS = ["calendar", "detail", "recommend", "draft", "resume", "enrich"]
+QUESTIONS = ["지원 동기를 작성해주세요.", "협업 경험을 작성해주세요.", "입사 후 포부를 작성해주세요."]
+# 상태 조회 엔드포인트를 폴링할 때의 간격과 최대 대기 시간(초)
+POLL_INTERVAL = 0.2
+POLL_TIMEOUT = 120
+
+
+def percentile(sorted_values, pct):
+    """
+    정렬된 값 목록의 nearest-rank 백분위수
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def sample_pdf(lines):
+    """
+    각 줄을 한 페이지에 적은 최소 PDF 바이트열 (Helvetica, ASCII 텍스트)
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for line in lines:
+        stream = f"BT /F1 12 Tf 72 720 Td ({line}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = io.BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def seed_dataset(users):
+    """
+    부하 테스트용 기업/공고/직무/문항과 사용자별 STAR 경험을 생성합니다. (가상 사용자마다 직무 하나씩)
+    """
+    month_start = datetime.date.today().replace(day=1)
+    company = Company.objects.create(name=f"{SEED_PREFIX}_company")
+    Recruitment.objects.bulk_create([
+        Recruitment(
+            company=company,
+            title=f"{SEED_PREFIX} 채용 {i}",
+            start_date=month_start + datetime.timedelta(days=i % 28),
+            end_date=month_start + datetime.timedelta(days=i % 28 + 14),
+            custom_id=f"{SEED_PREFIX}-{i}",
+        )
+        for i in range(users)
+    ])
+    recruitments = list(Recruitment.objects.filter(custom_id__startswith=f"{SEED_PREFIX}-").order_by("id"))
+    jobs = RecruitJob.objects.bulk_create([
+        RecruitJob(recruitment=r, title="백엔드 개발", description="서비스 개발") for r in recruitments
+    ])
+    CoverLetterPrompt.objects.bulk_create([
+        CoverLetterPrompt(recruit_job=job, question_text=question, outline="아웃라인", limit=700)
+        for job in jobs for question in QUESTIONS
+    ])
+
+    User.objects.bulk_create([User(username=f"{SEED_PREFIX}_user_{i}") for i in range(users)])
+    seeded_users = list(User.objects.filter(username__startswith=f"{SEED_PREFIX}_user_").order_by("id"))
+    raws = RawExperience.objects.bulk_create([RawExperience(user=u, extracted_text="") for u in seeded_users])
+    STARExperience.objects.bulk_create([
+        STARExperience(raw_experience=raw, user=raw.user, title=f"경험 {i}",
+                       situation=f"{i}번째 프로젝트에서 팀의 목표를 달성해야 했다", task="t", action="a", result="r")
+        for raw in raws for i in range(10)
+    ])
+    return list(zip(seeded_users, recruitments, jobs)), month_start
+
+
+def cleanup_dataset():
+    User.objects.filter(username__startswith=f"{SEED_PREFIX}_user_").delete()
+    Company.objects.filter(name=f"{SEED_PREFIX}_company").delete()
+
+
+def wait_for_status(client, status_url):
+    deadline = time.monotonic() + POLL_TIMEOUT
+    while time.monotonic() < deadline:
+        data = client.get(status_url).json()
+        if data.get("status") in ("done", "failed"):
+            return data
+        time.sleep(POLL_INTERVAL)
+    raise TimeoutError(f"{status_url} did not finish in {POLL_TIMEOUT}s")
+
+
+class VirtualUser:
+    """
+    로그인한 사용자 한 명이 시나리오를 순서대로 실행합니다. 시나리오마다 (소요 시간, 성공 여부)를 기록합니다.
+    """
+
+    def __init__(self, user, recruitment, job, month_start, record):
+        self.user = user
+        self.recruitment = recruitment
+        self.job = job
+        self.month_start = month_start
+        self.record = record
+        self.client = Client()
+        self.client.force_login(user)
+
+    def timed(self, scenario, func, iteration):
+        started = time.perf_counter()
+        try:
+            ok = func(iteration)
+        except Exception:
+            ok = False
+        self.record(scenario, time.perf_counter() - started, ok)
+
+    def calendar(self, iteration):
+        end = self.month_start + datetime.timedelta(days=41)
+        response = self.client.get("/api/recruitment-events/", {"start": self.month_start, "end": end})
+        return response.status_code == 200
+
+    def detail(self, iteration):
+        return self.client.get(f"/api/recruitments/{self.recruitment.id}/").status_code == 200
+
+    def recommend(self, iteration):
+        response = self.client.get(
+            f"/api/cover-letter/create/{self.job.id}/", HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+        return response.status_code == 200 and all(p["recommended"] for p in response.json()["prompts"])
+
+    def draft(self, iteration):
+        response = self.client.post(f"/api/cover-letter/generate-draft/{self.job.id}/")
+        if response.status_code != 202:
+            return False
+        return wait_for_status(self.client, response.json()["status_url"])["status"] == "done"
+
+    def resume(self, iteration):
+        # 반복마다 내용을 바꿔 PDF 추출 캐시에 걸리지 않게 함
+        pdf = sample_pdf([f"Project {page} of user {self.user.id} iteration {iteration}" for page in range(3)])
+        response = self.client.post("/api/user-experience/upload-resume/", {
+            "resume_file": SimpleUploadedFile("resume.pdf", pdf, content_type="application/pdf"),
+        })
+        if response.status_code != 202:
+            return False
+        return wait_for_status(self.client, response.json()["status_url"])["status"] == "done"
+
+    def enrich(self, iteration):
+        generate_and_save_company_info(self.recruitment.company.name)
+        generate_and_save_job_info(self.recruitment.company.name, self.recruitment, self.job.title, self.job)
+        return True
+
+    def run(self, scenarios, iterations):
+        try:
+            for iteration in range(iterations):
+                if "recommend" in scenarios:
+                    # 매 반복 추천 LLM 호출이 일어나도록 이전 반복의 자기소개서를 지움 (측정 제외)
+                    UserCoverLetter.objects.filter(user=self.user, recruit_job=self.job).delete()
+                for scenario in scenarios:
+                    self.timed(scenario, getattr(self, scenario), iteration)
+        finally:
+            connections.close_all()
+
+
+class Command(BaseCommand):
+    help = ('fake LLM 백엔드로 실제 뷰(캘린더/상세/추천/초안/이력서 업로드)와 보강 작업을 N명의 동시 사용자로 실행하고 '
+            '시나리오별 처리량과 지연 분위수를 보고합니다. (OpenAI 키/네트워크 불필요, 시드 데이터는 종료 시 삭제)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10, help='동시 가상 사용자 수')
+        parser.add_argument('--iterations', type=int, default=3, help='사용자별 시나리오 반복 횟수')
+        parser.add_argument('--scenarios', default=",".join(SCENARIOS), help=f'실행할 시나리오 ({", ".join(SCENARIOS)})')
+        parser.add_argument('--latency-ms', type=float, default=None, help='fake LLM 평균 지연 (기본: LLM_FAKE_LATENCY_MS)')
+        parser.add_argument('--jitter-ms', type=float, default=None, help='fake LLM 지연 편차 (기본: LLM_FAKE_LATENCY_JITTER_MS)')
+        parser.add_argument('--failure-rate', type=float, default=None, help='fake LLM 오류 주입 확률 0~1')
+        parser.add_argument('--keep-data', action='store_true', help='종료 후 시드 데이터를 지우지 않음')
+
+    def handle(self, *args, **options):
+        scenarios = [name.strip() for name in options['scenarios'].split(",") if name.strip()]
+        unknown = set(scenarios) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+        overrides = {
+            'LLM_BACKEND': 'fake',
+            'MEDIA_ROOT': tempfile.mkdtemp(prefix="loadtest-media-"),
+            'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver'],  # django.test.Client의 Host
+        }
+        for option, setting in (('latency_ms', 'LLM_FAKE_LATENCY_MS'), ('jitter_ms', 'LLM_FAKE_LATENCY_JITTER_MS'),
+                                ('failure_rate', 'LLM_FAKE_FAILURE_RATE')):
+            if options[option] is not None:
+                overrides[setting] = options[option]
+
+        if connections['default'].vendor == "sqlite":
+            self.stdout.write(self.style.WARNING(
+                "[WARN] SQLite는 동시 쓰기를 지원하지 않아 'database is locked' 오류가 날 수 있습니다. PostgreSQL에서 실행하세요."
+            ))
+
+        timings = defaultdict(list)
+        errors = defaultdict(int)
+        lock = threading.Lock()
+
+        def record(scenario, seconds, ok):
+            with lock:
+                timings[scenario].append(seconds)
+                if not ok:
+                    errors[scenario] += 1
+
+        # Celery 태스크(이력서 파이프라인, 초안 생성)를 브로커 없이 요청 안에서 바로 실행
+        eager = celery_app.conf.task_always_eager
+        celery_app.conf.task_always_eager = True
+        try:
+            with override_settings(**overrides):
+                reset_limiters()
+                cleanup_dataset()
+                seeded, month_start = seed_dataset(options['users'])
+                try:
+                    virtual_users = [VirtualUser(*row, month_start, record) for row in seeded]
+                    self.stdout.write(
+                        f"[INFO] {len(virtual_users)} users x {options['iterations']} iterations: {', '.join(scenarios)}"
+                    )
+                    started = time.perf_counter()
+                    with ThreadPoolExecutor(max_workers=len(virtual_users)) as executor:
+                        for future in [executor.submit(vu.run, scenarios, options['iterations']) for vu in virtual_users]:
+                            future.result()
+                    elapsed = time.perf_counter() - started
+                finally:
+                    if not options['keep_data']:
+                        cleanup_dataset()
+        finally:
+            celery_app.conf.task_always_eager = eager
+            reset_limiters()
+
+        self.report(scenarios, timings, errors, elapsed)
+
+    def report(self, scenarios, timings, errors, elapsed):
+        header = f"{'scenario':<10} {'count':>6} {'errors':>6} {'rps':>7} {'mean':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        total = 0
+        for scenario in scenarios:
+            values = sorted(timings[scenario])
+            total += len(values)
+            if not values:
+                continue
+            ms = [value * 1000 for value in values]
+            self.stdout.write(
+                f"{scenario:<10} {len(values):>6} {errors[scenario]:>6} {len(values) / elapsed:>7.2f} "
+                f"{sum(ms) / len(ms):>8.1f} {percentile(ms, 50):>8.1f} {percentile(ms, 90):>8.1f} "
+                f"{percentile(ms, 99):>8.1f} {ms[-1]:>8.1f}"
+            )
+        self.stdout.write(f"[INFO] 전체 {total}건 / {elapsed:.2f}s = {total / elapsed:.2f} req/s (지연 단위: ms)")
+        failed = sum(errors.values())
+        if failed:
+            self.stdout.write(self.style.WARNING(f"[WARN] 실패 {failed}건"))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0008_alter_company_industry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruitment',
+            name='crawl_fingerprint',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+def fill_recruitment_seq(apps, schema_editor):
+    """
+    기존 "기업명-N" 형식 custom_id의 최대 순번(또는 공고 수)으로 recruitment_seq를 채워,
+    이후 발급되는 순번이 기존 custom_id와 겹치지 않도록 합니다.
+    """
+    Company = apps.get_model('langchain_app', 'Company')
+    Recruitment = apps.get_model('langchain_app', 'Recruitment')
+    for company in Company.objects.all():
+        recruitments = Recruitment.objects.filter(company=company)
+        seq = recruitments.count()
+        prefix = f"{company.name}-"
+        for custom_id in recruitments.filter(custom_id__startswith=prefix).values_list('custom_id', flat=True):
+            suffix = custom_id[len(prefix):]
+            if suffix.isdigit():
+                seq = max(seq, int(suffix))
+        if seq:
+            Company.objects.filter(pk=company.pk).update(recruitment_seq=seq)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0009_recruitment_crawl_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='recruitment_seq',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_recruitment_seq, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:45
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0010_company_recruitment_seq'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruitment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
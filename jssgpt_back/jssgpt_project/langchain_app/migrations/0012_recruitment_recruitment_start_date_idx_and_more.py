@@ -0,0 +1,21 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0011_recruitment_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recruitment',
+            index=models.Index(fields=['start_date', 'id'], name='recruitment_start_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruitment',
+            index=models.Index(fields=['end_date'], name='recruitment_end_date_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0012_recruitment_recruitment_start_date_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coverletterprompt',
+            name='outline_embedding',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='coverletterprompt',
+            name='outline_embedding_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+    ]
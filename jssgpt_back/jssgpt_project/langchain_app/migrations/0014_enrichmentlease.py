@@ -0,0 +1,24 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langchain_app', '0013_coverletterprompt_outline_embedding_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnrichmentLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('task_type', models.CharField(max_length=50)),
+                ('object_id', models.CharField(max_length=64)),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
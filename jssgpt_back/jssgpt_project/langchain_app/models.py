@@ -1,5 +1,5 @@
 # langchain_app/models.py
-from django.db import models
+from django.db import connection, models
 
 class Company(models.Model):
     name = models.CharField(max_length=255, unique=True)  # 기업명
@@ -9,6 +9,22 @@ class Company(models.Model):
     core_values = models.TextField(null=True, blank=True)  # 핵심 가치
     recent_achievements = models.TextField(null=True, blank=True)  # 최근 성과
     key_issues = models.TextField(null=True, blank=True)  # 주요 이슈
+    recruitment_seq = models.PositiveIntegerField(default=0, editable=False)  # 마지막으로 발급한 채용 공고 순번
+
+    def allocate_recruitment_seq(self, count=1):
+        """
+        이 기업의 채용 공고 순번을 count개 발급하고, 발급된 첫 번째 순번을 반환합니다.
+        UPDATE ... RETURNING 한 번으로 증가와 조회를 같이 하므로, 동시에 크롤링해도 순번이 겹치지 않습니다.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {self._meta.db_table} SET recruitment_seq = recruitment_seq + %s "
+                f"WHERE id = %s RETURNING recruitment_seq",
+                [count, self.pk],
+            )
+            last_seq = cursor.fetchone()[0]
+        self.recruitment_seq = last_seq
+        return last_seq - count + 1
 
     def __str__(self):
         return self.name
@@ -23,12 +39,20 @@ class Recruitment(models.Model):
     custom_id = models.CharField(max_length=255, unique=True, editable=False, null=True)  # 채용 공고 ID
     recruitment_link = models.URLField(null=True, blank=True)  # 새로 추가
     jss_link = models.URLField(null=True, blank=True)  # 추가 필드
+    crawl_fingerprint = models.CharField(max_length=64, null=True, blank=True)  # 캘린더 항목 지문 (증분 크롤링용)
+    updated_at = models.DateTimeField(auto_now=True)  # 수정 시각 (캘린더 API ETag 계산용)
+
+    class Meta:
+        indexes = [
+            # 캘린더 API: 기간 필터 + (start_date, id) keyset 정렬
+            models.Index(fields=["start_date", "id"], name="recruitment_start_date_idx"),
+            models.Index(fields=["end_date"], name="recruitment_end_date_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         # 기업명과 순번 기반으로 custom_id 생성
         if not self.custom_id:
-            count = Recruitment.objects.filter(company=self.company).count() + 1
-            self.custom_id = f"{self.company.name}-{count}"
+            self.custom_id = f"{self.company.name}-{self.company.allocate_recruitment_seq()}"
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -55,6 +79,8 @@ class CoverLetterPrompt(models.Model):
     question_text = models.TextField()  # 자기소개서 문항
     limit = models.PositiveIntegerField(null=True, blank=True)  # 글자수 제한 추가
     outline = models.TextField(null=True, blank=True)  # AI가 생성한 개요
+    outline_embedding = models.BinaryField(null=True, blank=True, editable=False)  # 경험 추천용 개요 임베딩 (float32)
+    outline_embedding_key = models.CharField(max_length=64, null=True, blank=True, editable=False)  # 임베딩 원문/백엔드 해시
     created_at = models.DateTimeField(auto_now_add=True)  # 생성 시각
     updated_at = models.DateTimeField(auto_now=True)  # 수정 시각
 
@@ -70,3 +96,19 @@ class CoverLetterGuide(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class EnrichmentLease(models.Model):
+    """
+    LLM 보강 작업의 single-flight lease입니다. (작업 종류, 객체 id, 프롬프트 해시)마다 한 행만 만들 수 있어서,
+    같은 보강 작업이 여러 번 큐에 들어가도 LLM 호출은 lease를 잡은 작업 하나만 실행합니다.
+    작업이 끝나면 삭제되고, 워커가 죽어 남은 lease는 expires_at 이후 다른 작업이 가져갑니다.
+    """
+    key = models.CharField(max_length=64, unique=True)  # (task_type, object_id, 프롬프트 해시)의 sha256
+    task_type = models.CharField(max_length=50)
+    object_id = models.CharField(max_length=64)
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task_type}:{self.object_id}"
@@ -0,0 +1,49 @@
+# langchain_app/recruitment_cache.py
+import logging
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# settings.CACHES에 정의된 채용 공고 상세 응답 전용 캐시 alias
+RECRUITMENT_CACHE_ALIAS = "recruitment"
+
+
+def detail_cache_key(recruitment_id):
+    return f"recruitment:detail:{recruitment_id}"
+
+
+def get_cached_detail(recruitment_id):
+    """
+    캐시된 채용 공고 상세 응답(dict)을 반환합니다. 없거나 캐시 오류가 나면 None을 반환합니다.
+    """
+    try:
+        return caches[RECRUITMENT_CACHE_ALIAS].get(detail_cache_key(recruitment_id))
+    except Exception as e:
+        logger.warning("Recruitment cache read failed: %s", e)
+        return None
+
+
+def set_cached_detail(recruitment_id, data):
+    try:
+        caches[RECRUITMENT_CACHE_ALIAS].set(detail_cache_key(recruitment_id), data)
+    except Exception as e:
+        logger.warning("Recruitment cache write failed: %s", e)
+
+
+def invalidate_recruitment_details(recruitment_ids):
+    """
+    채용 공고 상세 캐시를 무효화합니다.
+    트랜잭션 중이면 커밋 후에 지워, 커밋 전 데이터로 캐시가 다시 채워지지 않도록 합니다.
+    """
+    keys = [detail_cache_key(recruitment_id) for recruitment_id in recruitment_ids if recruitment_id]
+    if not keys:
+        return
+
+    def _delete():
+        try:
+            caches[RECRUITMENT_CACHE_ALIAS].delete_many(keys)
+        except Exception as e:
+            logger.warning("Recruitment cache invalidation failed: %s", e)
+
+    transaction.on_commit(_delete)
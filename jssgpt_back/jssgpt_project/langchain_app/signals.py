@@ -1,8 +1,9 @@
 import logging
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
-from .models import Company, RecruitJob, CoverLetterPrompt
+from .models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from .recruitment_cache import invalidate_recruitment_details
 from .tasks import generate_company_info_task, generate_job_info_task, generate_outline_task_for_prompt
 
 logger = logging.getLogger(__name__)
@@ -26,4 +27,24 @@ def coverletterprompt_post_save(sender, instance, created, **kwargs):
     # 이미 존재하는 CoverLetterPrompt 인스턴스의 outline이 비어있다면 개별 태스크를 등록합니다.
     if created and not instance.outline:
         transaction.on_commit(lambda: generate_outline_task_for_prompt.delay(instance.id))
-        logger.info("Enqueued outline task for CoverLetterPrompt id %s", instance.id)
\ No newline at end of file
+        logger.info("Enqueued outline task for CoverLetterPrompt id %s", instance.id)
+
+# 채용 공고 상세 응답 캐시 무효화 (크롤러 저장, 관리자 수정 시)
+@receiver([post_save, post_delete], sender=Recruitment)
+def recruitment_detail_cache_invalidate(sender, instance, **kwargs):
+    invalidate_recruitment_details([instance.id])
+
+@receiver([post_save, post_delete], sender=RecruitJob)
+def recruitjob_detail_cache_invalidate(sender, instance, **kwargs):
+    invalidate_recruitment_details([instance.recruitment_id])
+
+@receiver([post_save, post_delete], sender=CoverLetterPrompt)
+def coverletterprompt_detail_cache_invalidate(sender, instance, **kwargs):
+    recruitment_id = RecruitJob.objects.filter(id=instance.recruit_job_id).values_list("recruitment_id", flat=True).first()
+    invalidate_recruitment_details([recruitment_id])
+
+@receiver(post_save, sender=Company)
+def company_detail_cache_invalidate(sender, instance, created, **kwargs):
+    # 상세 응답에 기업명이 포함되므로 기업의 모든 채용 공고 캐시를 무효화
+    if not created:
+        invalidate_recruitment_details(instance.recruitments.values_list("id", flat=True))
@@ -0,0 +1,70 @@
+# langchain_app/single_flight.py
+import hashlib
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from .models import EnrichmentLease
+
+logger = logging.getLogger(__name__)
+
+
+def lease_key(task_type, object_id, prompt):
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{task_type}:{object_id}:{prompt_hash}".encode("utf-8")).hexdigest()
+
+
+def acquire_lease(key, task_type, object_id, lease_seconds=None):
+    """
+    lease를 잡으면 True, 다른 작업이 이미 잡고 있으면 False를 반환합니다.
+    unique 제약으로 원자적으로 판정하므로 여러 워커 프로세스 사이에서도 하나만 성공합니다.
+    """
+    now = timezone.now()
+    lease_seconds = settings.ENRICHMENT_LEASE_SECONDS if lease_seconds is None else lease_seconds
+    # 워커가 죽어 남은 만료 lease 정리
+    EnrichmentLease.objects.filter(key=key, expires_at__lte=now).delete()
+    try:
+        with transaction.atomic():
+            EnrichmentLease.objects.create(
+                key=key,
+                task_type=task_type,
+                object_id=str(object_id),
+                expires_at=now + timedelta(seconds=lease_seconds),
+            )
+        return True
+    except IntegrityError:
+        return False
+
+
+def release_lease(key):
+    EnrichmentLease.objects.filter(key=key).delete()
+
+
+class LeaseHeld(Exception):
+    """같은 보강 작업을 다른 작업이 실행 중일 때 발생합니다. 호출한 Celery 작업은 잠시 뒤 재시도합니다."""
+
+
+def run_single_flight(task_type, object_id, prompt, is_done, compute):
+    """
+    (task_type, object_id, prompt 해시)가 같은 보강 작업을 하나의 LLM 호출로 합칩니다.
+    - is_done(): 결과가 이미 DB에 저장되었는지 (다시 조회해서 확인)
+    - compute(): LLM 호출 + 저장
+    lease를 잡은 작업만 compute()를 실행합니다. 다른 작업이 lease를 잡고 있으면 기다리지 않고 LeaseHeld를 발생시키므로,
+    호출한 작업은 워커 슬롯을 점유하지 않고 재시도(self.retry)한 뒤 저장된 결과를 그대로 씁니다.
+    compute()를 실행했으면 True, 결과가 이미 저장되어 있었으면 False를 반환합니다.
+    """
+    if is_done():
+        return False
+    key = lease_key(task_type, object_id, prompt)
+    if not acquire_lease(key, task_type, object_id):
+        raise LeaseHeld(key)
+    try:
+        # is_done() 확인과 lease 획득 사이에 앞선 작업이 끝났을 수 있으므로 다시 확인
+        if is_done():
+            logger.info("Reused in-flight %s result for id %s", task_type, object_id)
+            return False
+        compute()
+        return True
+    finally:
+        release_lease(key)
@@ -0,0 +1,187 @@
+# langchain_app/structured_output.py
+import logging
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+from .json_stream import loads_partial
+from .llm_cache import CachedChatModel
+
+logger = logging.getLogger(__name__)
+
+# OpenAI JSON mode. predict(..., **JSON_MODE) 로 넘기면 응답이 항상 하나의 JSON 객체가 됨
+# (JSON mode는 최상위가 객체여야 하므로 배열 응답은 {"experiences": [...]} 처럼 감싸서 요청)
+JSON_MODE = {"response_format": {"type": "json_object"}}
+
+# 스키마 검증에 실패했을 때 오류 내용을 붙여 다시 요청하는 횟수 (API 오류는 재시도하지 않음)
+STRUCTURED_OUTPUT_RETRIES = 2
+
+
+class StructuredOutputError(ValueError):
+    """재시도와 기존 파서 fallback까지 모두 스키마 검증에 실패했을 때 발생합니다."""
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+def to_text(value):
+    """
+    LLM이 문자열 대신 목록/객체로 답한 값을 기존 flatten_json과 같은 형식의 문자열로 바꿉니다.
+    """
+    if isinstance(value, dict):
+        return ", ".join(f"{key}: {to_text(sub)}" for key, sub in value.items())
+    if isinstance(value, list):
+        return ", ".join(to_text(item) for item in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+class KoreanAliasModel(BaseModel):
+    """
+    한국어 키(alias)로 응답을 받는 스키마의 공통 설정입니다.
+    - "회사_비전"처럼 언더바가 들어간 키도 허용 (기존 파서의 키 정규화와 동일)
+    - {"삼성전자": {...}} 처럼 한 번 감싼 응답은 안쪽 객체를 사용
+    - 값이 목록/객체면 문자열로 평탄화
+    """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_keys(cls, data):
+        if isinstance(data, dict) and len(data) == 1:
+            inner = next(iter(data.values()))
+            if isinstance(inner, dict):
+                data = inner
+        if isinstance(data, dict):
+            data = {str(key).replace("_", " ").strip(): value for key, value in data.items()}
+        return data
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def flatten_value(cls, value):
+        return to_text(value).strip()
+
+
+class CompanyInfo(KoreanAliasModel):
+    """기업 정보 조사 결과 (generate_and_save_company_info)"""
+    industry: str = Field(alias="산업", min_length=1)
+    vision: str = Field(alias="회사 비전", min_length=1)
+    mission: str = Field(alias="미션", min_length=1)
+    core_values: str = Field(alias="기업 문화와 인재상", min_length=1)
+    recent_achievements: str = Field(alias="최근 주요 성과", min_length=1)
+    key_issues: str = Field(alias="현재 주요 이슈", min_length=1)
+
+
+class JobInfo(KoreanAliasModel):
+    """직무 정보 조사 결과 (generate_and_save_job_info)"""
+    description: str = Field(alias="직무 설명", min_length=1)
+    key_roles: str = Field(alias="수행 업무", min_length=1)
+    required_skills: str = Field(alias="필요한 기술", min_length=1)
+    soft_skills: str = Field(alias="관련 소프트 스킬", min_length=1)
+    key_strengths: str = Field(alias="필요 강점", min_length=1)
+
+
+class StarItem(BaseModel):
+    """이력서에서 추출한 STAR 경험 하나"""
+    model_config = ConfigDict(extra="ignore")
+
+    title: str = Field(min_length=1)
+    situation: str = Field(min_length=1)
+    task: str = Field(min_length=1)
+    action: str = Field(min_length=1)
+    result: str = Field(min_length=1)
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def flatten_value(cls, value):
+        return to_text(value).strip()
+
+
+class StarList(BaseModel):
+    """{"experiences": [...]} 형태의 STAR 경험 목록. 기존 프롬프트의 최상위 배열 응답도 허용"""
+    experiences: List[StarItem]
+
+    @model_validator(mode="before")
+    @classmethod
+    def wrap_list(cls, data):
+        if isinstance(data, list):
+            return {"experiences": data}
+        if isinstance(data, dict) and "experiences" not in data:
+            if all(key in data for key in ("title", "situation")):
+                return {"experiences": [data]}
+            lists = [value for value in data.values() if isinstance(value, list)]
+            if len(lists) == 1:
+                return {"experiences": lists[0]}
+        return data
+
+
+class Recommendation(BaseModel):
+    """{"ids": [2, 5, 1]} 형태의 추천 경험 ID 목록. 기존 배열 응답도 허용"""
+    ids: List[int]
+
+    @model_validator(mode="before")
+    @classmethod
+    def wrap_list(cls, data):
+        if isinstance(data, list):
+            data = {"ids": data}
+        if isinstance(data, dict) and isinstance(data.get("ids"), list):
+            data = {"ids": [
+                item.get("STARExperienceID") if isinstance(item, dict) else item for item in data["ids"]
+            ]}
+        return data
+
+
+def validate_response(response, schema):
+    """
+    응답 문자열을 JSON으로 파싱하고 schema로 검증합니다. 실패하면 ValueError(ValidationError 포함)를 발생시킵니다.
+    응답이 잘렸으면 완성된 부분만으로 검증하므로, 잘린 STAR 목록은 완성된 경험만으로 통과할 수 있습니다.
+    """
+    data, complete = loads_partial(response)
+    if not complete:
+        logger.warning("%s response was truncated; validating recovered part only", schema.__name__)
+    return schema.model_validate(data)
+
+
+def build_retry_prompt(prompt, response, error):
+    return (
+        f"{prompt}\n\n"
+        f"---\n"
+        f"이전 응답이 요구한 JSON 형식을 만족하지 않았어.\n"
+        f"이전 응답:\n{response}\n\n"
+        f"오류:\n{error}\n\n"
+        f"오류를 고쳐서 설명 없이 올바른 JSON만 다시 출력해줘."
+    )
+
+
+def predict_structured(llm, prompt, schema, fallback=None, retries=STRUCTURED_OUTPUT_RETRIES, json_mode=True):
+    """
+    LLM을 JSON mode로 호출하고 응답을 pydantic schema로 검증합니다.
+    - 검증(또는 JSON 파싱)에 실패한 경우에만 오류 내용을 프롬프트에 붙여 최대 retries번 다시 요청합니다.
+    - 그래도 실패하면 마지막 응답을 기존 파서(fallback: 응답 문자열 -> dict/list)로 파싱해 한 번 더 검증합니다.
+    - 모두 실패하면 StructuredOutputError를 발생시킵니다. (기본값 "N/A"로 저장하지 않음)
+    API 호출 자체의 예외는 그대로 전파됩니다.
+    """
+    kwargs = dict(JSON_MODE) if json_mode else {}
+    if isinstance(llm, CachedChatModel):
+        # 스키마 검증을 통과한 응답만 캐시 (잘못된 응답이 캐시되면 재시도와 다음 보강 때도 같은 응답이 재사용됨)
+        kwargs["validate"] = lambda response: validate_response(response, schema)
+    current_prompt = prompt
+    response, error = None, None
+    for attempt in range(retries + 1):
+        response = llm.predict(current_prompt, **kwargs)
+        try:
+            return validate_response(response, schema)
+        except (ValueError, ValidationError) as e:
+            error = e
+            logger.warning(
+                "Structured output validation failed for %s (attempt %s/%s): %s",
+                schema.__name__, attempt + 1, retries + 1, e
+            )
+            current_prompt = build_retry_prompt(prompt, response, e)
+
+    if fallback is not None:
+        try:
+            return schema.model_validate(fallback(response))
+        except (ValueError, ValidationError) as e:
+            error = e
+    raise StructuredOutputError(f"{schema.__name__} validation failed: {error}", response=response)
@@ -1,10 +1,16 @@
 import asyncio
 import json
 import logging
-from celery import shared_task
+import math
+from celery import chain, group, shared_task
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from .models import Company, RecruitJob, CoverLetterPrompt
+from .single_flight import LeaseHeld, run_single_flight
+from .structured_output import StructuredOutputError
 from .utils import (
+    build_company_info_prompt,
+    build_job_info_prompt,
     generate_and_save_company_info,
     generate_and_save_job_info,
     generate_and_save_cover_letter_outline,
@@ -12,64 +18,145 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# 크롤링 결과를 DB에 저장할 때 한 트랜잭션으로 묶을 기업 수
+INGEST_BATCH_SIZE = 20
+
+
+def retry_while_leased(task, label):
+    """
+    같은 보강 작업을 다른 작업이 실행 중이면(LeaseHeld) 워커 슬롯을 잡고 기다리지 않고 잠시 뒤 재시도합니다.
+    재시도 후에는 앞선 작업이 저장한 결과를 그대로 쓰고, 앞선 작업이 실패했으면 이 작업이 lease를 넘겨받습니다.
+    lease 만료 시간이 지날 때까지 재시도하므로, 앞선 워커가 죽어도 작업이 버려지지 않습니다.
+    """
+    if task.request.called_directly:
+        logger.warning("%s is already in flight in another task, skipping direct call", label)
+        return None
+    max_retries = math.ceil(settings.ENRICHMENT_LEASE_SECONDS / settings.ENRICHMENT_LEASE_RETRY_SECONDS) + 1
+    if task.request.retries >= max_retries:
+        logger.error("%s is still in flight after %s retries, giving up", label, task.request.retries)
+        return None
+    logger.info("%s is already in flight, retrying in %ss", label, settings.ENRICHMENT_LEASE_RETRY_SECONDS)
+    raise task.retry(countdown=settings.ENRICHMENT_LEASE_RETRY_SECONDS, max_retries=max_retries)
+
+def retry_or_skip(task, exc, label):
+    """
+    보강 작업 중 API/네트워크 오류 같은 예상하지 못한 예외가 나면 지수 백오프로 재시도합니다.
+    재시도 횟수를 다 쓰면 로그만 남기고 None을 반환해, 뒤에 연결된 작업(직무/문항 보강)은 계속 실행되게 합니다.
+    """
+    if not task.request.called_directly and task.request.retries < settings.ENRICHMENT_MAX_RETRIES:
+        raise task.retry(exc=exc, countdown=settings.ENRICHMENT_RETRY_BACKOFF * 2 ** task.request.retries)
+    logger.exception("%s failed, giving up: %s", label, exc)
+    return None
+
 @shared_task
-def crawl_recruitments_task(target_date_str, company_name=None):
+def crawl_recruitments_task(target_date_str, company_name=None, refresh_changed=False, end_date_str=None):
+    """
+    target_date_str(YYYYMMDD)의 채용 공고를 크롤링하여 저장합니다.
+    end_date_str을 주면 target_date_str~end_date_str 기간을 하나의 브라우저 세션으로 크롤링합니다.
+    """
     from .crawler import main  # main()는 비동기 generator wrapper
+    from .utils_crawler import load_known_recruitments
     try:
-        logger.info(f"Starting Celery task for target_date: {target_date_str}, company: {company_name}")
+        logger.info(f"Starting Celery task for target_date: {target_date_str}~{end_date_str or target_date_str}, company: {company_name}")
+        # 이미 저장된 채용 공고(employment_id)는 디테일 크롤링을 건너뜀
+        known_recruitments = load_known_recruitments()
+        async def save_batch(batch):
+            from .utils_crawler import ingest_companies
+            try:
+                await sync_to_async(ingest_companies)(batch)
+                logger.info(f"Saved data for {len(batch)} companies")
+            except Exception as e:
+                logger.error(f"Error saving batch {[c.get('company_name') for c in batch]}: {e}", exc_info=True)
+
         async def process_crawl():
-            async for company in main(target_date_str, company_name):
-                try:
-                    from .utils_crawler import save_company_data
-                    # 크롤링된 각 기업 데이터를 바로 DB에 저장
-                    await sync_to_async(save_company_data)(company)
-                    logger.info(f"Saved data for {company.get('company_name')}")
-                except Exception as e:
-                    logger.error(f"Error saving company {company.get('company_name')}: {e}", exc_info=True)
+            # 크롤링된 기업 데이터를 INGEST_BATCH_SIZE개씩 모아 한 트랜잭션으로 저장
+            batch = []
+            async for company in main(target_date_str, company_name,
+                                      end_date=end_date_str,
+                                      known_recruitments=known_recruitments,
+                                      refresh_changed=refresh_changed):
+                batch.append(company)
+                if len(batch) >= INGEST_BATCH_SIZE:
+                    await save_batch(batch)
+                    batch = []
+            if batch:
+                await save_batch(batch)
         asyncio.run(process_crawl())
-        logger.info(f"Crawling data saved for target date {target_date_str}.")
+        logger.info(f"Crawling data saved for target date {target_date_str}~{end_date_str or target_date_str}.")
         return True
     except Exception as e:
         logger.error(f"Error in Celery task: {e}", exc_info=True)
         return None
 
-@shared_task
-def generate_company_info_task(company_id):
+@shared_task(bind=True)
+def generate_company_info_task(self, company_id):
     try:
         from .models import Company
         company = Company.objects.get(id=company_id)
         if company.industry in (None, ""):
-            generate_and_save_company_info(company.name)
-            logger.info(f"Company info task executed for Company id {company_id}.")
+            # 같은 기업의 보강 작업이 동시에 여러 번 큐에 들어가도 LLM 호출은 한 번만 실행
+            executed = run_single_flight(
+                "company_info",
+                company.id,
+                build_company_info_prompt(company.name),
+                is_done=lambda: Company.objects.filter(id=company.id).exclude(industry__isnull=True).exclude(industry="").exists(),
+                compute=lambda: generate_and_save_company_info(company.name),
+            )
+            if executed:
+                logger.info(f"Company info task executed for Company id {company_id}.")
         else:
             logger.info("Company info already set for Company id %s, skipping.", company_id)
         return company.id
     except Company.DoesNotExist:
         logger.error(f"Company id {company_id} not found.")
         return "Company not found."
+    except StructuredOutputError as e:
+        # 필드를 비워 둔 채로 두어 다음 보강 때 다시 시도
+        logger.error(f"Invalid company info response for Company id {company_id}: {e}")
+        return None
+    except LeaseHeld:
+        return retry_while_leased(self, f"Company info task for Company id {company_id}")
+    except Exception as e:
+        return retry_or_skip(self, e, f"Company info task for Company id {company_id}")
 
-@shared_task
-def generate_job_info_task(recruit_job_id):
+@shared_task(bind=True)
+def generate_job_info_task(self, recruit_job_id):
     try:
         from .models import RecruitJob
         recruit_job = RecruitJob.objects.get(id=recruit_job_id)
         if recruit_job.description in (None, ""):
-            generate_and_save_job_info(
-                recruit_job.recruitment.company.name,
-                recruit_job.recruitment,
-                recruit_job.title,
-                recruit_job
+            company_name = recruit_job.recruitment.company.name
+            executed = run_single_flight(
+                "job_info",
+                recruit_job.id,
+                build_job_info_prompt(company_name, recruit_job.title),
+                is_done=lambda: RecruitJob.objects.filter(id=recruit_job.id).exclude(description__isnull=True).exclude(description="").exists(),
+                compute=lambda: generate_and_save_job_info(
+                    company_name,
+                    recruit_job.recruitment,
+                    recruit_job.title,
+                    recruit_job
+                ),
             )
-            logger.info(f"Job info task executed for RecruitJob id {recruit_job_id}.")
+            if executed:
+                logger.info(f"Job info task executed for RecruitJob id {recruit_job_id}.")
         else:
             logger.info("Job info already set for RecruitJob id %s, skipping.", recruit_job_id)
         return recruit_job.id
     except RecruitJob.DoesNotExist:
         logger.error(f"RecruitJob id {recruit_job_id} not found.")
         return "RecruitJob not found."
+    except StructuredOutputError as e:
+        # 필드를 비워 둔 채로 두어 다음 보강 때 다시 시도
+        logger.error(f"Invalid job info response for RecruitJob id {recruit_job_id}: {e}")
+        return None
+    except LeaseHeld:
+        return retry_while_leased(self, f"Job info task for RecruitJob id {recruit_job_id}")
+    except Exception as e:
+        return retry_or_skip(self, e, f"Job info task for RecruitJob id {recruit_job_id}")
 
-@shared_task
-def generate_outline_task_for_prompt(prompt_id):
+@shared_task(bind=True)
+def generate_outline_task_for_prompt(self, prompt_id):
     try:
         prompt_instance = CoverLetterPrompt.objects.get(id=prompt_id)
         generate_and_save_cover_letter_outline(prompt_instance)
@@ -78,3 +165,55 @@ def generate_outline_task_for_prompt(prompt_id):
     except CoverLetterPrompt.DoesNotExist:
         logger.error(f"CoverLetterPrompt id {prompt_id} not found.")
         return "CoverLetterPrompt not found."
+    except Exception as e:
+        return retry_or_skip(self, e, f"Outline task for CoverLetterPrompt id {prompt_id}")
+
+def build_enrichment_workflow(company_ids, recruit_job_ids, prompt_ids):
+    """
+    크롤링 배치의 보강 작업을 객체 단위 Celery 작업으로 나눈 서명(signature) 목록을 만듭니다.
+    문항 아웃라인은 기업/직무 정보를 참고하므로 기업마다 기업 → 직무들 → 각 직무의 문항들 순서로 chain을 만들고,
+    서로 다른 기업의 작업은 독립적으로 병렬 실행됩니다. (group은 chain의 마지막에만 두어 result backend 없이 동작)
+    """
+    prompts_by_job = {}
+    for prompt_id, job_id in CoverLetterPrompt.objects.filter(id__in=prompt_ids).values_list("id", "recruit_job_id"):
+        prompts_by_job.setdefault(job_id, []).append(prompt_id)
+    jobs_by_company = {}
+    for job_id, company_id in RecruitJob.objects.filter(id__in=recruit_job_ids).values_list("id", "recruitment__company_id"):
+        jobs_by_company.setdefault(company_id, []).append(job_id)
+
+    def outlines(job_id):
+        return [generate_outline_task_for_prompt.si(prompt_id) for prompt_id in prompts_by_job.pop(job_id, [])]
+
+    def job_signature(job_id):
+        prompt_signatures = outlines(job_id)
+        if not prompt_signatures:
+            return generate_job_info_task.si(job_id)
+        return chain(generate_job_info_task.si(job_id), group(prompt_signatures))
+
+    signatures = []
+    for company_id in company_ids:
+        job_signatures = [job_signature(job_id) for job_id in jobs_by_company.pop(company_id, [])]
+        if job_signatures:
+            signatures.append(chain(generate_company_info_task.si(company_id), group(job_signatures)))
+        else:
+            signatures.append(generate_company_info_task.si(company_id))
+    # 기업 정보가 이미 있는 기업의 새 직무, 이미 있는 직무의 새 문항
+    for job_ids in jobs_by_company.values():
+        signatures.extend(job_signature(job_id) for job_id in job_ids)
+    for prompt_ids_of_job in prompts_by_job.values():
+        signatures.extend(generate_outline_task_for_prompt.si(prompt_id) for prompt_id in prompt_ids_of_job)
+    return signatures
+
+@shared_task
+def enrich_crawled_batch_task(company_ids, recruit_job_ids, prompt_ids):
+    """
+    bulk 저장된 크롤링 배치의 LLM 보강 작업을 객체 단위 작업으로 나눠 등록합니다.
+    한 객체의 보강이 실패해도 다른 객체의 작업에는 영향이 없습니다.
+    """
+    signatures = build_enrichment_workflow(company_ids, recruit_job_ids, prompt_ids)
+    for signature in signatures:
+        signature.apply_async()
+    logger.info(
+        "Enrichment batch dispatched: %s companies, %s jobs, %s prompts in %s workflows",
+        len(company_ids), len(recruit_job_ids), len(prompt_ids), len(signatures)
+    )
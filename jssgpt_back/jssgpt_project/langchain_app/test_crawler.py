@@ -0,0 +1,245 @@
+import asyncio
+import json
+import os
+from unittest.mock import patch
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from . import crawler
+from .models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from .utils_crawler import ingest_companies, load_known_recruitments, save_company_data
+
+
+class CrawlDetailsConcurrentlyTest(SimpleTestCase):
+    def test_detail_pages_respect_concurrency_limit(self):
+        running = 0
+        peak = 0
+
+        async def fake_detail(context, company):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * company["delay"])
+            running -= 1
+            return None if company["company_name"] == "실패" else company
+
+        companies = [
+            {"company_name": name, "delay": delay}
+            for name, delay in [("느림", 5), ("실패", 1), ("빠름", 1), ("보통", 2)]
+        ]
+
+        async def collect():
+            return [c["company_name"] async for c in crawler.crawl_details_concurrently(None, companies, 2)]
+
+        with patch.object(crawler, "crawl_detail_page", fake_detail):
+            names = asyncio.run(collect())
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(sorted(names), ["느림", "보통", "빠름"])
+        # 끝나는 순서대로 yield 되므로 가장 느린 기업이 마지막
+        self.assertEqual(names[-1], "느림")
+
+
+class IncrementalCrawlTest(TestCase):
+    def company_data(self, **overrides):
+        data = {
+            "start_date": "20250301",
+            "end_date": "2025년 3월 16일 14:59",
+            "employment_id": "12345",
+            "link": "https://jasoseol.com/recruit/12345",
+            "company_name": "테스트기업",
+            "recruitment_title": "테스트기업 채용 공고",
+            "jobs": [{
+                "recruitment_type": "신입",
+                "recruitment_title": "백엔드",
+                "essay_questions": [{"question": "지원 동기", "limit": "(700자)"}],
+            }],
+        }
+        data["fingerprint"] = crawler.calendar_fingerprint(data)
+        data.update(overrides)
+        return data
+
+    def test_save_company_data_is_idempotent(self):
+        save_company_data(self.company_data())
+        save_company_data(self.company_data())
+        self.assertEqual(Recruitment.objects.count(), 1)
+        self.assertEqual(RecruitJob.objects.count(), 1)
+        self.assertEqual(CoverLetterPrompt.objects.count(), 1)
+        self.assertEqual(load_known_recruitments(), {"12345": self.company_data()["fingerprint"]})
+
+    def test_ingest_companies_bulk_upserts_and_enqueues_once(self):
+        save_company_data(self.company_data())
+        batch = [
+            self.company_data(end_date="2025-03-20T14:59:00+09:00", fingerprint="changed"),
+            self.company_data(employment_id="777", company_name="다른기업", link="https://jasoseol.com/recruit/777"),
+        ]
+        with patch("langchain_app.tasks.enrich_crawled_batch_task.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(10):
+                ingest_companies(batch)
+        self.assertEqual(Recruitment.objects.count(), 2)
+        self.assertEqual(RecruitJob.objects.count(), 2)
+        self.assertEqual(CoverLetterPrompt.objects.count(), 2)
+        updated = Recruitment.objects.get(custom_id="12345")
+        self.assertEqual(str(updated.end_date), "2025-03-20")
+        self.assertEqual(updated.crawl_fingerprint, "changed")
+        delay.assert_called_once()
+        company_ids, job_ids, prompt_ids = delay.call_args.args
+        self.assertEqual(len(job_ids), 1)
+        self.assertEqual(len(prompt_ids), 1)
+
+    def test_bad_row_does_not_roll_back_the_rest_of_the_batch(self):
+        # start_date가 없으면 end_date도 비어 INSERT가 실패하는 공고
+        bad = {"company_name": "불량기업", "employment_id": "555", "jobs": []}
+        with patch("langchain_app.tasks.enrich_crawled_batch_task.delay"):
+            saved = ingest_companies([self.company_data(), bad])
+        self.assertEqual([r.custom_id for r in saved], ["12345"])
+        self.assertEqual(list(Recruitment.objects.values_list("custom_id", flat=True)), ["12345"])
+
+    def test_skip_known_companies(self):
+        unchanged = self.company_data()
+        changed = self.company_data(fingerprint="changed")
+        new = self.company_data(employment_id="999")
+        known = {"12345": unchanged["fingerprint"]}
+        self.assertEqual(crawler.skip_known_companies([unchanged, new], known), [new])
+        self.assertEqual(crawler.skip_known_companies([unchanged, changed], known, refresh_changed=True), [changed])
+
+    def test_fingerprint_matches_across_modes_and_detects_deadline_change(self):
+        api_company = crawler.companies_from_calendar_json(
+            [(CALENDAR_URL, load_calendar_list())], "20250301", "20250331"
+        )[0]
+        dom_company = {
+            "start_date": "20250304",
+            "end_date": "20250317",  # 캘린더의 마감("끝") 라벨
+            "employment_id": "68801",
+            "link": "https://jasoseol.com/recruit/68801",
+            "company_name": "가나전자",
+            "recruitment_title": "가나전자 채용 공고",
+            "jobs": [],
+        }
+        fingerprint = crawler.calendar_fingerprint(api_company)
+        dom_company["fingerprint"] = crawler.calendar_fingerprint(dom_company)
+        self.assertEqual(dom_company["fingerprint"], fingerprint)
+        extended = dict(dom_company, end_date="20250324")
+        extended["fingerprint"] = crawler.calendar_fingerprint(extended)
+        self.assertNotEqual(extended["fingerprint"], fingerprint)
+        known = {"68801": fingerprint}
+        self.assertEqual(crawler.skip_known_companies([dom_company], known, refresh_changed=True), [])
+        self.assertEqual(crawler.skip_known_companies([extended], known, refresh_changed=True), [extended])
+
+
+class CustomIdAllocationTest(TestCase):
+    def test_recruitment_save_allocates_sequential_ids(self):
+        company = Company.objects.create(name="순번기업")
+        first = Recruitment.objects.create(company=company, title="1차", start_date="2025-03-01", end_date="2025-03-08")
+        second = Recruitment.objects.create(company=company, title="2차", start_date="2025-03-01", end_date="2025-03-08")
+        self.assertEqual([first.custom_id, second.custom_id], ["순번기업-1", "순번기업-2"])
+        # 공고가 삭제되어도 순번은 재사용하지 않음
+        first.delete()
+        third = Recruitment.objects.create(company=company, title="3차", start_date="2025-03-01", end_date="2025-03-08")
+        self.assertEqual(third.custom_id, "순번기업-3")
+
+    def test_ingest_allocates_block_for_rows_without_employment_id(self):
+        rows = [
+            {"start_date": "20250301", "company_name": "순번기업", "link": f"https://jasoseol.com/{i}", "jobs": []}
+            for i in range(3)
+        ]
+        with patch("langchain_app.tasks.enrich_crawled_batch_task.delay"):
+            ingest_companies(rows)
+        self.assertEqual(
+            sorted(Recruitment.objects.values_list("custom_id", flat=True)),
+            ["순번기업-1", "순번기업-2", "순번기업-3"],
+        )
+        self.assertEqual(Company.objects.get(name="순번기업").recruitment_seq, 3)
+
+
+class MonthRangeTest(SimpleTestCase):
+    def test_month_range_spans_year_boundary(self):
+        self.assertEqual(crawler.month_range("20241215", "20250210"), ["202412", "202501", "202502"])
+        self.assertEqual(crawler.month_range("20250301", "20250331"), ["202503"])
+
+
+CALENDAR_URL = "https://jasoseol.com/employment/calendar_list.json"
+
+
+def load_calendar_list():
+    with open(os.path.join(os.path.dirname(__file__), "test_data", "calendar_list.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+class ApiCaptureParsingTest(SimpleTestCase):
+    def test_companies_from_calendar_json(self):
+        companies = crawler.companies_from_calendar_json(
+            [(CALENDAR_URL, load_calendar_list())], "20250301", "20250331"
+        )
+        # 중첩된 직무(employments)나 관심 공고(current_user_favorites)는 채용 공고로 취급하지 않음
+        self.assertEqual([company["employment_id"] for company in companies], ["68801", "68842"])
+        self.assertEqual(companies[0], {
+            "start_date": "20250304",
+            "end_date": "2025-03-17T17:00:00.000+09:00",
+            "employment_id": "68801",
+            "link": "https://jasoseol.com/recruit/68801",
+            "company_name": "가나전자",
+            "recruitment_title": "2025년 상반기 신입사원 공개채용",
+            "jobs": [],
+        })
+        self.assertEqual(companies[1]["recruitment_title"], "다라상사 채용 공고")
+
+    def test_other_responses_and_unexpected_shapes_fall_back_to_dom(self):
+        payload = load_calendar_list()
+        self.assertEqual(crawler.companies_from_calendar_json(
+            [("https://jasoseol.com/banner/list.json", payload)], "20250301", "20250331"
+        ), [])
+        del payload["employment"][1]["name"]
+        self.assertEqual(crawler.companies_from_calendar_json([(CALENDAR_URL, payload)], "20250301", "20250331"), [])
+        self.assertEqual(crawler.companies_from_calendar_json(
+            [(CALENDAR_URL, {"data": [{"id": 1, "name": "배너", "start_time": "2025-03-04"}]})], "20250301", "20250331"
+        ), [])
+
+    def test_jobs_from_detail_json(self):
+        payload = {"data": {"id": 101, "end_time": "2025-03-16T14:59:00+09:00", "employments": [
+            {"division": "신입", "field": "백엔드", "questions": [
+                {"question": "지원 동기를 작성해주세요.", "max_length": 700},
+                {"question": "", "max_length": 500},
+            ]},
+        ]}}
+        entry, jobs = crawler.jobs_from_detail_json([("https://jasoseol.com/recruit/101", payload)], "101")
+        self.assertEqual(entry["end_time"], "2025-03-16T14:59:00+09:00")
+        self.assertEqual(jobs, [{
+            "recruitment_type": "신입",
+            "recruitment_title": "백엔드",
+            "essay_questions": [{"question": "지원 동기를 작성해주세요.", "limit": "(700자)"}],
+        }])
+        self.assertEqual(crawler.jobs_from_detail_json([("https://jasoseol.com/recruit/101", payload)], "999"), (None, []))
+
+
+class EnrichmentWorkflowTest(TestCase):
+    def setUp(self):
+        with patch("langchain_app.tasks.enrich_crawled_batch_task.delay"):
+            for name, employment_id in [("실패기업", "1"), ("정상기업", "2")]:
+                ingest_companies([{
+                    "start_date": "20250301", "employment_id": employment_id, "company_name": name,
+                    "jobs": [{"recruitment_title": "백엔드", "essay_questions": [{"question": "지원 동기"}]}],
+                }])
+        self.company_ids = list(Company.objects.order_by("name").values_list("id", flat=True))
+        self.job_ids = list(RecruitJob.objects.values_list("id", flat=True))
+        self.prompt_ids = list(CoverLetterPrompt.objects.values_list("id", flat=True))
+
+    @override_settings(ENRICHMENT_RETRY_BACKOFF=0)
+    def test_one_failing_company_does_not_stop_other_enrichment(self):
+        from .tasks import build_enrichment_workflow
+
+        def company_info(name):
+            if name == "실패기업":
+                raise RuntimeError("rate limited")
+            Company.objects.filter(name=name).update(industry="반도체")
+
+        signatures = build_enrichment_workflow(self.company_ids, self.job_ids, self.prompt_ids)
+        self.assertEqual(len(signatures), 2)
+        with patch("langchain_app.tasks.generate_and_save_company_info", side_effect=company_info) as company, \
+                patch("langchain_app.tasks.generate_and_save_job_info") as job, \
+                patch("langchain_app.tasks.generate_and_save_cover_letter_outline") as outline:
+            for signature in signatures:
+                signature.apply()
+        # 실패한 기업은 재시도 후 포기하고, 두 기업의 직무/문항 보강은 모두 실행됨
+        self.assertEqual(company.call_count, 1 + settings.ENRICHMENT_MAX_RETRIES + 1)
+        self.assertEqual(job.call_count, 2)
+        self.assertEqual(outline.call_count, 2)
@@ -0,0 +1,46 @@
+import json
+from django.test import SimpleTestCase
+from .json_stream import loads, loads_partial
+from .structured_output import StarList, validate_response
+from .utils import parse_langchain_response
+
+STARS = [
+    {"title": f"경험 {i}", "situation": "상황\n두 줄", "task": "과제", "action": "행동", "result": "결과"}
+    for i in range(3)
+]
+
+
+class LoadsPartialTest(SimpleTestCase):
+    def test_complete_json_with_fence_and_trailing_text(self):
+        response = "설명입니다.\n```json\n" + json.dumps({"ids": [3, 1]}) + "\n```\n감사합니다."
+        self.assertEqual(loads_partial(response), ({"ids": [3, 1]}, True))
+        self.assertEqual(loads('{"a": [1, 2,], "b": "x",}'), {"a": [1, 2], "b": "x"})
+
+    def test_truncated_array_keeps_complete_items(self):
+        text = json.dumps({"experiences": STARS}, ensure_ascii=False)
+        cut = text[: text.index('"경험 2"') + 25]
+        value, complete = loads_partial("```json\n" + cut)
+        self.assertFalse(complete)
+        # 잘린 마지막 경험은 버리고 완성된 경험만 남김
+        self.assertEqual(value, {"experiences": STARS[:2]})
+        self.assertEqual(loads(text[: text.index('"경험 2"') - 12]), {"experiences": STARS[:2]})
+        # 구조화 출력 검증도 완성된 경험으로 통과 (재생성 요청 불필요)
+        self.assertEqual(len(validate_response(cut, StarList).experiences), 2)
+
+    def test_number_at_end_of_input_is_incomplete(self):
+        self.assertEqual(loads_partial('{"a": "x", "b": 12'), ({"a": "x"}, False))
+        self.assertEqual(loads('{"ids": [3, 1'), {"ids": [3]})
+        self.assertEqual(loads('{"ids": [3, 12]}'), {"ids": [3, 12]})
+
+    def test_star_item_requires_all_fields(self):
+        with self.assertRaises(ValueError):
+            validate_response(json.dumps([{"title": "경험", "situation": "상황"}], ensure_ascii=False), StarList)
+
+    def test_truncated_object_keeps_complete_keys(self):
+        response = '{"직무 설명": "백엔드\n개발", "수행_업무": ["API", "운영"], "필요한 기술": "Pyth'
+        self.assertEqual(parse_langchain_response(response), {"직무 설명": "백엔드\n개발", "수행 업무": "API, 운영"})
+
+    def test_text_without_json_raises(self):
+        for response in ["", "- 산업: 반도체", "- 산업: [반도체"]:
+            with self.assertRaises(json.JSONDecodeError):
+                loads_partial(response)
@@ -0,0 +1,62 @@
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from .llm_cache import CachedChatModel, make_cache_key
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'llm': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'llm-test'},
+}
+
+
+class FakeLLM:
+    def __init__(self, model_name="gpt-test", temperature=0):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.calls = 0
+
+    def predict(self, text, **kwargs):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CachedChatModelTest(SimpleTestCase):
+    def setUp(self):
+        caches['llm'].clear()
+
+    def test_same_prompt_is_served_from_cache(self):
+        fake = FakeLLM()
+        llm = CachedChatModel(fake)
+        self.assertEqual(llm.predict("삼성전자에 대해 조사해줘"), "response 1")
+        self.assertEqual(llm.predict("삼성전자에 대해 조사해줘"), "response 1")
+        self.assertEqual(fake.calls, 1)
+
+    def test_key_depends_on_model_and_temperature(self):
+        self.assertNotEqual(make_cache_key("a", 0, "p"), make_cache_key("b", 0, "p"))
+        self.assertNotEqual(make_cache_key("a", 0, "p"), make_cache_key("a", 0.8, "p"))
+        self.assertNotEqual(make_cache_key("a", 0, "p"), make_cache_key("a", 0, "q"))
+
+    def test_use_cache_false_bypasses_cache(self):
+        fake = FakeLLM()
+        llm = CachedChatModel(fake)
+        llm.predict("prompt")
+        self.assertEqual(llm.predict("prompt", use_cache=False), "response 2")
+        self.assertEqual(llm.model_name, "gpt-test")
+
+    def test_structured_output_caches_only_valid_responses(self):
+        from .structured_output import Recommendation, StructuredOutputError, predict_structured
+        responses = iter(["N/A", "N/A", "N/A", '{"ids": [3]}'])
+
+        class ScriptedLLM(FakeLLM):
+            def predict(self, text, **kwargs):
+                self.calls += 1
+                return next(responses)
+
+        fake = ScriptedLLM()
+        llm = CachedChatModel(fake)
+        with self.assertRaises(StructuredOutputError):
+            predict_structured(llm, "prompt", Recommendation)
+        # 실패한 응답은 캐시되지 않으므로 다음 보강 때 모델을 다시 호출
+        self.assertEqual(predict_structured(llm, "prompt", Recommendation).ids, [3])
+        self.assertEqual(predict_structured(llm, "prompt", Recommendation).ids, [3])
+        self.assertEqual(fake.calls, 4)
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+from .fake_llm import FakeChatModel as FakeLLM, FakeLLMError
+from .llm_cache import CachedChatModel, make_cache_key
+from .llm_gateway import (
+    CallerLimiter,
+    GatewayChatModel,
+    TokenBucket,
+    get_chat_model,
+    get_openai_client,
+    reset_limiters,
+)
+from .structured_output import CompanyInfo, Recommendation, predict_structured
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeChatModel:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, text, **kwargs):
+        self.calls.append((text, kwargs))
+        return f"response to {text}"
+
+    async def apredict(self, text, **kwargs):
+        return self.predict(text, **kwargs)
+
+
+class TokenBucketTest(SimpleTestCase):
+    def test_reserve_returns_wait_once_burst_is_used(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)  # 초당 1개
+        self.assertEqual([bucket.reserve() for _ in range(60)], [0.0] * 60)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        # 대기 중인 호출은 차례대로 예약됨
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+        clock.now = 10
+        self.assertEqual(bucket.reserve(), 0.0)
+
+
+class CallerLimiterTest(SimpleTestCase):
+    def test_concurrency_is_capped_per_caller(self):
+        limiter = CallerLimiter({"default": 2, "draft": 1})
+        self.assertIs(limiter.semaphore("draft"), limiter.semaphore("draft"))
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def work():
+            with limiter.semaphore("unknown"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(peak[0], 2)
+
+    def test_async_acquire_waits_for_release_and_cancel_returns_slot(self):
+        limiter = CallerLimiter({"default": 1})
+        semaphore = limiter.semaphore("draft")
+
+        async def scenario():
+            semaphore.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire_async("draft"))
+            await asyncio.sleep(0.02)
+            self.assertFalse(waiter.done())
+            semaphore.release()
+            self.assertIs(await asyncio.wait_for(waiter, 1), semaphore)
+
+            # 대기 중 취소된 호출이 나중에 잡은 슬롯은 바로 반납됨
+            cancelled = asyncio.ensure_future(limiter.acquire_async("draft"))
+            await asyncio.sleep(0.02)
+            cancelled.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await cancelled
+            semaphore.release()
+            self.assertIs(await asyncio.wait_for(limiter.acquire_async("draft"), 1), semaphore)
+
+        async_to_sync(scenario)()
+
+
+@override_settings(OPENAI_API_KEY="sk-test", LLM_REQUESTS_PER_MINUTE=1000, LLM_TOKENS_PER_MINUTE=10 ** 7)
+class GatewayChatModelTest(SimpleTestCase):
+    def setUp(self):
+        reset_limiters()
+        self.addCleanup(reset_limiters)
+
+    def test_chat_model_is_created_lazily_on_shared_client(self):
+        gateway = GatewayChatModel("gpt-test", temperature=0)
+        self.assertIsNone(gateway._chat_model)
+        self.assertIs(gateway.chat_model.client, get_openai_client().chat.completions)
+        self.assertIs(GatewayChatModel("other").chat_model.client, gateway.chat_model.client)
+
+    def test_sync_and_async_calls_pass_through(self):
+        gateway = GatewayChatModel("gpt-test", temperature=0)
+        fake = FakeChatModel()
+        gateway.build_chat_model = lambda async_client=None: fake
+        self.assertEqual(gateway.predict("a", response_format={"type": "json_object"}), "response to a")
+        self.assertEqual(async_to_sync(gateway.apredict)("b"), "response to b")
+        self.assertEqual(fake.calls, [("a", {"response_format": {"type": "json_object"}}), ("b", {})])
+
+    def test_get_chat_model_shares_instances(self):
+        cached = get_chat_model("gpt-test", temperature=0, caller="enrichment", cache=True)
+        self.assertIsInstance(cached, CachedChatModel)
+        self.assertIs(cached, get_chat_model("gpt-test", temperature=0, caller="enrichment", cache=True))
+        self.assertEqual(cached.model_name, "gpt-test")
+        self.assertIsNot(get_chat_model("gpt-test", temperature=0, caller="draft"), cached.llm)
+
+    @override_settings(LLM_BACKEND="fake", LLM_FAKE_LATENCY_MS=0, LLM_FAKE_LATENCY_JITTER_MS=0)
+    def test_fake_backend_returns_schema_valid_responses(self):
+        gateway = GatewayChatModel("gpt-test", temperature=0)
+        self.assertIsInstance(gateway.chat_model, FakeLLM)
+        self.assertEqual(CachedChatModel(gateway).cache_key("p"), make_cache_key("gpt-test", 0, "p", backend="fake"))
+        company = predict_structured(gateway, "삼성전자에 대해 조사해줘. 회사 비전", CompanyInfo)
+        self.assertIn("삼성전자", company.vision)
+        recommendation = predict_structured(gateway, "경험 ID\n2. STAR 형식의 경험 목록\n7: 해커톤: s\n3: 인턴: s", Recommendation)
+        self.assertEqual(recommendation.ids, [7, 3])
+        tokens = async_to_sync(self._collect)(gateway.astream("자기소개서 초안"))
+        self.assertTrue("".join(tokens).startswith("가짜 LLM 응답"))
+
+    @override_settings(LLM_BACKEND="fake", LLM_FAKE_LATENCY_MS=0, LLM_FAKE_LATENCY_JITTER_MS=0, LLM_FAKE_FAILURE_RATE=1)
+    def test_fake_backend_failure_injection(self):
+        with self.assertRaises(FakeLLMError):
+            GatewayChatModel("gpt-test").predict("prompt")
+
+    async def _collect(self, stream):
+        return [chunk.content async for chunk in stream]
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from unittest.mock import ANY, Mock, patch
+from celery.exceptions import Retry
+from django.conf import settings
+from django.test import TestCase
+from django.utils import timezone
+from .models import Company, EnrichmentLease
+from .single_flight import acquire_lease, lease_key, release_lease, run_single_flight
+from .tasks import generate_company_info_task
+from .utils import build_company_info_prompt
+
+
+class EnrichmentLeaseTest(TestCase):
+    def test_only_one_holder_until_released_or_expired(self):
+        key = lease_key("company_info", 1, "prompt")
+        self.assertNotEqual(key, lease_key("company_info", 1, "other prompt"))
+        self.assertTrue(acquire_lease(key, "company_info", 1))
+        self.assertFalse(acquire_lease(key, "company_info", 1))
+        release_lease(key)
+        self.assertTrue(acquire_lease(key, "company_info", 1))
+        # 워커가 죽어 남은 lease는 만료 후 다시 잡을 수 있음
+        EnrichmentLease.objects.filter(key=key).update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertTrue(acquire_lease(key, "company_info", 1))
+
+
+class CompanyInfoSingleFlightTest(TestCase):
+    def setUp(self):
+        with patch("langchain_app.signals.generate_company_info_task.delay"):
+            self.company = Company.objects.create(name="테스트기업")
+        self.key = lease_key("company_info", self.company.id, build_company_info_prompt(self.company.name))
+
+    def hold_lease(self):
+        self.assertTrue(acquire_lease(self.key, "company_info", self.company.id))
+
+    def test_duplicate_task_retries_instead_of_waiting(self):
+        self.hold_lease()
+        with patch.object(generate_company_info_task, "retry", side_effect=Retry()) as retry, \
+                patch("langchain_app.tasks.generate_and_save_company_info") as generate:
+            result = generate_company_info_task.apply(args=[self.company.id])
+        self.assertEqual(result.state, "RETRY")
+        retry.assert_called_once_with(countdown=settings.ENRICHMENT_LEASE_RETRY_SECONDS, max_retries=ANY)
+        generate.assert_not_called()
+
+    def test_retry_reuses_result_saved_by_holder(self):
+        # 앞선 작업이 결과를 저장하고 lease를 놓은 뒤 재시도된 작업은 LLM을 호출하지 않음
+        Company.objects.filter(id=self.company.id).update(industry="반도체")
+        with patch("langchain_app.tasks.generate_and_save_company_info") as generate:
+            self.assertEqual(generate_company_info_task.apply(args=[self.company.id]).result, self.company.id)
+        generate.assert_not_called()
+
+    def test_done_check_after_acquiring_lease(self):
+        # is_done() 확인 직후 앞선 작업이 끝나고 lease를 놓은 경우에도 다시 계산하지 않음
+        done = iter([False, True])
+        compute = Mock()
+        self.assertFalse(run_single_flight("company_info", self.company.id, "prompt", lambda: next(done), compute))
+        compute.assert_not_called()
+        self.assertFalse(EnrichmentLease.objects.exists())
+
+    def test_waiter_takes_over_when_holder_fails(self):
+        self.hold_lease()
+        release_lease(self.key)  # 앞선 작업이 결과를 저장하지 못하고 끝남
+        with patch("langchain_app.tasks.generate_and_save_company_info") as generate:
+            generate_company_info_task.apply(args=[self.company.id])
+        generate.assert_called_once_with("테스트기업")
+        self.assertFalse(EnrichmentLease.objects.exists())
@@ -0,0 +1,74 @@
+import json
+from django.test import SimpleTestCase
+from .structured_output import (
+    JSON_MODE,
+    CompanyInfo,
+    Recommendation,
+    StarList,
+    StructuredOutputError,
+    predict_structured,
+)
+
+COMPANY = {
+    "산업": "반도체",
+    "회사_비전": "초격차",
+    "미션": ["기술 혁신", "인재 양성"],
+    "기업 문화와 인재상": {"문화": "도전", "인재상": "몰입"},
+    "최근 주요 성과": "HBM 양산",
+    "현재 주요 이슈": "수요 둔화",
+}
+
+
+class ScriptedLLM:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def predict(self, text, **kwargs):
+        self.calls.append((text, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class SchemaTest(SimpleTestCase):
+    def test_company_info_accepts_korean_aliases_and_flattens_values(self):
+        wrapped = json.dumps({"삼성전자": COMPANY}, ensure_ascii=False)
+        info = CompanyInfo.model_validate(json.loads(wrapped))
+        self.assertEqual(info.vision, "초격차")
+        self.assertEqual(info.mission, "기술 혁신, 인재 양성")
+        self.assertEqual(info.core_values, "문화: 도전, 인재상: 몰입")
+
+    def test_legacy_array_shapes_are_accepted(self):
+        stars = StarList.model_validate([{"title": "해커톤", "situation": "s", "task": "t", "action": "a", "result": "r"}])
+        self.assertEqual(stars.experiences[0].title, "해커톤")
+        self.assertEqual(Recommendation.model_validate([{"STARExperienceID": "3"}, 1]).ids, [3, 1])
+
+
+class PredictStructuredTest(SimpleTestCase):
+    def test_valid_response_uses_json_mode_once(self):
+        llm = ScriptedLLM("```json\n" + json.dumps(COMPANY, ensure_ascii=False) + "\n```")
+        self.assertEqual(predict_structured(llm, "prompt", CompanyInfo).industry, "반도체")
+        self.assertEqual(llm.calls, [("prompt", JSON_MODE)])
+
+    def test_retries_only_on_validation_failure(self):
+        incomplete = json.dumps({"산업": "반도체"}, ensure_ascii=False)
+        llm = ScriptedLLM(incomplete, json.dumps(COMPANY, ensure_ascii=False))
+        self.assertEqual(predict_structured(llm, "prompt", CompanyInfo).key_issues, "수요 둔화")
+        self.assertEqual(len(llm.calls), 2)
+        self.assertIn("회사 비전", llm.calls[1][0])
+
+        llm = ScriptedLLM(RuntimeError("rate limited"))
+        with self.assertRaises(RuntimeError):
+            predict_structured(llm, "prompt", CompanyInfo)
+        self.assertEqual(len(llm.calls), 1)
+
+    def test_falls_back_to_legacy_parser_then_raises(self):
+        llm = ScriptedLLM("2, 5", "2, 5", "2, 5")
+        parsed = predict_structured(llm, "prompt", Recommendation, fallback=lambda r: [int(x) for x in r.split(",")])
+        self.assertEqual(parsed.ids, [2, 5])
+
+        llm = ScriptedLLM("N/A", "N/A")
+        with self.assertRaises(StructuredOutputError):
+            predict_structured(llm, "prompt", CompanyInfo, fallback=lambda r: {}, retries=1)
@@ -0,0 +1,83 @@
+import datetime
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from .models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+
+
+class RecruitmentEventsTest(TestCase):
+    url = "/api/recruitment-events/"
+
+    def setUp(self):
+        company = Company.objects.create(name="캘린더기업", industry="IT")
+        other = Company.objects.create(name="다른기업", industry="IT")
+        for day in (3, 3, 10, 20):
+            Recruitment.objects.create(
+                company=company, title=f"3월 {day}일 공고",
+                start_date=datetime.date(2025, 3, day), end_date=datetime.date(2025, 3, day) + datetime.timedelta(days=7),
+            )
+        # 2월에 시작해 3월에 끝나는 공고는 3월 달력에 표시되어야 함
+        Recruitment.objects.create(company=other, title="2월 공고", start_date=datetime.date(2025, 2, 25), end_date=datetime.date(2025, 3, 2))
+        Recruitment.objects.create(company=other, title="5월 공고", start_date=datetime.date(2025, 5, 1), end_date=datetime.date(2025, 5, 8))
+
+    def test_window_and_keyset_pagination(self):
+        params = {"start": "2025-03-01", "end": "2025-03-31", "limit": 2}
+        titles = []
+        response = self.client.get(self.url, params)
+        while True:
+            data = response.json()
+            titles += [event["recruitment_title"] for event in data["results"]]
+            if not data["next_cursor"]:
+                break
+            response = self.client.get(self.url, {**params, "cursor": data["next_cursor"]})
+        self.assertEqual(titles, ["2월 공고", "3월 3일 공고", "3월 3일 공고", "3월 10일 공고", "3월 20일 공고"])
+
+    def test_company_filter(self):
+        response = self.client.get(self.url, {"start": "2025-03-01", "end": "2025-03-31", "company": "다른"})
+        self.assertEqual([e["recruitment_title"] for e in response.json()["results"]], ["2월 공고"])
+
+    def test_unchanged_window_returns_304(self):
+        params = {"start": "2025-03-01", "end": "2025-03-31"}
+        etag = self.client.get(self.url, params)["ETag"]
+        self.assertEqual(self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Recruitment.objects.filter(title="3월 10일 공고").first().save()
+        self.assertEqual(self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_invalid_window(self):
+        response = self.client.get(self.url, {"start": "2025-03-31", "end": "2025-03-01"})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'recruitment': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'recruitment-test'},
+})
+class RecruitmentDetailCacheTest(TestCase):
+    def setUp(self):
+        caches['recruitment'].clear()
+        company = Company.objects.create(name="캐시기업", industry="IT")
+        self.recruitment = Recruitment.objects.create(
+            company=company, title="캐시 공고", start_date=datetime.date(2025, 3, 1), end_date=datetime.date(2025, 3, 8)
+        )
+        self.job = RecruitJob.objects.create(recruitment=self.recruitment, title="백엔드", description="설명")
+        self.prompt = CoverLetterPrompt.objects.create(recruit_job=self.job, question_text="지원 동기", outline="개요")
+        self.url = f"/api/recruitments/{self.recruitment.id}/"
+
+    def test_detail_is_served_from_cache(self):
+        first = self.client.get(self.url).json()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).json(), first)
+
+    def test_prompt_change_invalidates_detail(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.prompt.question_text = "입사 후 포부"
+            self.prompt.save()
+        essays = self.client.get(self.url).json()["recruitments"][0]["essays"]
+        self.assertEqual(essays[0]["question_text"], "입사 후 포부")
+
+    def test_job_delete_invalidates_detail(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.delete()
+        self.assertEqual(self.client.get(self.url).json()["recruitments"], [])
+
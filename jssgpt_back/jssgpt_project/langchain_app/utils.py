@@ -1,19 +1,15 @@
-import os
 import json
+import logging
 import re
-from dotenv import load_dotenv
-from langchain_community.chat_models import ChatOpenAI
 from .models import Company, RecruitJob, CoverLetterPrompt
+from .llm_gateway import get_chat_model
+from .json_stream import loads as loads_json
+from .structured_output import CompanyInfo, JobInfo, predict_structured
 
-# 환경 변수 로드
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# OpenAI API 키 가져오기
-openai_api_key = os.getenv("OPENAI_API_KEY")
-
-# OpenAI 설정
-llm = ChatOpenAI(model="gpt-4.1-2025-04-14", temperature=0, openai_api_key=openai_api_key)
-search_llm = ChatOpenAI(model="gpt-4o-search-preview-2025-03-11", temperature=None, openai_api_key=openai_api_key)
+# 공용 LLM 게이트웨이 모델 (동일 프롬프트 재호출을 막기 위해 응답 캐시를 앞단에 둠)
+llm = get_chat_model("gpt-4.1-2025-04-14", temperature=0, caller="enrichment", cache=True)
 
 def clean_json_response(response):
     """
@@ -28,13 +24,12 @@ def clean_json_response(response):
 
 def parse_response(response):
     """
-    응답 문자열을 정리한 후 JSON으로 파싱합니다.
+    응답 문자열에서 JSON을 파싱합니다. (코드 블록/잘린 응답 허용)
     """
-    cleaned = clean_json_response(response)
     try:
-        return json.loads(cleaned)
+        return loads_json(response)
     except json.JSONDecodeError:
-        print("[ERROR] JSONDecodeError in parse_response")
+        logger.error("JSONDecodeError in parse_response")
         return {}
 
 def flatten_json(data):
@@ -62,12 +57,12 @@ def flatten_json(data):
 def parse_company_info(response):
     """
     LangChain 응답을 정리하고, JSON 파싱 후 평탄화합니다.
-    JSON 파싱에 실패하면 fallback 방식으로 라인 단위 파싱을 사용합니다.
+    응답이 잘렸으면 완성된 키만 복구하고, JSON이 아예 없으면 fallback 방식으로 라인 단위 파싱을 사용합니다.
     만약 최상위 JSON 딕셔너리에 단일 키가 있고 그 값이 dict이면, 그 내부 딕셔너리를 사용합니다.
     """
     cleaned = clean_json_response(response)
     try:
-        data = json.loads(cleaned)
+        data = loads_json(response)
         # 최상위 딕셔너리에 단일 키가 있고, 해당 값이 dict인 경우 내부로 이동
         if isinstance(data, dict) and len(data) == 1:
             inner = list(data.values())[0]
@@ -100,12 +95,12 @@ def parse_company_info(response):
 def parse_langchain_response(response):
     """
     LangChain 응답을 정리하고, JSON 파싱 후 평탄화합니다.
-    파싱에 성공하면, 키의 언더바("_")를 공백(" ")으로 치환하여 반환합니다.
-    JSON 파싱에 실패하면, 기존 문자열 기반 파싱 방식을 사용하고 동일하게 키를 정규화합니다.
+    파싱에 성공하면, 키의 언더바("_")를 공백(" ")으로 치환하여 반환합니다. (잘린 응답은 완성된 키만 복구)
+    JSON이 아예 없으면, 기존 문자열 기반 파싱 방식을 사용하고 동일하게 키를 정규화합니다.
     """
     cleaned = clean_json_response(response)
     try:
-        data = json.loads(cleaned)
+        data = loads_json(response)
         flattened = flatten_json(data)
         # 언더바를 공백으로 치환하여 키 정규화
         normalized = { k.replace("_", " "): v for k, v in flattened.items() }
@@ -139,11 +134,11 @@ def parse_langchain_response(response):
             print(f"[ERROR] Failed to parse LangChain response: {e}")
         return parsed_response
 
-def generate_and_save_company_info(company_name):
+def build_company_info_prompt(company_name):
     """
-    기업 정보를 LangChain으로 생성하고 DB에 저장합니다.
+    기업 정보 조사 프롬프트를 구성합니다.
     """
-    prompt = f"""
+    return f"""
     {company_name}에 대해 조사해줘. 다음 사항을 포함해서 알려줘:
 
     - 산업: 해당 기업이 속한 산업의 동향과 시장 상황.
@@ -154,29 +149,34 @@ def generate_and_save_company_info(company_name):
     - 현재 주요 이슈: 회사가 직면한 도전이나 업계의 이슈, 혹은 최신 뉴스.
 
     각 항목을 지원자가 자기소개서 작성 시 참고할 수 있도록 자세하고 명확하게 정리해줘.
-    단, json 형식으로 출력해줘.
+    단, json 형식으로 출력해줘. 키는 "산업", "회사 비전", "미션", "기업 문화와 인재상", "최근 주요 성과", "현재 주요 이슈"를 사용하고,
+    각 값은 문자열로 작성해줘.
+    """
+
+def generate_and_save_company_info(company_name):
+    """
+    기업 정보를 LangChain으로 생성하고 DB에 저장합니다.
     """
-    response = llm.predict(prompt)
-    print(f"[DEBUG] LangChain Response for Company: {response}")
-    parsed_response = parse_company_info(response)
-    print(f"[DEBUG] Parsed Response for Company: {parsed_response}")
+    prompt = build_company_info_prompt(company_name)
+    # JSON mode + 스키마 검증 (실패 시에만 재요청, 마지막으로 기존 파서 사용). 실패하면 StructuredOutputError
+    info = predict_structured(llm, prompt, CompanyInfo, fallback=parse_company_info)
+    print(f"[DEBUG] Parsed Response for Company: {info}")
     company, created = Company.objects.get_or_create(name=company_name)
-    company.industry = parsed_response.get("산업", "N/A")
-    company.vision = parsed_response.get("회사 비전", "N/A")
-    company.mission = parsed_response.get("미션", "N/A")
-    company.core_values = parsed_response.get("기업 문화와 인재상", "N/A")
-    company.recent_achievements = parsed_response.get("최근 주요 성과", "N/A")
-    company.key_issues = parsed_response.get("현재 주요 이슈", "N/A")
+    company.industry = info.industry
+    company.vision = info.vision
+    company.mission = info.mission
+    company.core_values = info.core_values
+    company.recent_achievements = info.recent_achievements
+    company.key_issues = info.key_issues
     company.save()
     print(f"[DEBUG] Saved Company: {company}")
     return company
 
-def generate_and_save_job_info(company_name, recruitment, job_title, recruit_job_instance):
+def build_job_info_prompt(company_name, job_title):
     """
-    회사명, 채용 공고, 직무명을 받아 LangChain을 통해 정보를 생성하고,
-    기존 RecruitJob 인스턴스를 업데이트합니다.
+    직무 정보 조사 프롬프트를 구성합니다.
     """
-    prompt = f"""
+    return f"""
     {company_name}의 {job_title} 직무에 대해 조사해줘. 아래 사항을 중심으로 자세히 알려줘:
 
     - 직무 설명: 해당 직무의 기본적인 역할과 책임이 무엇인지.
@@ -186,18 +186,25 @@ def generate_and_save_job_info(company_name, recruitment, job_title, recruit_job
     - 필요 강점: 이 직무에서 두각을 나타내기 위해 요구되는 성향이나 강점들.
 
     위 정보를 정리할 때, 지원자가 자기소개서에 본인의 어떤 역량과 강점을 강조하면 좋을지도 함께 제안해줘.
-    단, json형식으로 출력해줘.
+    단, json형식으로 출력해줘. 키는 "직무 설명", "수행 업무", "필요한 기술", "관련 소프트 스킬", "필요 강점"을 사용하고,
+    각 값은 문자열로 작성해줘.
+    """
+
+def generate_and_save_job_info(company_name, recruitment, job_title, recruit_job_instance):
+    """
+    회사명, 채용 공고, 직무명을 받아 LangChain을 통해 정보를 생성하고,
+    기존 RecruitJob 인스턴스를 업데이트합니다.
     """
-    response = llm.predict(prompt)
-    print(f"[DEBUG] LangChain Response for Job: {response}")
-    parsed_data = parse_langchain_response(response)
-    print(f"[DEBUG] Parsed Response for Job: {parsed_data}")
-    
-    recruit_job_instance.description = parsed_data.get("직무 설명", "N/A")
-    recruit_job_instance.required_skills = parsed_data.get("필요한 기술", "N/A")
-    recruit_job_instance.soft_skills = parsed_data.get("관련 소프트 스킬", "N/A")
-    recruit_job_instance.key_roles = parsed_data.get("수행 업무", "N/A")
-    recruit_job_instance.related_technologies = parsed_data.get("필요 강점", "N/A")
+    prompt = build_job_info_prompt(company_name, job_title)
+    # JSON mode + 스키마 검증 (실패 시에만 재요청, 마지막으로 기존 파서 사용). 실패하면 StructuredOutputError
+    info = predict_structured(llm, prompt, JobInfo, fallback=parse_langchain_response)
+    print(f"[DEBUG] Parsed Response for Job: {info}")
+
+    recruit_job_instance.description = info.description
+    recruit_job_instance.required_skills = info.required_skills
+    recruit_job_instance.soft_skills = info.soft_skills
+    recruit_job_instance.key_roles = info.key_roles
+    recruit_job_instance.related_technologies = info.key_strengths
     recruit_job_instance.save()
     print(f"[DEBUG] Updated Job Info: {recruit_job_instance.title}")
     return recruit_job_instance
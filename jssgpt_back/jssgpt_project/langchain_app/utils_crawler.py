@@ -1,5 +1,11 @@
 import datetime
+import logging
+from collections import Counter
+from django.db import transaction
 from .models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from .recruitment_cache import invalidate_recruitment_details
+
+logger = logging.getLogger(__name__)
 
 def parse_start_date(date_str):
     """
@@ -16,9 +22,14 @@ def parse_end_date(date_str):
     "2025년 3월 16일 14:59" 형식의 문자열에서 날짜 부분(예: "2025년 3월 16일")을 파싱하여
     datetime.date 객체로 변환합니다.
     만약 날짜에 월과 일이 모두 포함되어 있지 않으면 None을 반환합니다.
+    JSON 응답에서 온 "2025-03-16T14:59:00+09:00" 같은 ISO 형식도 허용합니다.
     """
     if not date_str or date_str.strip() == "~":
         return None
+    try:
+        return datetime.date.fromisoformat(date_str.strip()[:10])
+    except ValueError:
+        pass
     parts = date_str.split(" ")
     if len(parts) < 2:
         return None
@@ -41,119 +52,167 @@ def parse_limit(limit_str):
         return None
 
 def save_crawled_json_data(data_list):
-    # 기존 함수 유지
-    for comp in data_list:
+    """
+    크롤링 결과(JSON 목록) 전체를 한 번에 저장합니다.
+    """
+    try:
+        ingest_companies(data_list)
+    except Exception as e:
+        print(f"[ERROR] 전체 저장 과정에서 예외 발생: {e}")
+
+def load_known_recruitments():
+    """
+    이미 저장된 채용 공고의 {employment_id(custom_id): crawl_fingerprint} 매핑을 반환합니다.
+    크롤러는 이 매핑에 있는 공고의 디테일 크롤링을 건너뜁니다.
+    """
+    return dict(
+        Recruitment.objects.filter(custom_id__isnull=False).values_list("custom_id", "crawl_fingerprint")
+    )
+
+def resolve_dates(company_data):
+    """
+    크롤링된 start_date/end_date 문자열을 date로 변환합니다.
+    end_date가 없거나 파싱에 실패하면 start_date 기준 7일 후로 설정합니다.
+    """
+    start_date = parse_start_date(company_data.get("start_date"))
+    end_date = parse_end_date(company_data.get("end_date")) if company_data.get("end_date") else None
+    if end_date is None and start_date:
+        end_date = start_date + datetime.timedelta(days=7)
+    return start_date, end_date
+
+def ingest_companies(company_list):
+    """
+    크롤링된 기업 데이터 묶음을 하나의 트랜잭션에서 bulk_create로 저장합니다.
+    배치 저장이 실패하면(잘못된 행 하나 때문에 전체가 롤백되므로) 기업 하나씩 다시 저장해,
+    문제가 있는 공고만 빠지고 나머지는 저장되도록 합니다.
+    저장(또는 갱신)된 Recruitment 목록을 반환합니다.
+    """
+    rows = []
+    for company_data in company_list:
+        if not company_data.get("company_name"):
+            print("[ERROR] company_name이 없습니다.")
+            continue
+        rows.append((company_data, *resolve_dates(company_data)))
+    if not rows:
+        return []
+
+    try:
+        return ingest_rows(rows)
+    except Exception:
+        if len(rows) == 1:
+            raise
+        logger.exception("Batch ingest of %s companies failed, retrying one company at a time", len(rows))
+
+    saved = []
+    for row in rows:
         try:
-            start_date = parse_start_date(comp.get("start_date"))
-            end_date = None
-            if comp.get("end_date"):
-                end_date = parse_end_date(comp.get("end_date"))
-            if end_date is None and start_date is not None:
-                end_date = start_date + datetime.timedelta(days=7)
-
-            company_name = comp.get("company_name")
-            if not company_name:
-                print("[ERROR] company_name이 없습니다.")
-                continue
-
-            print(f"[DEBUG] 저장할 회사 이름: {company_name}")
-            company, created = Company.objects.get_or_create(name=company_name)
-            if created:
-                print(f"[DEBUG] 새로운 Company 생성됨: {company}")
-            else:
-                print(f"[DEBUG] 기존 Company 사용: {company}")
-
-            recruitment = Recruitment.objects.create(
-                company=company,
-                title=f"{company_name} 채용 공고",
+            saved.extend(ingest_rows([row]))
+        except Exception:
+            logger.exception("Failed to save crawled company %s (%s)", row[0]["company_name"], row[0].get("employment_id"))
+    return saved
+
+def ingest_rows(rows):
+    """
+    (기업 데이터, start_date, end_date) 행 묶음을 하나의 트랜잭션에서 bulk_create로 저장합니다.
+    - Company는 이름 기준으로, Recruitment는 custom_id(employment_id) 기준으로 upsert
+    - RecruitJob은 (채용 공고, 직무명), CoverLetterPrompt는 (직무, 문항) 기준으로 없는 것만 생성
+    bulk_create는 post_save 시그널을 보내지 않으므로, LLM 보강 작업은 커밋 후 배치당 한 번만 등록합니다.
+    """
+    from .tasks import enrich_crawled_batch_task
+
+    with transaction.atomic():
+        names = {company_data["company_name"] for company_data, _, _ in rows}
+        Company.objects.bulk_create([Company(name=name) for name in names], ignore_conflicts=True)
+        companies = {company.name: company for company in Company.objects.filter(name__in=names)}
+
+        # employment_id가 없는 공고는 기업별로 순번을 한 번에 발급받아 custom_id를 만듦
+        missing_ids = Counter(company_data["company_name"] for company_data, _, _ in rows
+                              if not company_data.get("employment_id"))
+        next_seq = {name: companies[name].allocate_recruitment_seq(count) for name, count in missing_ids.items()}
+
+        recruitments, row_custom_ids = {}, []
+        for company_data, start_date, end_date in rows:
+            employment_id = company_data.get("employment_id") or None
+            if employment_id is None:
+                name = company_data["company_name"]
+                employment_id = f"{name}-{next_seq[name]}"
+                next_seq[name] += 1
+            recruitment = Recruitment(
+                company=companies[company_data["company_name"]],
+                title=f"{company_data['company_name']} 채용 공고",
                 start_date=start_date if start_date else datetime.date.today(),
                 end_date=end_date,
-                recruitment_link=comp.get("recruitment_link"),
-                jss_link=comp.get("link")
+                recruitment_link=company_data.get("recruitment_link"),
+                jss_link=company_data.get("link"),
+                custom_id=employment_id,
+                crawl_fingerprint=company_data.get("fingerprint"),
             )
-            employment_id = comp.get("employment_id")
-            if employment_id:
-                recruitment.custom_id = employment_id
-                recruitment.save()
-            print(f"[INFO] Created Recruitment: {recruitment}")
-
-            jobs = comp.get("jobs", [])
-            for job_data in jobs:
-                try:
-                    recruit_job = RecruitJob.objects.create(
-                        recruitment=recruitment,
-                        title=job_data.get("recruitment_title"),
-                        recruitment_type=job_data.get("recruitment_type")
-                    )
-                    print(f"[INFO] Created RecruitJob: {recruit_job}")
-                except Exception as je:
-                    print(f"[ERROR] RecruitJob 생성 실패: {je}")
+            recruitments[employment_id] = recruitment
+            row_custom_ids.append(employment_id)
+        Recruitment.objects.bulk_create(
+            list(recruitments.values()),
+            update_conflicts=True,
+            unique_fields=["custom_id"],
+            update_fields=["start_date", "end_date", "recruitment_link", "jss_link", "crawl_fingerprint", "updated_at"],
+        )
+        # upsert 시 pk가 채워지지 않으므로 custom_id로 다시 조회
+        recruitments = {r.custom_id: r for r in Recruitment.objects.filter(custom_id__in=list(recruitments))}
+        # bulk_create는 시그널을 보내지 않으므로 상세 응답 캐시를 직접 무효화
+        invalidate_recruitment_details([r.id for r in recruitments.values()])
+
+        jobs = {
+            (job.recruitment_id, job.title): job
+            for job in RecruitJob.objects.filter(recruitment__in=recruitments.values())
+        }
+        new_jobs, job_essays = [], []
+        for (company_data, _, _), custom_id in zip(rows, row_custom_ids):
+            recruitment = recruitments[custom_id]
+            for job_data in company_data.get("jobs", []):
+                job = RecruitJob(
+                    recruitment=recruitment,
+                    title=job_data.get("recruitment_title"),
+                    recruitment_type=job_data.get("recruitment_type"),
+                )
+                job_essays.append((recruitment.id, job.title, job_data.get("essay_questions", [])))
+                if (recruitment.id, job.title) not in jobs:
+                    jobs[(recruitment.id, job.title)] = job
+                    new_jobs.append(job)
+        # PostgreSQL은 bulk_create 후 생성된 pk를 채워줌
+        RecruitJob.objects.bulk_create(new_jobs)
+
+        prompt_keys = set(
+            CoverLetterPrompt.objects.filter(recruit_job__in=jobs.values()).values_list("recruit_job_id", "question_text")
+        )
+        new_prompts = []
+        for recruitment_id, title, essays in job_essays:
+            job = jobs[(recruitment_id, title)]
+            for essay in essays:
+                question_text = essay.get("question")
+                if (job.id, question_text) in prompt_keys:
                     continue
+                prompt_keys.add((job.id, question_text))
+                new_prompts.append(CoverLetterPrompt(
+                    recruit_job=job,
+                    question_text=question_text,
+                    limit=parse_limit(essay.get("limit")) if essay.get("limit") else None,
+                ))
+        CoverLetterPrompt.objects.bulk_create(new_prompts)
 
-                essay_questions = job_data.get("essay_questions", [])
-                for essay in essay_questions:
-                    try:
-                        question_text = essay.get("question")
-                        limit_str = essay.get("limit")
-                        limit = parse_limit(limit_str) if limit_str else None
-                        cover_letter_prompt = CoverLetterPrompt.objects.create(
-                            recruit_job=recruit_job,
-                            question_text=question_text,
-                            limit=limit
-                        )
-                        print(f"[INFO] Created CoverLetterPrompt: {cover_letter_prompt}")
-                    except Exception as ce:
-                        print(f"[ERROR] CoverLetterPrompt 생성 실패: {ce}")
-        except Exception as e:
-            print(f"[ERROR] 전체 저장 과정에서 예외 발생: {e}")
+        company_ids = [company.id for company in companies.values() if company.industry in (None, "")]
+        job_ids = [job.id for job in new_jobs]
+        prompt_ids = [prompt.id for prompt in new_prompts]
+        if company_ids or job_ids or prompt_ids:
+            transaction.on_commit(lambda: enrich_crawled_batch_task.delay(company_ids, job_ids, prompt_ids))
+    print(f"[INFO] 저장 완료: 채용 공고 {len(recruitments)}개, 신규 직무 {len(new_jobs)}개, 신규 문항 {len(new_prompts)}개")
+    return list(recruitments.values())
 
 def save_company_data(company_data):
     """
     개별 회사 데이터를 받아 DB에 저장합니다.
+    employment_id가 같은 채용 공고가 이미 있으면 새로 만들지 않고 갱신하므로,
+    같은 날짜를 다시 크롤링해도 중복이 생기지 않습니다.
     """
     try:
-        start_date = parse_start_date(company_data.get("start_date"))
-        raw_end_date = company_data.get("end_date")
-        if raw_end_date:
-            parsed_end_date = parse_end_date(raw_end_date)
-            if parsed_end_date is None and start_date:
-                # 파싱 실패 시 start_date 기준 7일 후로 설정
-                end_date = start_date + datetime.timedelta(days=7)
-            else:
-                end_date = parsed_end_date
-        else:
-            end_date = start_date + datetime.timedelta(days=7) if start_date else None
-
-        company_name = company_data.get("company_name")
-        if not company_name:
-            print("[ERROR] company_name이 없습니다.")
-            return
-
-        company, created = Company.objects.get_or_create(name=company_name)
-        recruitment = Recruitment.objects.create(
-            company=company,
-            title=f"{company_name} 채용 공고",
-            start_date=start_date if start_date else datetime.date.today(),
-            end_date=end_date,
-            recruitment_link=company_data.get("recruitment_link"),
-            jss_link=company_data.get("link")
-        )
-        if company_data.get("employment_id"):
-            recruitment.custom_id = company_data.get("employment_id")
-            recruitment.save()
-
-        for job_data in company_data.get("jobs", []):
-            recruit_job = RecruitJob.objects.create(
-                recruitment=recruitment,
-                title=job_data.get("recruitment_title"),
-                recruitment_type=job_data.get("recruitment_type")
-            )
-            for essay in job_data.get("essay_questions", []):
-                limit = parse_limit(essay.get("limit")) if essay.get("limit") else None
-                CoverLetterPrompt.objects.create(
-                    recruit_job=recruit_job,
-                    question_text=essay.get("question"),
-                    limit=limit
-                )
+        ingest_companies([company_data])
     except Exception as e:
-        print(f"[ERROR] 저장 중 예외 발생: {e}")
\ No newline at end of file
+        print(f"[ERROR] 저장 중 예외 발생: {e}")
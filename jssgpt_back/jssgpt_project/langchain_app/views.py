@@ -1,13 +1,19 @@
 # langchain_app/views.py
+import datetime
+import hashlib
 import json
+from django.db.models import Count, Max, Q
 from django.http import JsonResponse
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 from .utils import (
     generate_and_save_company_info,
     generate_and_save_job_info,
     generate_and_save_cover_letter_outline,
 )
 from .models import Recruitment
+from .recruitment_cache import get_cached_detail, set_cached_detail
 from django.shortcuts import get_object_or_404
 
 @csrf_exempt
@@ -55,14 +61,86 @@ def create_recruitment(request):
         return JsonResponse({"error": f"예상치 못한 오류: {str(e)}"}, status=500)
 
 
+# 캘린더 API 한 페이지의 기본/최대 공고 수
+RECRUITMENT_EVENTS_PAGE_SIZE = 500
+RECRUITMENT_EVENTS_MAX_PAGE_SIZE = 1000
+
+
+def parse_event_window(request):
+    """
+    ?start=YYYY-MM-DD&end=YYYY-MM-DD 조회 기간을 (start, end) date로 반환합니다.
+    기간을 주지 않으면 이번 달 1일~말일을 사용합니다. 형식이 잘못되면 ValueError가 발생합니다.
+    """
+    today = datetime.date.today()
+    start = request.GET.get("start")
+    end = request.GET.get("end")
+    start = datetime.date.fromisoformat(start) if start else today.replace(day=1)
+    if end:
+        end = datetime.date.fromisoformat(end)
+    else:
+        next_month = (start.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+        end = next_month - datetime.timedelta(days=1)
+    if end < start:
+        raise ValueError("end가 start보다 빠릅니다.")
+    return start, end
+
+
+def recruitment_events_queryset(request):
+    """
+    조회 기간에 시작일 또는 종료일이 걸치는 공고를 (start_date, id) 순으로 반환합니다.
+    ?company= 로 기업명 부분 일치 필터를 걸 수 있습니다.
+    """
+    start, end = parse_event_window(request)
+    events = Recruitment.objects.filter(
+        Q(start_date__range=(start, end)) | Q(end_date__range=(start, end))
+    )
+    company = request.GET.get("company")
+    if company:
+        events = events.filter(company__name__icontains=company)
+    return events.order_by("start_date", "id")
+
+
+def recruitment_events_etag(request):
+    """
+    조회 조건과 해당 기간 공고들의 최종 수정 시각/개수로 ETag를 만듭니다.
+    공고가 추가·수정·삭제되지 않은 달은 같은 ETag가 나오므로 304로 응답합니다.
+    """
+    try:
+        events = recruitment_events_queryset(request)
+    except ValueError:
+        return None
+    summary = events.aggregate(last_modified=Max("updated_at"), total=Count("id"))
+    raw = f"{request.GET.urlencode()}|{summary['last_modified']}|{summary['total']}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=recruitment_events_etag)
 def get_recruitment_events(request):
     """
-    모든 Recruitment 객체를 가져와서 JSON 리스트로 반환합니다.
-    (실제 개발 시에는 날짜별 필터링 등 추가 기능을 구현할 수 있습니다.)
+    조회 기간(?start, ?end)에 해당하는 Recruitment를 keyset 페이지네이션으로 반환합니다.
+    다음 페이지는 응답의 next_cursor를 ?cursor= 로 넘겨 조회합니다.
     """
-    events = Recruitment.objects.select_related('company').all()
+    try:
+        events = recruitment_events_queryset(request)
+        limit = min(int(request.GET.get("limit", RECRUITMENT_EVENTS_PAGE_SIZE)), RECRUITMENT_EVENTS_MAX_PAGE_SIZE)
+        if limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다.")
+        cursor = request.GET.get("cursor")
+        if cursor:
+            cursor_date, cursor_id = cursor.split("_")
+            cursor_date, cursor_id = datetime.date.fromisoformat(cursor_date), int(cursor_id)
+            events = events.filter(
+                Q(start_date__gt=cursor_date) | Q(start_date=cursor_date, id__gt=cursor_id)
+            )
+    except ValueError as e:
+        return JsonResponse({"error": f"잘못된 조회 조건입니다: {e}"}, status=400)
+
+    page = list(events.select_related('company')[:limit + 1])
+    has_next = len(page) > limit
+    page = page[:limit]
     event_list = []
-    for event in events:
+    for event in page:
         event_list.append({
             "recruitment_id": event.id,  # 또는 event.custom_id 사용 가능
             "recruitment_title": event.title,
@@ -72,13 +150,19 @@ def get_recruitment_events(request):
             "jss_link": event.jss_link,
             "recruitment_link": event.recruitment_link,
         })
-    return JsonResponse(event_list, safe=False)
+    next_cursor = f"{page[-1].start_date.isoformat()}_{page[-1].id}" if has_next else None
+    return JsonResponse({"results": event_list, "next_cursor": next_cursor})
 
 def get_recruitment_detail(request, id):
     """
     Recruitment 상세 정보를 반환합니다.
     Recruitment와 연결된 모든 RecruitJob과 각 RecruitJob에 연결된 CoverLetterPrompt (자기소개서 문항)을 포함합니다.
+    응답은 채용 공고별로 캐시되며, 공고/직무/문항이 바뀌면 시그널로 무효화됩니다.
     """
+    cached = get_cached_detail(id)
+    if cached is not None:
+        return JsonResponse(cached)
+
     # select_related와 prefetch_related를 사용해 관련 데이터를 미리 로드합니다.
     recruitment = get_object_or_404(
         Recruitment.objects.select_related('company').prefetch_related('recruit_jobs__cover_letter_prompts'),
@@ -110,4 +194,6 @@ def get_recruitment_detail(request, id):
         "recruitment_link": recruitment.recruitment_link,
         "recruitments": recruitments_data,
     }
+    # 크롤러/관리자 수정 시 signals.py에서 무효화됨
+    set_cached_detail(id, data)
     return JsonResponse(data)
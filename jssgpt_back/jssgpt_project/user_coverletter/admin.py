@@ -1,8 +1,18 @@
 from django.contrib import admin
-from .models import UserCoverLetter
+from .models import UserCoverLetter, CoverLetterDraftJob, CoverLetterDraftItem
 
 @admin.register(UserCoverLetter)
 class UserCoverLetterAdmin(admin.ModelAdmin):
     list_display = ('id', 'user', 'recruit_job', 'prompt', 'selected_starexperience', 'draft', 'created_at', 'updated_at')
     list_filter = ('user', 'recruit_job', 'draft')
-    search_fields = ('content', 'prompt__question_text', 'selected_starexperience__title')
\ No newline at end of file
+    search_fields = ('content', 'prompt__question_text', 'selected_starexperience__title')
+
+@admin.register(CoverLetterDraftJob)
+class CoverLetterDraftJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'recruit_job', 'created_at', 'updated_at')
+
+
+@admin.register(CoverLetterDraftItem)
+class CoverLetterDraftItemAdmin(admin.ModelAdmin):
+    list_display = ('id', 'job', 'cover_letter', 'status', 'updated_at')
+    list_filter = ('status',)
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('langchain_app', '0008_alter_company_industry'),
+        ('user_coverletter', '0002_alter_usercoverletter_content_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoverLetterDraftJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('recruit_job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='draft_jobs', to='langchain_app.recruitjob')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='draft_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CoverLetterDraftItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '생성 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('error', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cover_letter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='draft_items', to='user_coverletter.usercoverletter')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='user_coverletter.coverletterdraftjob')),
+            ],
+        ),
+    ]
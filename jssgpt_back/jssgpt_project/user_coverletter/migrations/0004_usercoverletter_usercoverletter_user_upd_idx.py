@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_coverletter', '0003_coverletterdraftjob_coverletterdraftitem'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usercoverletter',
+            index=models.Index(fields=['user', '-updated_at'], name='usercoverletter_user_upd_idx'),
+        ),
+    ]
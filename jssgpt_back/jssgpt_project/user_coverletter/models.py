@@ -1,3 +1,4 @@
+import uuid
 from django.db import models
 from django.contrib.auth.models import User
 from langchain_app.models import RecruitJob, CoverLetterPrompt
@@ -17,6 +18,59 @@ class UserCoverLetter(models.Model):
 
     class Meta:
         unique_together = ("user", "recruit_job", "prompt")
+        indexes = [
+            # 사용자별 자기소개서 목록 (최근 수정 순)
+            models.Index(fields=["user", "-updated_at"], name="usercoverletter_user_upd_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.user.username} - {self.recruit_job.title} - {self.prompt.question_text}"
\ No newline at end of file
+        return f"{self.user.username} - {self.recruit_job.title} - {self.prompt.question_text}"
+
+
+class CoverLetterDraftJob(models.Model):
+    """
+    하나의 채용 직무에 대한 초안 생성 요청. 문항별 진행 상황은 CoverLetterDraftItem에 기록됩니다.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="draft_jobs")
+    recruit_job = models.ForeignKey(RecruitJob, on_delete=models.CASCADE, related_name="draft_jobs")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def status(self, items=None):
+        """
+        문항별 상태를 종합한 작업 상태를 반환합니다.
+        """
+        statuses = {item.status for item in (items if items is not None else self.items.all())}
+        if statuses == {CoverLetterDraftItem.STATUS_PENDING}:
+            return CoverLetterDraftItem.STATUS_PENDING
+        if statuses & {CoverLetterDraftItem.STATUS_PENDING, CoverLetterDraftItem.STATUS_RUNNING}:
+            return CoverLetterDraftItem.STATUS_RUNNING
+        if CoverLetterDraftItem.STATUS_FAILED in statuses:
+            return CoverLetterDraftItem.STATUS_FAILED
+        return CoverLetterDraftItem.STATUS_DONE
+
+    def __str__(self):
+        return f"{self.user.username} - {self.recruit_job.title} ({self.id})"
+
+
+class CoverLetterDraftItem(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_RUNNING, "생성 중"),
+        (STATUS_DONE, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    job = models.ForeignKey(CoverLetterDraftJob, on_delete=models.CASCADE, related_name="items")
+    cover_letter = models.ForeignKey(UserCoverLetter, on_delete=models.CASCADE, related_name="draft_items")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    error = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.job_id} - {self.cover_letter.prompt_id}: {self.status}"
@@ -0,0 +1,48 @@
+import logging
+from celery import shared_task
+from .models import CoverLetterDraftItem
+from .utils import draft_llm, build_draft_prompt, get_cover_letter_guide
+
+logger = logging.getLogger(__name__)
+
+@shared_task
+def generate_cover_letter_draft_task(item_id):
+    """
+    초안 생성 작업의 문항 하나에 대해 LLM으로 초안을 생성하고 UserCoverLetter.content에 저장합니다.
+    """
+    try:
+        item = CoverLetterDraftItem.objects.select_related(
+            'cover_letter__prompt',
+            'cover_letter__recruit_job',
+            'cover_letter__selected_starexperience',
+        ).get(id=item_id)
+    except CoverLetterDraftItem.DoesNotExist:
+        logger.error(f"CoverLetterDraftItem id {item_id} not found.")
+        return "CoverLetterDraftItem not found."
+
+    item.status = CoverLetterDraftItem.STATUS_RUNNING
+    item.save(update_fields=['status', 'updated_at'])
+
+    cover_letter = item.cover_letter
+    try:
+        cover_letter_guide, cover_letter_donts = get_cover_letter_guide()
+        prompt_text = build_draft_prompt(
+            cover_letter.prompt,
+            cover_letter.recruit_job,
+            cover_letter.selected_starexperience,
+            cover_letter_guide,
+            cover_letter_donts,
+        )
+        response = draft_llm.predict(prompt_text)
+        logger.info(f"LLM draft response for prompt {cover_letter.prompt_id}: {response}")
+
+        cover_letter.content = response
+        cover_letter.draft = False
+        cover_letter.save()
+        item.status = CoverLetterDraftItem.STATUS_DONE
+    except Exception as e:
+        logger.error(f"Error generating draft for CoverLetterDraftItem id {item_id}: {e}", exc_info=True)
+        item.status = CoverLetterDraftItem.STATUS_FAILED
+        item.error = str(e)
+    item.save(update_fields=['status', 'error', 'updated_at'])
+    return item.id
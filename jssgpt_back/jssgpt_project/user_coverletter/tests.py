@@ -1,7 +1,17 @@
-from django.test import TestCase
+import asyncio
+import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
 from .models import UserCoverLetter
+from .tasks import generate_cover_letter_draft_task
 from django.contrib.auth.models import User
-from langchain_app.models import RecruitJob, CoverLetterPrompt
+from langchain_app.models import Company, Recruitment, RecruitJob, CoverLetterPrompt
+from user_experience.models import RawExperience, STARExperience
+from .utils import assign_recommendations, parse_recommended_ids
+from .views import recommend_star_experiences
 
 class UserCoverLetterTest(TestCase):
     def setUp(self):
@@ -17,4 +27,173 @@ class UserCoverLetterTest(TestCase):
             content="This is a test cover letter.",
             draft=True
         )
-        self.assertEqual(cover_letter.content, "This is a test cover letter.")
\ No newline at end of file
+        self.assertEqual(cover_letter.content, "This is a test cover letter.")
+
+class RecommendationAssignmentTest(SimpleTestCase):
+    def setUp(self):
+        self.stars = [
+            SimpleNamespace(id=1, title="해커톤 우승"),
+            SimpleNamespace(id=2, title="동아리 회장"),
+            SimpleNamespace(id=3, title="인턴십"),
+        ]
+
+    def test_parse_recommended_ids(self):
+        self.assertEqual(parse_recommended_ids("```json\n[2, 1, 2]\n```"), [2, 1])
+        self.assertEqual(parse_recommended_ids('[{"STARExperienceID": "3"}]'), [3])
+        self.assertEqual(parse_recommended_ids("추천할 경험이 없습니다."), [])
+
+    def test_conflicting_candidates_fall_back_to_next_rank(self):
+        assigned = assign_recommendations([[1, 2], [1, 3], [1]], self.stars)
+        self.assertEqual([star.id for star in assigned], [1, 3, 2])
+
+    def test_invalid_ids_use_unused_experience(self):
+        assigned = assign_recommendations([[99], []], self.stars)
+        self.assertEqual([star.id for star in assigned], [1, 2])
+        self.assertEqual(assign_recommendations([[1]], []), [None])
+
+
+class EmbeddingShortlistRecommendationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="recommender", password="password")
+        company = Company.objects.create(name="추천기업", industry="IT")
+        recruitment = Recruitment.objects.create(
+            company=company, title="추천기업 채용 공고",
+            start_date=datetime.date(2025, 3, 1), end_date=datetime.date(2025, 3, 8),
+        )
+        self.recruit_job = RecruitJob.objects.create(recruitment=recruitment, title="데이터 분석", description="분석")
+        raw = RawExperience.objects.create(user=self.user, extracted_text="")
+        for title, situation in [("카페 아르바이트", "카페에서 고객 응대를 했다"),
+                                 ("데이터 분석 인턴", "고객 이탈 데이터를 분석하고 대시보드를 만들었다")]:
+            STARExperience.objects.create(user=self.user, raw_experience=raw, title=title,
+                                          situation=situation, task="", action="", result="")
+        prompt = CoverLetterPrompt.objects.create(
+            recruit_job=self.recruit_job, question_text="데이터 분석 경험", outline="고객 데이터를 분석한 경험을 강조"
+        )
+        self.cover_letter = UserCoverLetter.objects.create(user=self.user, recruit_job=self.recruit_job, prompt=prompt)
+
+    @patch('user_coverletter.views.RECOMMENDATION_SHORTLIST', 1)
+    @patch('user_coverletter.views.llm')
+    def test_shortlist_is_used_when_llm_answer_is_unusable(self, mock_llm):
+        mock_llm.predict.return_value = "추천할 수 없습니다"
+        recommend_star_experiences(self.user, [self.cover_letter])
+        # 후보가 1개로 추려졌으므로 프롬프트에는 가장 유사한 경험만 포함됨
+        self.assertIn("데이터 분석 인턴", mock_llm.predict.call_args.args[0])
+        self.assertNotIn("카페 아르바이트", mock_llm.predict.call_args.args[0])
+        self.assertEqual(
+            [star.title for star in self.cover_letter.recommended_starexperience.all()], ["데이터 분석 인턴"]
+        )
+
+
+class CoverLetterDraftJobTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="drafter", password="password")
+        company = Company.objects.create(name="테스트기업", industry="IT")
+        recruitment = Recruitment.objects.create(
+            company=company, title="테스트기업 채용 공고",
+            start_date=datetime.date(2025, 3, 1), end_date=datetime.date(2025, 3, 8),
+        )
+        self.recruit_job = RecruitJob.objects.create(recruitment=recruitment, title="백엔드", description="API 개발")
+        raw = RawExperience.objects.create(user=self.user, extracted_text="")
+        star = STARExperience.objects.create(
+            user=self.user, raw_experience=raw, title="해커톤", situation="s", task="t", action="a", result="r"
+        )
+        for question in ["지원 동기", "협업 경험"]:
+            prompt = CoverLetterPrompt.objects.create(recruit_job=self.recruit_job, question_text=question, outline="o")
+            UserCoverLetter.objects.create(
+                user=self.user, recruit_job=self.recruit_job, prompt=prompt, selected_starexperience=star
+            )
+        self.client.force_login(self.user)
+
+    @patch('user_coverletter.tasks.draft_llm')
+    def test_post_enqueues_job_and_status_reports_results(self, mock_llm):
+        mock_llm.predict.return_value = "생성된 초안"
+        with patch('user_coverletter.views.generate_cover_letter_draft_task.delay',
+                   side_effect=generate_cover_letter_draft_task):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse('user_coverletter:generate_cover_letter_draft',
+                                                    args=[self.recruit_job.id]))
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['total'], 2)
+
+        status = self.client.get(response.json()['status_url']).json()
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['completed'], 2)
+        self.assertEqual({item['content'] for item in status['items']}, {"생성된 초안"})
+        self.assertFalse(UserCoverLetter.objects.filter(user=self.user, draft=True).exists())
+
+    @patch('user_coverletter.views.draft_llm')
+    def test_stream_draft_sends_tokens_and_saves_content(self, mock_llm):
+        async def fake_stream(prompt_text):
+            for token in ["안녕", "하세요"]:
+                yield SimpleNamespace(content=token)
+        mock_llm.astream = fake_stream
+        cover_letter = UserCoverLetter.objects.filter(user=self.user).first()
+
+        response = self.client.get(reverse('user_coverletter:stream_cover_letter_draft', args=[cover_letter.id]))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b"".join(async_to_sync(self._collect)(response)).decode()
+        self.assertIn('data: {"token": "안녕"}', body)
+        self.assertIn('event: done', body)
+        cover_letter.refresh_from_db()
+        self.assertEqual(cover_letter.content, "안녕하세요")
+
+    @patch('user_coverletter.views.draft_llm')
+    def test_stream_draft_saves_partial_content_when_client_disconnects(self, mock_llm):
+        async def fake_stream(prompt_text):
+            yield SimpleNamespace(content="안녕")
+            await asyncio.Event().wait()  # 다음 토큰을 기다리는 중 연결이 끊김
+            yield SimpleNamespace(content="하세요")
+        mock_llm.astream = fake_stream
+        cover_letter = UserCoverLetter.objects.filter(user=self.user).first()
+
+        response = self.client.get(reverse('user_coverletter:stream_cover_letter_draft', args=[cover_letter.id]))
+        first = async_to_sync(self._read_first_then_disconnect)(response)
+        self.assertEqual(first.decode(), 'data: {"token": "안녕"}\n\n')
+        cover_letter.refresh_from_db()
+        self.assertEqual(cover_letter.content, "안녕")
+        self.assertTrue(cover_letter.draft)
+
+    async def _collect(self, response):
+        return [chunk async for chunk in response.streaming_content]
+
+    async def _read_first_then_disconnect(self, response):
+        received = []
+
+        async def consume():
+            async for chunk in response.streaming_content:
+                received.append(chunk)
+
+        # ASGI 서버가 연결 종료 시 응답 작업을 취소하는 것과 같이, 첫 토큰을 받은 뒤 스트림을 닫음
+        task = asyncio.ensure_future(consume())
+        while not received:
+            await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        return received[0]
+
+
+class ListCoverLettersTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="listuser", password="password")
+        self.client.force_login(self.user)
+        for i in range(3):
+            company = Company.objects.create(name=f"목록기업{i}", industry="IT")
+            recruitment = Recruitment.objects.create(
+                company=company, title=f"공고{i}", start_date=datetime.date(2025, 3, 1), end_date=datetime.date(2025, 3, 8)
+            )
+            job = RecruitJob.objects.create(recruitment=recruitment, title=f"직무{i}", description="설명")
+            for q in range(2):
+                prompt = CoverLetterPrompt.objects.create(recruit_job=job, question_text=f"문항{q}", outline="개요")
+                UserCoverLetter.objects.create(user=self.user, recruit_job=job, prompt=prompt)
+
+    def test_groups_by_job_with_constant_queries(self):
+        url = reverse("user_coverletter:list_cover_letters")
+        # 세션/사용자 조회 2 + 개수 1 + 그룹 1 + 상세 1
+        with self.assertNumQueries(5):
+            data = self.client.get(url, {"page_size": 2}).json()
+        self.assertEqual((data["count"], data["num_pages"]), (3, 2))
+        self.assertEqual([item["recruit_job_title"] for item in data["results"]], ["직무2", "직무1"])
+        self.assertEqual([q["question_text"] for q in data["results"][0]["essay_questions"]], ["문항0", "문항1"])
+        data = self.client.get(url, {"page_size": 2, "page": 2}).json()
+        self.assertEqual([item["company_name"] for item in data["results"]], ["목록기업0"])
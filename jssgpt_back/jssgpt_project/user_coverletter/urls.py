@@ -7,6 +7,8 @@ app_name = 'user_coverletter'
 urlpatterns = [
     path('create/<int:recruit_job_id>/', views.create_cover_letter, name='create_cover_letter'),
     path('generate-draft/<int:recruit_job_id>/', views.generate_cover_letter_draft, name='generate_cover_letter_draft'),
+    path('draft-status/<uuid:job_id>/', views.cover_letter_draft_status, name='cover_letter_draft_status'),
+    path('stream-draft/<int:cover_letter_id>/', views.stream_cover_letter_draft, name='stream_cover_letter_draft'),
     path('edit/<int:pk>/', views.edit_cover_letter, name='edit_cover_letter'),
     path('get/', views.get_user_coverletters, name='get_user_coverletters'),
     path('list/', views.list_cover_letters, name='list_cover_letters'),
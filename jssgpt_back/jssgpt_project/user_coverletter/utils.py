@@ -0,0 +1,239 @@
+import logging
+from langchain_app.models import CoverLetterGuide
+from langchain_app.json_stream import loads as loads_json
+from langchain_app.llm_gateway import get_chat_model
+
+logger = logging.getLogger('django')
+
+# 공용 LLM 게이트웨이 모델. 추천과 초안 생성은 동시 실행 한도를 따로 가짐
+llm = get_chat_model("gpt-4.1-2025-04-14", temperature=0.8, caller="recommendation")
+draft_llm = get_chat_model("gpt-4.1-2025-04-14", temperature=0.8, caller="draft")
+
+# 문항별로 LLM에게 요청할 추천 후보 수 (충돌 해소 시 다음 순위 후보로 대체)
+RECOMMENDATION_CANDIDATES = 3
+
+
+def build_recommendation_prompt(outline, star_texts, max_candidates=RECOMMENDATION_CANDIDATES):
+    """
+    자기소개서 아웃라인과 STAR 경험 목록으로 추천 프롬프트를 구성합니다.
+    LLM은 적합도 순으로 최대 max_candidates개의 경험 ID를 반환합니다.
+    """
+    return f"""
+    너의 목표는 아래 자기소개서 아웃라인에 가장 적합한 경험(STAR 구조 기반)을,
+    논리적으로 판단하고, 가장 잘 어울리는 경험 ID를 적합한 순서대로 선택하는 거야.
+
+    다음 단계를 따라 reasoning을 수행한 후,
+    최종적으로 **가장 적합한 경험부터 최대 {max_candidates}개의 ID**를 "ids" 키에 숫자 배열로 담은 JSON 객체로만 반환해줘.
+
+    예: {{"ids": [2, 5, 1]}}
+
+    ---
+
+    ### [입력 데이터]
+
+    1. 자기소개서 아웃라인:
+    {outline}
+
+    2. STAR 형식의 경험 목록 (ID: 제목: 상황):
+    {star_texts}
+
+    ---
+
+    ### [작업 단계]
+
+    #### 1단계. 문항 핵심 주제 및 키워드 파악
+    - 아웃라인을 바탕으로 자기소개서 문항의 의도를 분석해.
+    - 이 문항에서 강조해야 할 **핵심 역량**, **핵심 가치**, **필수 기술/태도**를 추출해.
+
+    #### 2단계. 경험과 키워드 매칭
+    - STAR 경험 목록의 각 항목을 읽고, 각 경험이 어떤 역량과 가치를 보여주는지 판단해.
+    - 각 경험이 1단계에서 도출한 핵심 키워드와 얼마나 일치하는지 비교해.
+
+    #### 3단계. 평가 기준에 따라 적합도 판단
+    - 다음 기준을 참고해서 경험 간 우선순위를 판단해:
+    - Salesforce 플랫폼 관련 경험인가?
+    - 기술적 문제 해결 경험이 있는가?
+    - 사용자 요구 분석 및 협업이 포함되어 있는가?
+    - 결과가 구체적이고 측정 가능한가?
+    - 회사의 가치(고객 중심, 책임감, 지속적 학습)와 부합하는가?
+
+    #### 4단계. 최종 선택
+    - 위 기준에 따라 **가장 적합한 경험부터 순서대로 최대 {max_candidates}개의 ID**를 "ids" 키에 숫자만 포함한 배열로 담은 JSON 객체 형식으로 반환해.
+    - 반드시 순수 JSON만 출력하고, 설명이나 기호는 포함하지 마.
+
+    ---
+
+    ### ✅ 출력 예시 (형식)
+
+    ```json
+    {{"ids": [1, 3]}}
+    ```
+    """
+
+
+def parse_recommended_ids(response):
+    """
+    LLM 응답에서 추천 경험 ID 목록을 순서대로 추출합니다.
+    {"ids": [2, 5]} 형태와 기존 [2, 5], [{"STARExperienceID": 2}] 형태를 모두 허용합니다.
+    (구조화 출력 검증에 실패했을 때의 fallback 파서)
+    """
+    try:
+        # 코드 블록/앞뒤 문구를 건너뛰고, 잘린 응답은 완성된 ID까지만 사용
+        recommended_raw = loads_json(response)
+    except Exception as e:
+        logger.error(f"Error parsing recommendation JSON: {e}")
+        return []
+    if isinstance(recommended_raw, dict) and isinstance(recommended_raw.get("ids"), list):
+        recommended_raw = recommended_raw["ids"]
+    if not isinstance(recommended_raw, list):
+        recommended_raw = [recommended_raw]
+
+    ids = []
+    for rec in recommended_raw:
+        if isinstance(rec, dict):
+            rec = rec.get("STARExperienceID")
+        try:
+            rec_id = int(rec)
+        except (ValueError, TypeError):
+            continue
+        if rec_id not in ids:
+            ids.append(rec_id)
+    return ids
+
+
+def assign_recommendations(ranked_ids_list, star_experiences):
+    """
+    문항별 추천 후보(적합도 순)를 받아, 같은 경험이 두 문항에 중복 추천되지 않도록
+    문항 순서대로 하나씩 배정합니다.
+    - 후보 중 아직 배정되지 않은 제목의 경험을 우선 선택
+    - 후보가 모두 겹치면 아직 사용되지 않은 다른 경험으로 대체
+    - 그래도 없으면 사용자의 첫 번째 경험을 fallback으로 사용 (기존 동작과 동일)
+    반환값은 문항 순서와 같은 길이의 리스트이며, 경험이 하나도 없으면 None이 들어갑니다.
+    """
+    stars_by_id = {star.id: star for star in star_experiences}
+    recommended_titles = set()
+    assignments = []
+    for ranked_ids in ranked_ids_list:
+        chosen = next(
+            (stars_by_id[i] for i in ranked_ids
+             if i in stars_by_id and stars_by_id[i].title not in recommended_titles),
+            None
+        )
+        if chosen is None:
+            chosen = next(
+                (star for star in star_experiences if star.title not in recommended_titles),
+                None
+            )
+        if chosen is None and star_experiences:
+            chosen = star_experiences[0]
+        if chosen is not None:
+            recommended_titles.add(chosen.title)
+        assignments.append(chosen)
+    return assignments
+
+
+def get_cover_letter_guide():
+    """
+    자기소개서 작성 가이드와 금지사항을 (guide, donts) 튜플로 반환합니다. (예: 1개만 있다고 가정)
+    가이드가 없다면 공백 문자열로 처리합니다.
+    """
+    try:
+        cover_letter_guide_obj = CoverLetterGuide.objects.first()
+        cover_letter_donts = cover_letter_guide_obj.cover_letter_donts
+        cover_letter_guide = cover_letter_guide_obj.cover_letter_guide
+    except:
+        cover_letter_donts = ""
+        cover_letter_guide = ""
+    return cover_letter_guide, cover_letter_donts
+
+
+def build_draft_prompt(prompt, recruit_job, star_experience, cover_letter_guide, cover_letter_donts):
+    """
+    자기소개서 문항, 아웃라인, 선택된 STAR 경험, 직무 정보로 초안 생성 프롬프트를 구성합니다.
+    문항 글자수 제한이 없으면 1000자로 가정합니다.
+    """
+    char_limit = prompt.limit if prompt.limit else 1000
+
+    return f"""
+    다음은 자기소개서를 작성하기 위한 자료들이야.  
+    너의 목표는 이 정보를 바탕으로, **단순한 조합이 아닌 논리적인 사고 흐름을 따라 자기소개서를 작성**하는 거야.
+
+    최종 출력은 자기소개서 초안 한 편으로, 반드시 글자수 {char_limit}자 이내(최소 90%)로 작성할 것.  
+    출력에는 자기소개서 본문 외 아무 설명도 포함하지 마.
+
+    ---
+
+    ## 📘 입력 데이터
+
+    1. 자기소개서 문항
+    "{prompt.question_text}"
+
+    2. 아웃라인 (문항 분석, 키워드, 경험 연결)
+    {prompt.outline}
+
+    3. 선택된 STAR 경험  
+    - 제목: {star_experience.title}  
+    - 상황: {star_experience.situation}  
+    - 과제: {star_experience.task}  
+    - 행동: {star_experience.action}  
+    - 결과: {star_experience.result}
+
+    4. 채용 직무 정보  
+    - 직무 설명: {recruit_job.description}  
+    - 핵심 역할: {recruit_job.key_roles}  
+    - 요구 역량: {recruit_job.required_skills}  
+    - 관련 기술: {recruit_job.related_technologies}  
+    - 소프트 스킬: {recruit_job.soft_skills}  
+    - 필요 강점: {recruit_job.key_strengths}
+
+    5. 작성 가이드  
+    {cover_letter_guide}
+
+    6. 작성 시 피해야 할 내용  
+    {cover_letter_donts}
+
+    ---
+
+    ## 🧠 작업 순서 및 reasoning 지시
+
+    ### 1단계. 문항 분석
+    - 문항의 질문 의도를 분석해.
+    - 어떤 역량, 가치, 태도를 평가하려는지 파악하고, 아웃라인과 직무 정보에서 그에 맞는 키워드를 정리해.
+
+    ### 2단계. 경험 분석
+    - 선택된 STAR 경험을 통해 아웃라인에서 중요한 키워드들 중 지원자의 강조할 방향성을 정해.
+
+    ### 3단계. 핵심 메시지 설계
+    - STAR 경험과 문항/직무 요구사항을 연결해, 자기소개서에서 전하고자 하는 핵심 메시지를 한 문장으로 정의해.
+    - 이 메시지를 자기소개서의 중심 주제로 삼아.
+
+    ### 4단계. 자기소개서 전략 방향 설정
+    - 아웃라인과 선택된 STAR 경험을 따라서 자기소개서의 방향성을 정립해.
+    
+    ### 5단계. 자기소개서 문단 구성 계획
+    - 네가 정한 방향성에 따라서 자기소개서를 설계해.
+    - 그리고 적절한 부분에 선택된 STAR경험을 자연스럽게 녹여낼 부분을 정해.
+    +) 단, 문항이 자기 경험 중심이 아닐 경우에는 STAR 경험을 억지로 넣지 말고,
+    +) 해당 문항에 더 적합한 방향성(지원 동기, 가치관 등)으로 풀어가.
+    +) 아웃라인에서 '5단계: 경험 사례 매칭'은 참고하면 안돼.
+
+    ### 6단계. 자기소개서 작성
+    - 작성가이드에 따라서 설계한 방향성과 구성에 따라 자기소개서를 {char_limit}의 90%이상 글자수로 작성해
+
+    ### 7단계. 스타일 가이드 확인
+    - 글자 수: {char_limit}자 이내, 최소 90% 이상
+    - 어조: 간결하고 명확한 표현 사용, 말줄임표나 형식적인 표현 금지
+    - 강조: 수치 기반 결과 강조, 회사/직무와의 연결성 부각
+    - 자기소개서 작성 가이드에 맞춰서 작성해줘.
+    - 금지사항: {cover_letter_donts}를 읽고, 주해서 작성할 것
+
+    ---
+
+    ## 📝 출력 형식
+
+    - 네가 세운 자기소개서 설계와 자기소개서 본문을 2파트로 나눠서 출력할 것.
+    - 자기소개서 설계는 구조화된 글로 출력해줘.
+    - 구조화된 설계에는 자기소개서의 방향성, 주요 키워드, 핵심 메시지, STAR경험에서 강조할 점, 서론, 본론, 결론 개조식으로 포함해서 구조화할 것.
+    - 자기소개서 본문은 {char_limit}의 90% 이상의 글자수로 작성할 것.
+    - 제목, 설명, 마크업 등은 포함하지 말고 본문만 출력.
+    """
@@ -1,20 +1,96 @@
 # user_coverletter/views.py
-from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse
-from langchain_community.chat_models import ChatOpenAI
-from .models import UserCoverLetter
-from langchain_app.models import RecruitJob, CoverLetterPrompt, CoverLetterGuide
+from django.shortcuts import render, get_object_or_404
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Max, Min
+from django.urls import reverse
+from .models import UserCoverLetter, CoverLetterDraftJob, CoverLetterDraftItem
+from .tasks import generate_cover_letter_draft_task
+from langchain_app.models import RecruitJob, CoverLetterPrompt
 from user_experience.models import STARExperience
+from user_experience.embeddings import StarExperienceIndex, prompt_embeddings
 from django.contrib.auth.decorators import login_required
+from concurrent.futures import ThreadPoolExecutor
+from langchain_app.structured_output import Recommendation, predict_structured
+from .utils import (
+    llm,
+    draft_llm,
+    build_recommendation_prompt,
+    parse_recommended_ids,
+    assign_recommendations,
+    build_draft_prompt,
+    get_cover_letter_guide,
+)
+import asyncio
 import json
 import logging
-import re
 
 # 로깅 설정
 logger = logging.getLogger('django')
 
-# OpenAI API 설정
-llm = ChatOpenAI(model="gpt-4.1-2025-04-14", temperature=0.8)
+# 추천 LLM 호출을 동시에 보낼 최대 스레드 수
+MAX_RECOMMENDATION_WORKERS = 5
+
+# 문항별로 임베딩 유사도 상위 몇 개의 경험만 LLM 추천 프롬프트에 넣을지
+RECOMMENDATION_SHORTLIST = 8
+
+# 자기소개서 목록 한 페이지의 기본/최대 카드(채용 직무) 수
+COVER_LETTER_PAGE_SIZE = 20
+COVER_LETTER_MAX_PAGE_SIZE = 100
+
+
+def recommend_star_experiences(user, cover_letters):
+    """
+    문항별 추천 LLM 호출을 스레드 풀에서 동시에 수행한 뒤,
+    같은 경험이 여러 문항에 중복 추천되지 않도록 문항 순서대로 충돌을 해소하여 저장합니다.
+    """
+    # DB 조회는 요청 스레드에서 한 번만 수행하고, 워커 스레드는 LLM 호출만 담당
+    star_experiences = list(STARExperience.objects.filter(user=user))
+    if not star_experiences:
+        return
+    # 임베딩 유사도로 문항별 후보를 먼저 추린 뒤, LLM은 후보 중에서만 순위를 정함
+    index = StarExperienceIndex(star_experiences)
+    shortlists = [
+        [star for star, _ in index.top_k(vector, RECOMMENDATION_SHORTLIST)]
+        for vector in prompt_embeddings([cl.prompt for cl in cover_letters])
+    ]
+    prompt_texts = [
+        build_recommendation_prompt(
+            cl.prompt.outline,
+            "\n".join([f"{star.id}: {star.title}: {star.situation}" for star in shortlist])
+        )
+        for cl, shortlist in zip(cover_letters, shortlists)
+    ]
+
+    def _predict(prompt_text):
+        try:
+            recommendation = predict_structured(llm, prompt_text, Recommendation, fallback=parse_recommended_ids)
+            return list(dict.fromkeys(recommendation.ids))
+        except Exception as e:
+            logger.error(f"Error calling LLM for STARExperience recommendation: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=min(len(prompt_texts), MAX_RECOMMENDATION_WORKERS)) as executor:
+        recommended = list(executor.map(_predict, prompt_texts))
+
+    ranked_ids_list = []
+    for cover_letter, ranked_ids, shortlist in zip(cover_letters, recommended, shortlists):
+        logger.info(f"LLM recommendation for prompt {cover_letter.prompt_id}: {ranked_ids}")
+        # LLM 응답이 없거나 파싱에 실패하면 임베딩 유사도 순위를 그대로 사용
+        ranked_ids = ranked_ids or [star.id for star in shortlist]
+        logger.debug(f"Prompt {cover_letter.prompt_id} | recommended_ids={ranked_ids}")
+        ranked_ids_list.append(ranked_ids)
+
+    for cover_letter, star in zip(cover_letters, assign_recommendations(ranked_ids_list, star_experiences)):
+        if star is None:
+            continue
+        try:
+            cover_letter.recommended_starexperience.add(star)
+            logger.debug(f"CoverLetter {cover_letter.id} now has recommended experience: {star.id} {star.title}")
+        except Exception as e:
+            logger.error(f"Error recommending STARExperience for prompt {cover_letter.prompt_id}: {e}")
 
 
 @login_required
@@ -27,9 +103,6 @@ def create_cover_letter(request, recruit_job_id):
     recruit_job = get_object_or_404(RecruitJob, id=recruit_job_id)
     prompts = CoverLetterPrompt.objects.filter(recruit_job=recruit_job)
 
-    # 이미 추천된 경험의 제목을 추적하는 집합 (중복 추천 방지)
-    recommended_titles = set()
-
     cover_letters = []
     for prompt in prompts:
         cover_letter, created = UserCoverLetter.objects.get_or_create(
@@ -38,110 +111,13 @@ def create_cover_letter(request, recruit_job_id):
             prompt=prompt,
             defaults={'content': "", 'draft': True}
         )
-        # 추천 STARExperience가 없으면 LLM 호출
-        if not cover_letter.recommended_starexperience.exists():
-            try:
-                # 이미 추천된 경험 제목은 제외한 STARExperience 조회
-                star_experiences = STARExperience.objects.filter(user=user).exclude(title__in=recommended_titles)
-                # 후보 경험이 없다면 빈 문자열 전달
-                star_texts = "\n".join([f"{star.title}: {star.situation}" for star in star_experiences]) if star_experiences.exists() else ""
-                prompt_text = f"""
-                너의 목표는 아래 자기소개서 아웃라인에 가장 적합한 경험(STAR 구조 기반)을,  
-                논리적으로 판단하고, 가장 잘 어울리는 하나의 경험 ID만 선택하는 거야.
-
-                다음 단계를 따라 reasoning을 수행한 후,  
-                최종적으로 **가장 적합한 경험 하나의 ID**를 숫자 형태의 JSON 배열로만 반환해줘.
-
-                예: [2]
-
-                ---
-
-                ### [입력 데이터]
-
-                1. 자기소개서 아웃라인:
-                {prompt.outline}
-
-                2. STAR 형식의 경험 목록:
-                {star_texts}
-
-                ---
-
-                ### [작업 단계]
-
-                #### 1단계. 문항 핵심 주제 및 키워드 파악
-                - 아웃라인을 바탕으로 자기소개서 문항의 의도를 분석해.
-                - 이 문항에서 강조해야 할 **핵심 역량**, **핵심 가치**, **필수 기술/태도**를 추출해.
-
-                #### 2단계. 경험과 키워드 매칭
-                - STAR 경험 목록의 각 항목을 읽고, 각 경험이 어떤 역량과 가치를 보여주는지 판단해.
-                - 각 경험이 1단계에서 도출한 핵심 키워드와 얼마나 일치하는지 비교해.
-
-                #### 3단계. 평가 기준에 따라 적합도 판단
-                - 다음 기준을 참고해서 경험 간 우선순위를 판단해:
-                - Salesforce 플랫폼 관련 경험인가?
-                - 기술적 문제 해결 경험이 있는가?
-                - 사용자 요구 분석 및 협업이 포함되어 있는가?
-                - 결과가 구체적이고 측정 가능한가?
-                - 회사의 가치(고객 중심, 책임감, 지속적 학습)와 부합하는가?
-
-                #### 4단계. 최종 선택
-                - 위 기준에 가장 부합하는 **경험 하나의 ID**를 숫자만 포함한 JSON 배열 형식으로 반환해.
-                - 반드시 순수 JSON만 출력하고, 설명이나 기호는 포함하지 마.
-
-                ---
-
-                ### ✅ 출력 예시 (형식)
-
-                ```json
-                [1]
-                ```
-                """
-                response = llm.predict(prompt_text)
-                logger.info(f"LLM response for prompt {prompt.id}: {response}")
-                # 정규 표현식으로 코드 블록 내 JSON만 추출
-                match = re.search(r"```json\s*(.*?)\s*```", response, re.DOTALL)
-                if match:
-                    json_str = match.group(1)
-                else:
-                    json_str = response.strip()
-
-                try:
-                    recommended_raw = json.loads(json_str)
-                except Exception as e:
-                    logger.error(f"Error parsing JSON for prompt {prompt.id}: {e}")
-                    recommended_raw = []
-
-                new_recommended_ids = []
-                for rec in recommended_raw:
-                    if isinstance(rec, dict):
-                        rec_id = rec.get("STARExperienceID")
-                        try:
-                            rec_id = int(rec_id)
-                        except (ValueError, TypeError):
-                            continue
-                        new_recommended_ids.append(rec_id)
-                    else:
-                        try:
-                            new_recommended_ids.append(int(rec))
-                        except (ValueError, TypeError):
-                            continue
-                recommended_stars = STARExperience.objects.filter(user=user, id__in=new_recommended_ids)
-                if not recommended_stars.exists():
-                    # 사용자의 모든 STARExperience 중 첫 번째 항목을 fallback으로 사용
-                    recommended_stars = STARExperience.objects.filter(user=user)[:1]
-                cover_letter.recommended_starexperience.add(*recommended_stars)
-                #디버깅
-                logger.debug(f"Prompt {prompt.id} | recommended_ids={new_recommended_ids}")
-                logger.debug(f"CoverLetter {cover_letter.id} now has recommended experiences: "
-                             f"{list(cover_letter.recommended_starexperience.values('id','title'))}")
-
-                # 새로 추천된 경험들의 제목을 추적 집합에 추가
-                for star in recommended_stars:
-                    recommended_titles.add(star.title)
-            except Exception as e:
-                logger.error(f"Error recommending STARExperience for prompt {prompt.id}: {e}")
         cover_letters.append(cover_letter)
 
+    # 추천 STARExperience가 없는 문항만 LLM 호출 대상
+    pending = [cl for cl in cover_letters if not cl.recommended_starexperience.exists()]
+    if pending:
+        recommend_star_experiences(user, pending)
+
     # ---- GET 요청 처리 ----
     if request.method == 'GET':
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -188,153 +164,176 @@ def create_cover_letter(request, recruit_job_id):
 
 @login_required
 def generate_cover_letter_draft(request, recruit_job_id):
+    """
+    채용 직무의 모든 문항에 대한 초안 생성을 백그라운드 작업으로 등록합니다.
+    문항별 Celery 태스크가 병렬로 실행되며, 응답으로 받은 job_id로
+    draft-status 엔드포인트에서 진행 상황과 결과를 조회할 수 있습니다.
+    """
     if request.method == "POST":
         try:
             user = request.user
             recruit_job = get_object_or_404(RecruitJob, id=recruit_job_id)
             prompts = CoverLetterPrompt.objects.filter(recruit_job=recruit_job)
 
-            # 1) CoverLetterGuide 가져오기 (예: 1개만 있다고 가정)
-            try:
-                cover_letter_guide_obj = CoverLetterGuide.objects.first()
-                cover_letter_donts = cover_letter_guide_obj.cover_letter_donts
-                cover_letter_guide = cover_letter_guide_obj.cover_letter_guide
-            except:
-                # 가이드가 없다면 공백 문자열로 처리
-                cover_letter_donts = ""
-                cover_letter_guide = ""
-
+            cover_letters = []
             for prompt in prompts:
                 cover_letter = UserCoverLetter.objects.get(
                     user=user, 
                     recruit_job=recruit_job, 
                     prompt=prompt
                 )
-                star_experience = cover_letter.selected_starexperience
-                # 2) selected_starexperience가 없으면 recommended_starexperience 중 첫 번째 자동선택
-                if not star_experience:
+                # selected_starexperience가 없으면 recommended_starexperience 중 첫 번째 자동선택
+                if not cover_letter.selected_starexperience:
                     recommended = cover_letter.recommended_starexperience.first()
                     if recommended:
                         cover_letter.selected_starexperience = recommended
                         cover_letter.save()
-                        star_experience = recommended
                     else:
                         return JsonResponse(
                             {'error': f"No STAR experience selected for prompt {prompt.id}"},
                             status=400
                         )
+                cover_letters.append(cover_letter)
+
+            with transaction.atomic():
+                job = CoverLetterDraftJob.objects.create(user=user, recruit_job=recruit_job)
+                items = [
+                    CoverLetterDraftItem.objects.create(job=job, cover_letter=cover_letter)
+                    for cover_letter in cover_letters
+                ]
+                # 커밋 이후 문항별 태스크를 한 번에 등록 (fan-out)
+                item_ids = [item.id for item in items]
+                transaction.on_commit(
+                    lambda: [generate_cover_letter_draft_task.delay(item_id) for item_id in item_ids]
+                )
+            logger.info(f"Enqueued draft job {job.id} with {len(items)} prompts for recruit_job_id {recruit_job_id}")
 
-                # 3) 문항 글자수 제한 가져오기 (없으면 1000으로 가정)
-                char_limit = prompt.limit if prompt.limit else 1000
-
-                # 4) LLM 프롬프트 구성
-                prompt_text = f"""
-                다음은 자기소개서를 작성하기 위한 자료들이야.  
-                너의 목표는 이 정보를 바탕으로, **단순한 조합이 아닌 논리적인 사고 흐름을 따라 자기소개서를 작성**하는 거야.
-
-                최종 출력은 자기소개서 초안 한 편으로, 반드시 글자수 {char_limit}자 이내(최소 90%)로 작성할 것.  
-                출력에는 자기소개서 본문 외 아무 설명도 포함하지 마.
-
-                ---
-
-                ## 📘 입력 데이터
-
-                1. 자기소개서 문항
-                "{prompt.question_text}"
-
-                2. 아웃라인 (문항 분석, 키워드, 경험 연결)
-                {prompt.outline}
-
-                3. 선택된 STAR 경험  
-                - 제목: {star_experience.title}  
-                - 상황: {star_experience.situation}  
-                - 과제: {star_experience.task}  
-                - 행동: {star_experience.action}  
-                - 결과: {star_experience.result}
-
-                4. 채용 직무 정보  
-                - 직무 설명: {recruit_job.description}  
-                - 핵심 역할: {recruit_job.key_roles}  
-                - 요구 역량: {recruit_job.required_skills}  
-                - 관련 기술: {recruit_job.related_technologies}  
-                - 소프트 스킬: {recruit_job.soft_skills}  
-                - 필요 강점: {recruit_job.key_strengths}
-
-                5. 작성 가이드  
-                {cover_letter_guide}
-
-                6. 작성 시 피해야 할 내용  
-                {cover_letter_donts}
-
-                ---
-
-                ## 🧠 작업 순서 및 reasoning 지시
-
-                ### 1단계. 문항 분석
-                - 문항의 질문 의도를 분석해.
-                - 어떤 역량, 가치, 태도를 평가하려는지 파악하고, 아웃라인과 직무 정보에서 그에 맞는 키워드를 정리해.
-
-                ### 2단계. 경험 분석
-                - 선택된 STAR 경험을 통해 아웃라인에서 중요한 키워드들 중 지원자의 강조할 방향성을 정해.
-
-                ### 3단계. 핵심 메시지 설계
-                - STAR 경험과 문항/직무 요구사항을 연결해, 자기소개서에서 전하고자 하는 핵심 메시지를 한 문장으로 정의해.
-                - 이 메시지를 자기소개서의 중심 주제로 삼아.
+            return JsonResponse({
+                'job_id': str(job.id),
+                'status_url': reverse('user_coverletter:cover_letter_draft_status', args=[job.id]),
+                'total': len(items),
+            }, status=202)
 
-                ### 4단계. 자기소개서 전략 방향 설정
-                - 아웃라인과 선택된 STAR 경험을 따라서 자기소개서의 방향성을 정립해.
-                
-                ### 5단계. 자기소개서 문단 구성 계획
-                - 네가 정한 방향성에 따라서 자기소개서를 설계해.
-                - 그리고 적절한 부분에 선택된 STAR경험을 자연스럽게 녹여낼 부분을 정해.
-                +) 단, 문항이 자기 경험 중심이 아닐 경우에는 STAR 경험을 억지로 넣지 말고,
-                +) 해당 문항에 더 적합한 방향성(지원 동기, 가치관 등)으로 풀어가.
-                +) 아웃라인에서 '5단계: 경험 사례 매칭'은 참고하면 안돼.
+        except UserCoverLetter.DoesNotExist:
+            return JsonResponse({'error': 'Cover letters must be created before generating drafts.'}, status=400)
+        except Exception as e:
+            logger.error(f"Error generating drafts for recruit_job_id {recruit_job_id}: {e}")
+            return JsonResponse({'error': 'Error generating drafts.'}, status=500)
 
-                ### 6단계. 자기소개서 작성
-                - 작성가이드에 따라서 설계한 방향성과 구성에 따라 자기소개서를 {char_limit}의 90%이상 글자수로 작성해
+    else:
+        return JsonResponse({'error': 'Invalid request method.'}, status=400)
 
-                ### 7단계. 스타일 가이드 확인
-                - 글자 수: {char_limit}자 이내, 최소 90% 이상
-                - 어조: 간결하고 명확한 표현 사용, 말줄임표나 형식적인 표현 금지
-                - 강조: 수치 기반 결과 강조, 회사/직무와의 연결성 부각
-                - 자기소개서 작성 가이드에 맞춰서 작성해줘.
-                - 금지사항: {cover_letter_donts}를 읽고, 주해서 작성할 것
 
-                ---
+@login_required
+def cover_letter_draft_status(request, job_id):
+    """
+    초안 생성 작업의 문항별 진행 상황과 결과를 반환합니다.
+    status는 pending/running/done/failed 중 하나이며, 모든 문항이 끝나면 done(일부 실패 시 failed)이 됩니다.
+    """
+    job = get_object_or_404(CoverLetterDraftJob, id=job_id, user=request.user)
+    items = job.items.select_related('cover_letter').order_by('id')
+
+    item_list = []
+    for item in items:
+        item_list.append({
+            'prompt_id': item.cover_letter.prompt_id,
+            'cover_letter_id': item.cover_letter_id,
+            'status': item.status,
+            'content': item.cover_letter.content if item.status == CoverLetterDraftItem.STATUS_DONE else None,
+            'error': item.error or None,
+        })
 
-                ## 📝 출력 형식
+    return JsonResponse({
+        'job_id': str(job.id),
+        'recruit_job_id': job.recruit_job_id,
+        'status': job.status(items),
+        'total': len(item_list),
+        'completed': sum(1 for i in item_list if i['status'] == CoverLetterDraftItem.STATUS_DONE),
+        'failed': sum(1 for i in item_list if i['status'] == CoverLetterDraftItem.STATUS_FAILED),
+        'items': item_list,
+    })
 
-                - 네가 세운 자기소개서 설계와 자기소개서 본문을 2파트로 나눠서 출력할 것.
-                - 자기소개서 설계는 구조화된 글로 출력해줘.
-                - 구조화된 설계에는 자기소개서의 방향성, 주요 키워드, 핵심 메시지, STAR경험에서 강조할 점, 서론, 본론, 결론 개조식으로 포함해서 구조화할 것.
-                - 자기소개서 본문은 {char_limit}의 90% 이상의 글자수로 작성할 것.
-                - 제목, 설명, 마크업 등은 포함하지 말고 본문만 출력.
-                """
+async def stream_cover_letter_draft(request, cover_letter_id):
+    """
+    하나의 자기소개서 문항 초안을 토큰 단위로 생성하여 Server-Sent Events로 전송합니다.
+    - 토큰마다 `data: {"token": "..."}` 이벤트를 보내고
+    - 생성이 끝나면 UserCoverLetter.content에 저장한 뒤 `event: done` 이벤트를 보냅니다.
+    - 클라이언트 연결이 끊기거나(취소) 생성 중 오류가 나면, 그때까지 받은 토큰을 draft=True로 저장합니다.
+    스트리밍이 버퍼링 없이 전달되려면 ASGI 서버(jssgpt_project.asgi:application)로 서비스해야 합니다.
+    """
+    if request.method != "GET":
+        return JsonResponse({'error': 'Invalid request method.'}, status=405)
 
-                # 5) LLM 호출
-                response = llm.predict(prompt_text)
-                logger.info(f"LLM draft response for prompt {prompt.id}: {response}")
+    user = await sync_to_async(lambda: request.user if request.user.is_authenticated else None)()
+    if user is None:
+        return JsonResponse({'error': 'Authentication required.'}, status=401)
 
-                # 7) DB 저장
-                cover_letter.content = response
-                cover_letter.draft = False
-                cover_letter.save()
+    def _prepare():
+        cover_letter = get_object_or_404(
+            UserCoverLetter.objects.select_related('prompt', 'recruit_job', 'selected_starexperience'),
+            pk=cover_letter_id,
+            user=user,
+        )
+        # selected_starexperience가 없으면 recommended_starexperience 중 첫 번째 자동선택
+        if not cover_letter.selected_starexperience:
+            recommended = cover_letter.recommended_starexperience.first()
+            if not recommended:
+                return cover_letter, None
+            cover_letter.selected_starexperience = recommended
+            cover_letter.save()
+        cover_letter_guide, cover_letter_donts = get_cover_letter_guide()
+        prompt_text = build_draft_prompt(
+            cover_letter.prompt,
+            cover_letter.recruit_job,
+            cover_letter.selected_starexperience,
+            cover_letter_guide,
+            cover_letter_donts,
+        )
+        return cover_letter, prompt_text
+
+    try:
+        cover_letter, prompt_text = await sync_to_async(_prepare)()
+    except Http404:
+        return JsonResponse({'error': 'Cover letter not found.'}, status=404)
+    if prompt_text is None:
+        return JsonResponse(
+            {'error': f"No STAR experience selected for prompt {cover_letter.prompt_id}"},
+            status=400
+        )
 
-            # 8) 생성된 초안 중 첫 번째 커버레터 편집화면으로 이동
-            first_cover_letter = UserCoverLetter.objects.filter(
-                user=user, 
-                recruit_job=recruit_job
-            ).first()
-            if first_cover_letter:
-                return redirect('user_coverletter:edit_cover_letter', pk=first_cover_letter.pk)
+    def _save(content, draft=False):
+        cover_letter.content = content
+        cover_letter.draft = draft
+        cover_letter.save()
 
+    async def event_stream():
+        parts = []
+        saved = False
+        try:
+            async for chunk in draft_llm.astream(prompt_text):
+                if not chunk.content:
+                    continue
+                parts.append(chunk.content)
+                yield f"data: {json.dumps({'token': chunk.content}, ensure_ascii=False)}\n\n"
+            await sync_to_async(_save)("".join(parts))
+            saved = True
+            logger.info(f"Streamed draft saved for cover letter {cover_letter.id}")
+            yield f"event: done\ndata: {json.dumps({'cover_letter_id': cover_letter.id})}\n\n"
         except Exception as e:
-            logger.error(f"Error generating drafts for recruit_job_id {recruit_job_id}: {e}")
-            return JsonResponse({'error': 'Error generating drafts.'}, status=500)
+            logger.error(f"Error streaming draft for cover letter {cover_letter.id}: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': 'Error generating draft.'})}\n\n"
+        finally:
+            # 연결이 끊기면 CancelledError(작업 취소) 또는 GeneratorExit(스트림 닫힘)로 여기까지 옴.
+            # 이미 비용을 낸 토큰을 버리지 않도록 받은 부분까지 초안으로 저장 (저장 중 다시 취소되어도 끝까지 저장)
+            if parts and not saved:
+                await asyncio.shield(sync_to_async(_save)("".join(parts), draft=True))
+                logger.info(f"Partial streamed draft saved for cover letter {cover_letter.id}")
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 비활성화
+    return response
 
-    else:
-        return JsonResponse({'error': 'Invalid request method.'}, status=400)
 
 @login_required
 def edit_cover_letter(request, pk):
@@ -379,38 +378,59 @@ def list_cover_letters(request):
       - recruit_job_id: 해당 직무의 id
       - updated_at: 그룹 내 최신 수정일 (ISO 형식)
       - essay_questions: 해당 채용 직무에 속한 자기소개서 문항 목록 (각 항목은 {id, question_text, limit})
+    ?page=, ?page_size= 로 페이지를 나누며, 응답은 {results, page, num_pages, count} 형태입니다.
     """
-    cover_letters = UserCoverLetter.objects.filter(user=request.user)
-    grouped = {}
+    # 1) 채용 직무별 최신 수정일로 그룹을 정렬해 현재 페이지의 그룹만 가져옴
+    groups = (
+        UserCoverLetter.objects.filter(user=request.user)
+        .values('recruit_job_id')
+        .annotate(last_updated=Max('updated_at'), representative_id=Min('id'))
+        .order_by('-last_updated', 'recruit_job_id')
+    )
+    try:
+        page_size = min(int(request.GET.get('page_size', COVER_LETTER_PAGE_SIZE)), COVER_LETTER_MAX_PAGE_SIZE)
+    except ValueError:
+        return JsonResponse({"error": "page_size는 숫자여야 합니다."}, status=400)
+    page = Paginator(groups, max(1, page_size)).get_page(request.GET.get('page'))
+
+    # 2) 페이지에 속한 자기소개서를 관련 직무/회사/문항과 함께 한 번에 조회
+    grouped = {
+        group['recruit_job_id']: {
+            'id': group['representative_id'],
+            'recruit_job_id': group['recruit_job_id'],
+            'updated_at': group['last_updated'].isoformat(),
+            'essay_questions': [],
+            'question_ids': set(),
+        }
+        for group in page.object_list
+    }
+    cover_letters = (
+        UserCoverLetter.objects.filter(user=request.user, recruit_job_id__in=grouped)
+        .select_related('recruit_job__recruitment__company', 'prompt')
+        .order_by('id')
+    )
     for cl in cover_letters:
-        job_id = cl.recruit_job.id
-        if job_id not in grouped:
-            grouped[job_id] = {
-                'id': cl.id,
-                'company_name': cl.recruit_job.recruitment.company.name,
-                'recruit_job_title': cl.recruit_job.title,
-                'recruit_job_id': cl.recruit_job.id,
-                'updated_at': cl.updated_at,
-                'essay_questions': [{
-                    'id': cl.prompt.id,
-                    'question_text': cl.prompt.question_text,
-                    'limit': cl.prompt.limit,
-                }],
-            }
-        else:
-            if cl.updated_at > grouped[job_id]['updated_at']:
-                grouped[job_id]['updated_at'] = cl.updated_at
-            if not any(q['id'] == cl.prompt.id for q in grouped[job_id]['essay_questions']):
-                grouped[job_id]['essay_questions'].append({
-                    'id': cl.prompt.id,
-                    'question_text': cl.prompt.question_text,
-                    'limit': cl.prompt.limit,
-                })
-    
-    result = sorted(grouped.values(), key=lambda x: x['updated_at'], reverse=True)
-    for item in result:
-        item['updated_at'] = item['updated_at'].isoformat()
-    return JsonResponse(result, safe=False)
+        item = grouped[cl.recruit_job_id]
+        item['company_name'] = cl.recruit_job.recruitment.company.name
+        item['recruit_job_title'] = cl.recruit_job.title
+        if cl.prompt_id not in item['question_ids']:
+            item['question_ids'].add(cl.prompt_id)
+            item['essay_questions'].append({
+                'id': cl.prompt.id,
+                'question_text': cl.prompt.question_text,
+                'limit': cl.prompt.limit,
+            })
+
+    results = []
+    for item in grouped.values():
+        del item['question_ids']
+        results.append(item)
+    return JsonResponse({
+        'results': results,
+        'page': page.number,
+        'num_pages': page.paginator.num_pages,
+        'count': page.paginator.count,
+    })
 
 
 @login_required
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import RawExperience, STARExperience
+from .models import RawExperience, STARExperience, ResumeIngestionJob
 
 class STARExperienceInline(admin.TabularInline):
     model = STARExperience
@@ -11,6 +11,12 @@ class STARExperienceInline(admin.TabularInline):
 class RawExperienceAdmin(admin.ModelAdmin):
     list_display = ('user', 'resume_file', 'created_at', 'updated_at')
     inlines = [STARExperienceInline]  # Star Experience를 인라인으로 포함
+
+@admin.register(ResumeIngestionJob)
+class ResumeIngestionJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'stage', 'created_at', 'updated_at')
+    list_filter = ('stage',)
+    readonly_fields = ('star_data', 'dedup_plan', 'star_ids', 'error', 'created_at', 'updated_at')
     from django.contrib import admin
 
 from django.contrib import admin
@@ -0,0 +1,139 @@
+# user_experience/embeddings.py
+import hashlib
+import logging
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger('django')
+
+# 임베딩 벡터는 float32 바이트열로 DB(BinaryField)에 저장
+EMBEDDING_DTYPE = np.float32
+
+
+class HashingEmbedder:
+    """
+    문자 n-gram 해싱 벡터 기반 임베딩입니다. 학습/네트워크가 필요 없고 항상 같은 결과를 내므로
+    기본 백엔드와 테스트에 사용합니다. 한국어는 형태소 분석 없이도 문자 n-gram으로 충분히 비교됩니다.
+    """
+
+    def __init__(self, dim):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        self.name = f"hashing-{dim}"
+        self.vectorizer = HashingVectorizer(
+            n_features=dim, analyzer="char_wb", ngram_range=(2, 3), alternate_sign=False, norm="l2"
+        )
+
+    def embed(self, texts):
+        return self.vectorizer.transform(texts).toarray().astype(EMBEDDING_DTYPE)
+
+
+class OpenAIEmbedder:
+    """
+    OpenAI 임베딩 API를 사용하는 백엔드입니다. (EMBEDDING_BACKEND=openai)
+    """
+
+    def __init__(self, model):
+        from langchain_community.embeddings import OpenAIEmbeddings
+        self.name = f"openai-{model}"
+        self.client = OpenAIEmbeddings(model=model)
+
+    def embed(self, texts):
+        vectors = np.asarray(self.client.embed_documents(list(texts)), dtype=EMBEDDING_DTYPE)
+        return normalize(vectors)
+
+
+_embedder = None
+
+
+def get_embedder():
+    global _embedder
+    if _embedder is None:
+        if settings.EMBEDDING_BACKEND == "openai":
+            _embedder = OpenAIEmbedder(settings.EMBEDDING_MODEL)
+        else:
+            _embedder = HashingEmbedder(settings.EMBEDDING_DIM)
+    return _embedder
+
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def embedding_key(embedder, text):
+    """
+    임베딩을 만든 백엔드와 원문으로 만든 키입니다. 원문이나 백엔드가 바뀌면 키가 달라져 다시 계산합니다.
+    """
+    return hashlib.sha256(f"{embedder.name}|{text}".encode("utf-8")).hexdigest()
+
+
+def star_text(star):
+    return "\n".join([star.title, star.situation, star.task, star.action, star.result])
+
+
+def to_bytes(vector):
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def from_bytes(data):
+    return np.frombuffer(bytes(data), dtype=EMBEDDING_DTYPE)
+
+
+def ensure_embeddings(instances, text_func, embedding_field="embedding", key_field="embedding_key"):
+    """
+    instances 중 임베딩이 없거나 원문이 바뀐 항목만 한 번에 임베딩하여 bulk_update로 저장합니다.
+    각 인스턴스의 임베딩(np.ndarray) 목록을 instances 순서대로 반환합니다.
+    """
+    embedder = get_embedder()
+    keys = [embedding_key(embedder, text_func(instance)) for instance in instances]
+    stale = [
+        (instance, key) for instance, key in zip(instances, keys)
+        if getattr(instance, key_field) != key or getattr(instance, embedding_field) is None
+    ]
+    if stale:
+        vectors = embedder.embed([text_func(instance) for instance, _ in stale])
+        for (instance, key), vector in zip(stale, vectors):
+            setattr(instance, embedding_field, to_bytes(vector))
+            setattr(instance, key_field, key)
+        model = type(stale[0][0])
+        model.objects.bulk_update([instance for instance, _ in stale], [embedding_field, key_field])
+        logger.debug(f"Computed {len(stale)} {model.__name__} embeddings with {embedder.name}")
+    return [from_bytes(getattr(instance, embedding_field)) for instance in instances]
+
+
+def prompt_embeddings(prompts):
+    """
+    자기소개서 문항 아웃라인(없으면 문항)의 임베딩 목록을 반환합니다. 계산 결과는 CoverLetterPrompt에 저장됩니다.
+    """
+    return ensure_embeddings(
+        list(prompts), lambda p: p.outline or p.question_text,
+        embedding_field="outline_embedding", key_field="outline_embedding_key",
+    )
+
+
+class StarExperienceIndex:
+    """
+    한 사용자의 STAR 경험 임베딩을 (경험 수 x 차원) NumPy 행렬로 들고 있는 인덱스입니다.
+    벡터가 정규화되어 있으므로 행렬-벡터 곱 한 번으로 코사인 유사도를 계산합니다.
+    """
+
+    def __init__(self, star_experiences):
+        self.star_experiences = list(star_experiences)
+        vectors = ensure_embeddings(self.star_experiences, star_text)
+        self.matrix = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+
+    def __len__(self):
+        return len(self.star_experiences)
+
+    def top_k(self, query_vector, k):
+        """
+        query_vector와 코사인 유사도가 높은 순으로 최대 k개의 (STARExperience, 유사도)를 반환합니다.
+        """
+        if not self.star_experiences or k <= 0:
+            return []
+        scores = self.matrix @ np.asarray(query_vector, dtype=EMBEDDING_DTYPE)
+        k = min(k, len(scores))
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.star_experiences[i], float(scores[i])) for i in ranked]
@@ -1,7 +1,17 @@
 from django import forms
 from .models import RawExperience
+from .pdf_extraction import ResumeLimitExceeded, check_upload_size
 
 class ResumeUploadForm(forms.ModelForm):
     class Meta:
         model = RawExperience
-        fields = ['resume_file']
\ No newline at end of file
+        fields = ['resume_file']
+
+    def clean_resume_file(self):
+        resume_file = self.cleaned_data.get('resume_file')
+        if resume_file:
+            try:
+                check_upload_size(resume_file)
+            except ResumeLimitExceeded as e:
+                raise forms.ValidationError(str(e))
+        return resume_file
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_experience', '0003_alter_rawexperience_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='starexperience',
+            index=models.Index(fields=['user', '-updated_at'], name='starexperience_user_upd_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_experience', '0004_starexperience_starexperience_user_upd_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='starexperience',
+            name='embedding',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='starexperience',
+            name='embedding_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+    ]
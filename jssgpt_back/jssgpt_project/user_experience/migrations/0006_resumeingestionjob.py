@@ -0,0 +1,32 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('user_experience', '0005_starexperience_embedding_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeIngestionJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('stage', models.CharField(choices=[('queued', '대기 중'), ('extracting', '텍스트 추출 중'), ('structuring', 'STAR 구조화 중'), ('deduplicating', '중복 검사 중'), ('persisting', '저장 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=20)),
+                ('error', models.TextField(blank=True, default='')),
+                ('star_data', models.JSONField(blank=True, default=list)),
+                ('dedup_plan', models.JSONField(blank=True, default=list)),
+                ('star_ids', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('raw_experience', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ingestion_jobs', to='user_experience.rawexperience')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_ingestion_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -1,3 +1,4 @@
+import uuid
 from django.db import models
 from django.contrib.auth.models import User
 
@@ -19,8 +20,53 @@ class STARExperience(models.Model):
     task = models.TextField()
     action = models.TextField()
     result = models.TextField()
+    embedding = models.BinaryField(null=True, blank=True, editable=False)  # 추천용 임베딩 (float32)
+    embedding_key = models.CharField(max_length=64, null=True, blank=True, editable=False)  # 임베딩 원문/백엔드 해시
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 사용자별 STAR 경험 목록 (최근 수정 순)
+            models.Index(fields=["user", "-updated_at"], name="starexperience_user_upd_idx"),
+        ]
+
     def __str__(self):
-        return f"STARExperience: {self.title} (User: {self.user.username})"
\ No newline at end of file
+        return f"STARExperience: {self.title} (User: {self.user.username})"
+
+
+class ResumeIngestionJob(models.Model):
+    """
+    이력서 업로드 후 Celery 파이프라인(추출 → 구조화 → 중복 검사 → 저장)의 진행 상황과 중간 결과를 기록합니다.
+    """
+    STAGE_QUEUED = "queued"
+    STAGE_EXTRACTING = "extracting"
+    STAGE_STRUCTURING = "structuring"
+    STAGE_DEDUPLICATING = "deduplicating"
+    STAGE_PERSISTING = "persisting"
+    STAGE_DONE = "done"
+    STAGE_FAILED = "failed"
+    STAGE_CHOICES = [
+        (STAGE_QUEUED, "대기 중"),
+        (STAGE_EXTRACTING, "텍스트 추출 중"),
+        (STAGE_STRUCTURING, "STAR 구조화 중"),
+        (STAGE_DEDUPLICATING, "중복 검사 중"),
+        (STAGE_PERSISTING, "저장 중"),
+        (STAGE_DONE, "완료"),
+        (STAGE_FAILED, "실패"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resume_ingestion_jobs')
+    raw_experience = models.ForeignKey(RawExperience, on_delete=models.CASCADE, related_name='ingestion_jobs')
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES, default=STAGE_QUEUED)
+    error = models.TextField(blank=True, default="")
+    star_data = models.JSONField(default=list, blank=True)  # LLM이 구조화한 STAR 경험 목록
+    dedup_plan = models.JSONField(default=list, blank=True)  # 항목별 갱신 대상 (plan_star_dedup 결과)
+    star_ids = models.JSONField(default=list, blank=True)  # 저장(갱신/생성)된 STARExperience id 목록
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} - {self.stage} ({self.id})"
+
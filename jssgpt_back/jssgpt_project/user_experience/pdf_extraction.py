@@ -0,0 +1,169 @@
+# user_experience/pdf_extraction.py
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from billiard import Pool
+from django.conf import settings
+from django.core.cache import caches
+import pdfplumber
+
+logger = logging.getLogger('django')
+
+# settings.CACHES에 정의된 추출 텍스트 캐시 alias
+PDF_TEXT_CACHE_ALIAS = "pdf_text"
+# 해시 계산/임시 파일 복사 시 한 번에 읽는 크기
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class ResumeLimitExceeded(ValueError):
+    """업로드한 PDF가 크기 또는 페이지 수 제한을 넘었을 때 발생합니다."""
+
+
+def file_digest(file):
+    """
+    파일(경로 또는 파일 객체)을 조각 단위로 읽어 내용의 sha256을 계산합니다.
+    파일 객체는 읽은 뒤 처음 위치로 되돌립니다.
+    """
+    digest = hashlib.sha256()
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    file.seek(0)
+    for chunk in iter(lambda: file.read(READ_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def file_size(file):
+    if isinstance(file, (str, os.PathLike)):
+        return os.path.getsize(file)
+    size = getattr(file, 'size', None)
+    if size is None:
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+    return size
+
+
+def check_upload_size(file):
+    """
+    업로드 크기 제한(RESUME_MAX_UPLOAD_BYTES)을 검사합니다.
+    """
+    size = file_size(file)
+    if size > settings.RESUME_MAX_UPLOAD_BYTES:
+        raise ResumeLimitExceeded(
+            f"PDF 크기({size} bytes)가 제한({settings.RESUME_MAX_UPLOAD_BYTES} bytes)을 초과했습니다."
+        )
+
+
+def cache_key(digest):
+    return f"pdf_text:{digest}"
+
+
+def iter_page_texts(path, start, end):
+    """
+    [start, end) 범위의 페이지를 하나씩 열어 텍스트를 내보냅니다.
+    페이지마다 close()로 파싱 결과를 해제하므로 전체 페이지 객체를 메모리에 쌓아두지 않습니다.
+    """
+    with pdfplumber.open(path, pages=range(start + 1, end + 1)) as pdf:
+        for page in pdf.pages:
+            try:
+                yield page.extract_text() or ""
+            finally:
+                page.close()
+
+
+def extract_page_range(path, start, end):
+    """
+    프로세스 풀에서 실행되는 작업 단위입니다. 페이지 범위의 텍스트를 이어 붙여 반환합니다.
+    """
+    return "".join(iter_page_texts(path, start, end))
+
+
+def count_pages(path):
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def page_ranges(page_count, pages_per_chunk):
+    return [
+        (start, min(start + pages_per_chunk, page_count))
+        for start in range(0, page_count, pages_per_chunk)
+    ]
+
+
+def extract_text_from_path(path, page_count):
+    """
+    페이지 범위를 나눠 프로세스 풀에서 병렬로 추출합니다. 페이지가 적거나 풀을 만들 수 없으면 직렬로 추출합니다.
+    결과는 항상 페이지 순서대로 합쳐집니다.
+    Celery prefork 워커는 데몬 프로세스라 multiprocessing/concurrent.futures 풀을 만들 수 없으므로,
+    데몬 프로세스에서도 자식 프로세스를 허용하는 billiard 풀을 사용합니다.
+    """
+    ranges = page_ranges(page_count, max(1, settings.RESUME_PAGES_PER_CHUNK))
+    workers = min(settings.RESUME_EXTRACT_WORKERS, len(ranges))
+    if workers > 1:
+        try:
+            pool = Pool(processes=workers)
+            try:
+                # 범위마다 apply_async로 보냄. billiard의 map/starmap은 여러 워커가 나눠 처리하면
+                # 첫 워커의 완료 카운터만 올려, 나머지 워커가 종료 전에 최대 30초씩 기다림
+                results = [pool.apply_async(extract_page_range, (path, start, end)) for start, end in ranges]
+                return "".join(result.get() for result in results)
+            finally:
+                pool.close()
+                pool.join()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Parallel PDF extraction failed, falling back to serial: {e}")
+    return "".join(iter_page_texts(path, 0, page_count))
+
+
+def extract_pdf_text(file):
+    """
+    PDF 파일(경로 또는 파일 객체)의 모든 페이지 텍스트를 이어 붙여 반환합니다.
+    - 파일 내용의 sha256으로 캐시를 조회하여, 같은 파일을 다시 올리면 추출을 건너뜁니다.
+    - 크기(RESUME_MAX_UPLOAD_BYTES)/페이지 수(RESUME_MAX_PAGES) 제한을 넘으면 ResumeLimitExceeded를 발생시킵니다.
+    """
+    check_upload_size(file)
+    digest = file_digest(file)
+    cache = caches[PDF_TEXT_CACHE_ALIAS]
+    try:
+        cached = cache.get(cache_key(digest))
+    except Exception as e:
+        logger.warning(f"PDF text cache read failed: {e}")
+        cached = None
+    if cached is not None:
+        logger.debug(f"PDF text cache hit ({digest})")
+        return cached
+
+    # 프로세스 풀에는 파일 객체를 넘길 수 없으므로, 경로가 없는 파일은 임시 파일로 복사
+    temp_path = None
+    if isinstance(file, (str, os.PathLike)):
+        path = os.fspath(file)
+    else:
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            shutil.copyfileobj(file, temp_file, READ_CHUNK_SIZE)
+            temp_path = path = temp_file.name
+        file.seek(0)
+
+    try:
+        page_count = count_pages(path)
+        if page_count > settings.RESUME_MAX_PAGES:
+            raise ResumeLimitExceeded(
+                f"PDF 페이지 수({page_count})가 제한({settings.RESUME_MAX_PAGES})을 초과했습니다."
+            )
+        text = extract_text_from_path(path, page_count)
+    finally:
+        if temp_path:
+            os.remove(temp_path)
+
+    try:
+        cache.set(cache_key(digest), text)
+    except Exception as e:
+        logger.warning(f"PDF text cache write failed: {e}")
+    return text
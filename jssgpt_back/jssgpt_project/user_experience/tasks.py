@@ -0,0 +1,131 @@
+import logging
+from celery import chain, current_app, shared_task
+from .models import ResumeIngestionJob, STARExperience
+from .pdf_extraction import extract_pdf_text
+from .utils import (
+    llm,
+    extract_star_items,
+    get_star_guide,
+    persist_star_experiences,
+    plan_star_dedup,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_stage(job_id, stage, func):
+    """
+    파이프라인 한 단계를 실행합니다. 이전 단계가 실패했으면(job_id가 None) 건너뛰고,
+    실패하면 작업을 failed로 기록한 뒤 None을 반환해 이후 단계가 실행되지 않도록 합니다.
+    """
+    if job_id is None:
+        return None
+    try:
+        job = ResumeIngestionJob.objects.select_related('raw_experience', 'user').get(id=job_id)
+    except ResumeIngestionJob.DoesNotExist:
+        logger.error(f"ResumeIngestionJob id {job_id} not found.")
+        return None
+
+    job.stage = stage
+    job.save(update_fields=['stage', 'updated_at'])
+    try:
+        func(job)
+    except Exception as e:
+        logger.error(f"Resume ingestion failed at {stage} for job {job_id}: {e}", exc_info=True)
+        job.stage = ResumeIngestionJob.STAGE_FAILED
+        job.error = str(e)
+        job.save(update_fields=['stage', 'error', 'updated_at'])
+        return None
+    return job_id
+
+
+@shared_task
+def extract_resume_text_task(job_id):
+    """
+    1단계: 업로드된 PDF에서 텍스트를 추출해 RawExperience에 저장합니다.
+    로컬 저장소면 파일 경로를 그대로 넘겨 임시 파일 복사 없이 페이지 범위별로 추출합니다.
+    """
+    def _extract(job):
+        raw_experience = job.raw_experience
+        try:
+            resume_path = raw_experience.resume_file.path
+        except NotImplementedError:
+            resume_path = None
+        if resume_path:
+            raw_experience.extracted_text = extract_pdf_text(resume_path)
+        else:
+            with raw_experience.resume_file.open('rb') as resume_file:
+                raw_experience.extracted_text = extract_pdf_text(resume_file)
+        raw_experience.save(update_fields=['extracted_text', 'updated_at'])
+
+    return run_stage(job_id, ResumeIngestionJob.STAGE_EXTRACTING, _extract)
+
+
+@shared_task
+def structure_resume_task(job_id):
+    """
+    2단계: LLM으로 추출 텍스트를 STAR 구조로 정리합니다.
+    긴 이력서는 청크로 나눠 동시에 추출한 뒤 합칩니다. (extract_star_items)
+    """
+    def _structure(job):
+        job.star_data = extract_star_items(job.raw_experience.extracted_text, get_star_guide(), llm)
+        job.save(update_fields=['star_data', 'updated_at'])
+
+    return run_stage(job_id, ResumeIngestionJob.STAGE_STRUCTURING, _structure)
+
+
+@shared_task
+def deduplicate_star_task(job_id):
+    """
+    3단계: 기존 STAR 경험과 비교해 각 항목을 갱신할지 새로 만들지 결정합니다.
+    """
+    def _deduplicate(job):
+        existing_stars = list(STARExperience.objects.filter(user=job.user).only('id', 'situation'))
+        job.dedup_plan = plan_star_dedup(existing_stars, job.star_data)
+        job.save(update_fields=['dedup_plan', 'updated_at'])
+
+    return run_stage(job_id, ResumeIngestionJob.STAGE_DEDUPLICATING, _deduplicate)
+
+
+@shared_task
+def persist_star_task(job_id):
+    """
+    4단계: 중복 검사 결과대로 STAR 경험을 일괄 갱신/생성하고 작업을 완료 처리합니다.
+    """
+    def _persist(job):
+        job.star_ids = persist_star_experiences(job.user, job.raw_experience, job.star_data, job.dedup_plan)
+        job.stage = ResumeIngestionJob.STAGE_DONE
+        job.save(update_fields=['star_ids', 'stage', 'updated_at'])
+
+    return run_stage(job_id, ResumeIngestionJob.STAGE_PERSISTING, _persist)
+
+
+def resume_ingestion_pipeline(job_id):
+    """
+    추출 → 구조화 → 중복 검사 → 저장 순서의 Celery chain을 반환합니다. 각 단계는 job_id를 다음 단계로 넘깁니다.
+    """
+    return chain(
+        extract_resume_text_task.s(str(job_id)),
+        structure_resume_task.s(),
+        deduplicate_star_task.s(),
+        persist_star_task.s(),
+    )
+
+
+def run_resume_ingestion(job_id):
+    """
+    브로커 없이 현재 프로세스에서 단계를 순서대로 실행합니다.
+    eager 모드에서 chain.apply()는 단계 사이에 결과 get()을 호출하는데, 여러 스레드가 동시에 eager 태스크를
+    실행하면(부하 테스트 등) Celery의 전역 블로킹 검사에 걸리므로 태스크 함수를 직접 호출합니다.
+    """
+    job_id = str(job_id)
+    for task in (extract_resume_text_task, structure_resume_task, deduplicate_star_task, persist_star_task):
+        job_id = task(job_id)
+    return job_id
+
+
+def start_resume_ingestion(job_id):
+    if current_app.conf.task_always_eager:
+        run_resume_ingestion(job_id)
+    else:
+        resume_ingestion_pipeline(job_id).delay()
@@ -1,7 +1,53 @@
-from django.test import TestCase
-from .models import RawExperience, STARExperience
+import io
+import json
+import tempfile
+import billiard
+from unittest.mock import MagicMock, patch
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from .models import RawExperience, STARExperience, ResumeIngestionJob
+from .embeddings import StarExperienceIndex, get_embedder
+from . import pdf_extraction
+from .pdf_extraction import ResumeLimitExceeded, extract_pdf_text
+from .tasks import resume_ingestion_pipeline
+from .utils import PLACEHOLDER, extract_star_items, find_duplicate_targets, split_resume_text
 from django.contrib.auth.models import User
 
+TEST_CACHES = {
+    **settings.CACHES,
+    'pdf_text': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pdf-text-test'},
+}
+
+
+def make_pdf(page_texts):
+    """
+    페이지마다 한 줄의 텍스트가 있는 최소 PDF 바이트열을 만듭니다.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = io.BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
 class ResumeUploadTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='password123')
@@ -9,4 +55,203 @@ class ResumeUploadTest(TestCase):
     def test_raw_experience_creation(self):
         raw = RawExperience.objects.create(user=self.user, extracted_text="Sample text")
         self.assertEqual(raw.user.username, 'testuser')
-        self.assertEqual(raw.extracted_text, "Sample text")
\ No newline at end of file
+        self.assertEqual(raw.extracted_text, "Sample text")
+
+
+class StarExperienceIndexTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='embeduser', password='password123')
+        raw = RawExperience.objects.create(user=self.user, extracted_text="")
+        self.stars = [
+            STARExperience.objects.create(user=self.user, raw_experience=raw, title=title,
+                                          situation=situation, task="", action="", result="")
+            for title, situation in [
+                ("해커톤 우승", "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다"),
+                ("카페 아르바이트", "주말마다 카페에서 고객 응대와 재고 관리를 맡았다"),
+                ("데이터 분석 인턴", "스타트업에서 고객 이탈 데이터를 분석했다"),
+            ]
+        ]
+
+    def test_top_k_ranks_by_similarity_and_caches_embeddings(self):
+        index = StarExperienceIndex(self.stars)
+        query = get_embedder().embed(["해커톤에서 팀을 이끌어 개발한 경험"])[0]
+        ranked = [star.title for star, _ in index.top_k(query, 2)]
+        self.assertEqual(len(ranked), 2)
+        self.assertEqual(ranked[0], "해커톤 우승")
+        self.assertTrue(all(star.embedding_key for star in STARExperience.objects.filter(user=self.user)))
+        # 원문이 바뀌지 않았으면 다시 계산하지 않음
+        with self.assertNumQueries(0):
+            StarExperienceIndex(self.stars)
+
+
+class FindDuplicateTargetsTest(SimpleTestCase):
+    def test_matches_existing_and_earlier_incoming(self):
+        existing = [
+            "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다",
+            "주말마다 카페에서 고객 응대와 재고 관리를 맡았다",
+        ]
+        incoming = [
+            "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다",  # 기존 0번과 중복
+            "스타트업에서 고객 이탈 데이터를 분석했다",  # 새 경험 (인덱스 3)
+            "스타트업에서 고객 이탈 데이터를 분석했다",  # 방금 생성될 경험과 중복
+            PLACEHOLDER,
+            PLACEHOLDER,
+        ]
+        self.assertEqual(find_duplicate_targets(existing, incoming), [0, None, 3, None, None])
+
+    def test_empty_vocabulary(self):
+        self.assertEqual(find_duplicate_targets([], ["", PLACEHOLDER]), [None, None])
+
+    def test_pair_similarity_does_not_depend_on_rest_of_batch(self):
+        # 두 텍스트로만 학습한 TF-IDF 유사도 0.75로 중복이던 쌍. 배치 전체로 학습하면 0.66으로 떨어져 새 경험이 되었음
+        existing = "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다"
+        incoming = "교내 해커톤에서 팀을 이끌어 추천 모델을 개발했다"
+        others = ["교내 해커톤에서 팀을 이끌어 게임을 개발했다", "교내 해커톤에서 팀을 이끌어 앱을 개발했다"]
+        self.assertEqual(find_duplicate_targets([existing], [incoming]), [0])
+        self.assertEqual(find_duplicate_targets([existing] + others, [incoming]), [0])
+
+
+class ExtractStarItemsTest(SimpleTestCase):
+    def test_split_prefers_section_boundaries(self):
+        sections = [f"● 프로젝트 {i}\n" + "내용 " * 40 for i in range(4)]
+        chunks = split_resume_text("\n".join(sections), chunk_size=300, chunk_overlap=0)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 300 for chunk in chunks))
+        self.assertTrue(all(chunk.startswith("●") for chunk in chunks))
+
+    @patch('user_experience.utils.split_resume_text', return_value=["청크 A", "청크 B", "청크 C"])
+    def test_chunks_are_extracted_and_merged(self, mock_split):
+        hackathon = "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다"
+        responses = {
+            "청크 A": [{"title": "해커톤", "situation": hackathon, "task": "t", "action": PLACEHOLDER, "result": "r"}],
+            "청크 B": [
+                {"title": "해커톤 우승", "situation": hackathon, "task": "t2", "action": "a", "result": "r2"},
+                {"title": "인턴", "situation": "스타트업에서 고객 이탈 데이터를 분석했다", "task": "t", "action": "a", "result": "r"},
+            ],
+        }
+
+        def predict(prompt, **kwargs):
+            chunk = next(key for key in ["청크 A", "청크 B", "청크 C"] if key in prompt)
+            if chunk == "청크 C":
+                raise RuntimeError("timeout")
+            return json.dumps(responses[chunk], ensure_ascii=False)
+
+        items = extract_star_items("이력서", "", MagicMock(predict=MagicMock(side_effect=predict)))
+        self.assertEqual([item["title"] for item in items], ["해커톤", "인턴"])
+        # 중복 경험은 먼저 나온 값을 유지하고, 비어 있던 필드만 채움
+        self.assertEqual(items[0]["action"], "a")
+        self.assertEqual(items[0]["task"], "t")
+
+    @patch('user_experience.utils.split_resume_text', return_value=["청크 A", "청크 B"])
+    def test_all_chunks_failing_raises(self, mock_split):
+        with self.assertRaises(RuntimeError):
+            extract_star_items("이력서", "", MagicMock(predict=MagicMock(side_effect=RuntimeError("timeout"))))
+
+
+def extract_in_daemon(path, page_count, queue):
+    """
+    Celery prefork 워커처럼 데몬 프로세스 안에서 추출하고, (텍스트, 프로세스 풀 사용 여부)를 돌려줍니다.
+    """
+    with patch('user_experience.pdf_extraction.Pool', wraps=pdf_extraction.Pool) as pool:
+        text = pdf_extraction.extract_text_from_path(path, page_count)
+    queue.put((text, pool.called))
+
+
+@override_settings(CACHES=TEST_CACHES, RESUME_PAGES_PER_CHUNK=1, RESUME_EXTRACT_WORKERS=2, RESUME_MAX_PAGES=5)
+class PdfExtractionTest(SimpleTestCase):
+    def setUp(self):
+        caches['pdf_text'].clear()
+        self.pdf = make_pdf(["Page one", "Page two", "Page three"])
+
+    def test_pages_are_extracted_in_order_across_processes(self):
+        self.assertEqual(extract_pdf_text(io.BytesIO(self.pdf)), "Page onePage twoPage three")
+
+    def test_parallel_path_is_used_inside_daemon_worker(self):
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+            pdf_file.write(self.pdf)
+            pdf_file.flush()
+            queue = billiard.Queue()
+            worker = billiard.Process(target=extract_in_daemon, args=(pdf_file.name, 3, queue), daemon=True)
+            worker.start()
+            text, used_pool = queue.get(timeout=30)
+            worker.join()
+        self.assertEqual(text, "Page onePage twoPage three")
+        self.assertTrue(used_pool)
+
+    @override_settings(RESUME_EXTRACT_WORKERS=1)
+    def test_same_content_is_served_from_cache(self):
+        extract_pdf_text(io.BytesIO(self.pdf))
+        with patch('user_experience.pdf_extraction.count_pages') as mock_count:
+            self.assertEqual(extract_pdf_text(io.BytesIO(self.pdf)), "Page onePage twoPage three")
+        mock_count.assert_not_called()
+
+    def test_page_and_size_limits(self):
+        with self.assertRaises(ResumeLimitExceeded):
+            extract_pdf_text(io.BytesIO(make_pdf([f"Page {i}" for i in range(6)])))
+        with override_settings(RESUME_MAX_UPLOAD_BYTES=100), self.assertRaises(ResumeLimitExceeded):
+            extract_pdf_text(io.BytesIO(self.pdf))
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), CACHES=TEST_CACHES)
+class UploadResumeDedupTest(TestCase):
+    def setUp(self):
+        caches['pdf_text'].clear()
+        self.user = User.objects.create_user(username='uploader', password='password123')
+        self.client.force_login(self.user)
+        raw = RawExperience.objects.create(user=self.user, extracted_text="")
+        self.existing = STARExperience.objects.create(
+            user=self.user, raw_experience=raw, title="해커톤", situation="교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다",
+            task="", action="", result=""
+        )
+
+    def upload(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/user-experience/upload-resume/', {
+                'resume_file': SimpleUploadedFile("resume.pdf", b"%PDF-1.4", content_type="application/pdf"),
+            })
+
+    @patch('user_experience.views.start_resume_ingestion', lambda job_id: resume_ingestion_pipeline(job_id).apply())
+    @patch('user_experience.tasks.llm')
+    @patch('user_experience.pdf_extraction.pdfplumber')
+    def test_upload_updates_duplicates_and_creates_new_in_bulk(self, mock_pdfplumber, mock_llm):
+        page = MagicMock()
+        page.extract_text.return_value = "이력서 텍스트"
+        mock_pdfplumber.open.return_value.__enter__.return_value.pages = [page]
+        mock_llm.predict.return_value = json.dumps([
+            {"title": "해커톤 우승", "situation": "교내 해커톤에서 팀을 이끌어 추천 시스템을 개발했다",
+             "task": "t", "action": "a", "result": "r"},
+            {"title": "인턴", "situation": "스타트업에서 고객 이탈 데이터를 분석했다", "task": "t", "action": "a", "result": "r"},
+        ], ensure_ascii=False)
+
+        response = self.upload()
+
+        self.assertEqual(response.status_code, 202)
+        status = self.client.get(response.json()['status_url']).json()
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(
+            sorted(STARExperience.objects.filter(user=self.user).values_list("title", flat=True)), ["인턴", "해커톤 우승"]
+        )
+        self.assertEqual(sorted(status['star_ids']), sorted(STARExperience.objects.filter(user=self.user).values_list("id", flat=True)))
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.result, "r")
+        self.assertEqual(RawExperience.objects.get(user=self.user).extracted_text, "이력서 텍스트")
+
+    @patch('user_experience.views.start_resume_ingestion', lambda job_id: resume_ingestion_pipeline(job_id).apply())
+    @patch('user_experience.tasks.llm')
+    @patch('user_experience.pdf_extraction.pdfplumber')
+    def test_llm_failure_marks_job_failed(self, mock_pdfplumber, mock_llm):
+        mock_pdfplumber.open.return_value.__enter__.return_value.pages = []
+        mock_llm.predict.side_effect = RuntimeError("rate limited")
+
+        response = self.upload()
+
+        job = ResumeIngestionJob.objects.get(id=response.json()['job_id'])
+        self.assertEqual(job.stage, ResumeIngestionJob.STAGE_FAILED)
+        self.assertIn("rate limited", job.error)
+        self.assertEqual(STARExperience.objects.filter(user=self.user).count(), 1)
+
+    @override_settings(RESUME_MAX_UPLOAD_BYTES=4)
+    def test_oversized_upload_is_rejected(self):
+        response = self.upload()
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ResumeIngestionJob.objects.exists())
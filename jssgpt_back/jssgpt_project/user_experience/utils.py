@@ -1,58 +1,375 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import math
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from concurrent.futures import ThreadPoolExecutor
+from django.db import transaction
+from django.utils import timezone
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_app.json_stream import loads_partial
+from langchain_app.llm_gateway import get_chat_model
+from langchain_app.structured_output import StarList, predict_structured
 import json
 import logging
 
 logger = logging.getLogger('django')
 
-def calculate_similarity(text1, text2):
+# 공용 LLM 게이트웨이 모델 (이력서 STAR 구조화에 사용)
+llm = get_chat_model("gpt-4o-2024-11-20", temperature=0.5, caller="resume")
+
+# LLM이 반환하는 STAR 경험 필드
+STAR_FIELDS = ('title', 'situation', 'task', 'action', 'result')
+
+# 이 값 이상으로 situation이 비슷하면 같은 경험으로 보고 갱신 (두 텍스트로만 학습한 TF-IDF 코사인 유사도 기준)
+SIMILARITY_THRESHOLD = 0.7
+# 두 텍스트로 TfidfVectorizer(smooth_idf)를 학습할 때 한쪽에만 있는 단어의 idf (양쪽에 있는 단어는 1)
+PAIR_UNIQUE_IDF = 1 + math.log(3 / 2)
+PLACEHOLDER = "경험을 입력해주세요"
+
+# 이력서 텍스트를 나눌 청크 크기(문자 수)와 겹침. 한 청크가 한 번의 LLM 호출 입력이 됨
+STAR_CHUNK_SIZE = 6000
+STAR_CHUNK_OVERLAP = 400
+# 청크별 STAR 추출 LLM 호출을 동시에 보낼 최대 스레드 수
+MAX_STAR_EXTRACTION_WORKERS = 4
+# 섹션 경계(빈 줄, 글머리 기호/번호로 시작하는 줄)를 우선으로 자르고, 안 되면 줄/문장/공백 단위로 자름
+RESUME_SECTION_SEPARATORS = [
+    r"\n\s*\n",
+    r"\n(?=\s*(?:[■□●○◆◇▶▷★☆※•\-\*]|\[|【|\d+[.)]\s))",
+    r"\n",
+    r"(?<=[.!?다])\s+",
+    r"\s+",
+    "",
+]
+
+
+def pairwise_tfidf_similarities(texts, rows):
     """
-    두 텍스트 간의 코사인 유사도를 계산합니다.
-    Args:
-        text1 (str): 첫 번째 텍스트
-        text2 (str): 두 번째 텍스트
+    texts[rows]의 각 텍스트와 texts 전체의 코사인 유사도 행렬을 반환합니다.
+    각 쌍의 값은 그 두 텍스트만으로 TfidfVectorizer를 학습했을 때와 같습니다.
+    (배치 전체로 학습하면 idf가 배치 구성에 따라 바뀌어 같은 쌍의 중복 판정이 달라지므로 쌍마다 따로 계산)
+    두 텍스트로 학습한 idf는 양쪽에 있는 단어 1, 한쪽에만 있는 단어 PAIR_UNIQUE_IDF이므로
+    단어 수 행렬의 희소 행렬 곱 몇 번으로 모든 쌍을 한 번에 계산합니다.
+    """
+    counts = CountVectorizer().fit_transform(texts).astype(float)
+    present = (counts > 0).astype(float)
+    squared = counts.multiply(counts)
+    row_counts, row_present, row_squared = counts[rows], present[rows], squared[rows]
+    # 양쪽에 있는 단어는 가중치가 같으므로 내적은 단어 수의 곱
+    dot = (row_counts @ counts.T).toarray()
+    # 한쪽에만 있는 단어만 PAIR_UNIQUE_IDF 가중치를 받으므로, 전체를 그 가중치로 두고 공유 단어만큼 빼서 노름 계산
+    unique_weight = PAIR_UNIQUE_IDF ** 2
+    row_norms = unique_weight * np.asarray(row_squared.sum(axis=1)) - (unique_weight - 1) * (row_squared @ present.T).toarray()
+    col_norms = unique_weight * np.asarray(squared.sum(axis=1)).T - (unique_weight - 1) * (row_present @ squared.T).toarray()
+    denominator = np.sqrt(row_norms * col_norms)
+    return np.divide(dot, denominator, out=np.zeros_like(dot), where=denominator > 0)
+
+
+def find_duplicate_targets(existing_texts, incoming_texts, threshold=SIMILARITY_THRESHOLD):
+    """
+    새로 들어온 경험들이 각각 어떤 경험과 중복인지 한 번에 계산합니다.
+    유사도는 쌍마다 두 텍스트로만 학습한 TF-IDF 코사인 유사도이며(SIMILARITY_THRESHOLD의 기준), 행렬 연산으로 한 번에 구합니다.
+    신규 경험은 순서대로 처리하며, 먼저 처리된 신규 경험(새로 생성될 경험)과도 비교합니다.
+    갱신된 경험은 이후 비교에서 갱신된 텍스트로 비교합니다.
     Returns:
-        float: 유사도 값 (0~1 사이)
+        list: 신규 경험별 대상 인덱스. existing_texts + incoming_texts 기준 인덱스이며, 중복이 없으면 None
     """
-    # 플레이스홀더 텍스트인 경우 비교하지 않음
-    placeholder = "경험을 입력해주세요"
-    if text1.strip() == placeholder or text2.strip() == placeholder:
-        return 0.0
+    n_existing = len(existing_texts)
+    texts = list(existing_texts) + list(incoming_texts)
+    comparable = [bool(text.strip()) and text.strip() != PLACEHOLDER for text in texts]
     try:
-        vectorizer = TfidfVectorizer().fit_transform([text1, text2])
-        vectors = vectorizer.toarray()
-        similarity = cosine_similarity([vectors[0]], [vectors[1]])
-        return similarity[0][0]
+        similarities = pairwise_tfidf_similarities(texts, slice(n_existing, None))
     except ValueError as e:
         logger.warning(f"Similarity calculation error: {e}")
-        return 0.0
+        return [None] * len(incoming_texts)
+
+    # 대상 경험(행) -> 현재 그 경험이 가진 텍스트의 인덱스 (삽입 순서 = 기존 경험 다음 새로 생성된 경험)
+    current_text = {i: i for i in range(n_existing)}
+    targets = []
+    for i in range(len(incoming_texts)):
+        doc = n_existing + i
+        target = None
+        if comparable[doc]:
+            target = next(
+                (row for row, text_idx in current_text.items()
+                 if comparable[text_idx] and similarities[i, text_idx] >= threshold),
+                None
+            )
+        current_text[doc if target is None else target] = doc
+        targets.append(target)
+    return targets
+
+
+def get_star_guide():
+    """
+    CoverLetterGuide에서 STARExperience_guide 내용을 가져옵니다. 없으면 빈 문자열을 반환합니다.
+    """
+    from langchain_app.models import CoverLetterGuide
+    guide_instance = CoverLetterGuide.objects.filter(title='STARExperience_guide').first()
+    return guide_instance.content if guide_instance else ""
+
+
+def build_star_prompt(extracted_text, guide_text):
+    """
+    이력서 텍스트에서 경험을 식별해 STAR(3C/4P 반영) 구조의 JSON 배열로 정리하도록 하는 프롬프트를 구성합니다.
+    """
+    return f"""
+    다음은 사용자의 이력서에서 추출한 텍스트야.
+
+    텍스트:
+    {extracted_text}
+
+    너의 목표는, 이 텍스트 안에서 각 경험을 식별하고,  
+    각 경험을 STAR 구조로 정리하되, **3C 프레임워크와 4P 프레임워크 요소를 적절히 반영하여 더 설득력 있는 구성**으로 만들어주는 것이야.
+
+    ---
+
+    ### 작업 방식
+
+    #### 1단계: 자기소개서 경험 작성 가이드 파악
+    - 다음 {guide_text}를 읽고, 자기소개서를 위해 적절하게 경험을 구성하는 방법을 파악해.
+
+    #### 2단계: 경험 식별
+    - 텍스트에서 한 개의 명확한 활동, 프로젝트, 도전이 드러나는 단위를 "하나의 경험"으로 간주해.
+    - 최대한 많은 경험으로 뽑아내야 해.
+    - 그 안에서 당사자가 직접 주도하거나 기여한 사례를 모두 식별해.
+    - 만일, title 혹은 경험의 일부만 식별할 수 있는 경우, 나머지를 '경험을 입력해주세요.'로 처리해줘.
+
+    #### 3단계: STAR 구성 (3C + 4P 융합 포함)
+    각 경험은 아래와 같은 논리적 구조로 정리해줘:
+
+    **title**  
+    → 해당 경험을 한 문장으로 요약한 제목
+
+    **situation** (3C: Customer, Company)  
+    → 어떤 배경에서 이 일이 발생했는지 설명해줘.  
+    → 특히, 누구를 위한 활동이었는지(Customer), 어떤 조직의 맥락(Company)에서 일어났는지 포함해줘.
+
+    **task** (Company + 경쟁 환경)  
+    → 그 상황에서 당사자가 맡았던 과제를 설명해줘.  
+    → 과제가 생긴 이유, 달성하고자 한 목표 등을 회사의 목표나 경쟁 요소와 연결해서 설명해.
+
+    **action** (4P: Product, Place, Promotion)  
+    → 당사자가 구체적으로 수행한 행동을 자세히 설명해줘.  
+    → 특히 어떤 결과물을 만들었는지(Product), 어디서 수행했고 그 이유는 무엇인지(Place), 어떻게 확산/홍보했는지(Promotion) 등의 측면을 반영해줘.
+    → result가 납득이 되도록 action을 자세하고, 논리적으로 추론해서 작성해줘.
+
+    **result** (4P: Price)  
+    → 행동의 결과가 수치나 반응 등으로 어떻게 나타났는지 설명해줘.  
+    → 가능하면 고객 만족도, 내부 평가, 성과 지표 등으로 표현해.
+
+    📌 프레임워크 요소는 STAR 항목에 자연스럽게 녹여서 표현하고, 어떤 프레임워크 요소를 참고했는지도 내부적으로 고려해서 작성해줘.
+
+    ---
+
+    ### 주의사항
+    - 정보가 부족하거나 불명확한 항목은 `"경험을 입력해주세요"`로 처리해.
+    - 하나의 경험에 대해 title, situation, task, action, result를 모두 포함한 JSON 객체로 표현하고, 모든 경험을 "experiences" 배열에 담아 반환해.
+    - 출력은 반드시 JSON 형식으로만, 설명 없이 순수 데이터로 반환해.
+
+    ---
+
+    ### [출력 형식]
+
+    아래 형식의 **JSON 객체**로 반환해줘. JSON 외의 설명은 포함하지 마.
+
+    ```json
+    {{
+    "experiences": [
+    {{
+        "title": "경험의 제목",
+        "situation": "경험의 배경, 맥락 등을 최소 3문장으로 명확히 서술",
+        "task": "해결해야 했던 과제나 도전 과제",
+        "action": "당사자가 수행한 행동, 문제 해결 방식, 의사결정 등을 구체적으로 설명",
+        "result": "성과나 결과 한 문장. 불분명하면 '경험을 입력해주세요'"
+    }},
+    ...
+    ]
+    }}
+    """
 
-def parse_openai_response(response):
+
+def parse_star_response(response):
     """
     OpenAI 응답을 JSON 형태로 파싱합니다.
-    JSON 형식이 아닐 경우, 텍스트를 파싱하여 딕셔너리로 변환.
+    응답이 잘렸으면 완성된 경험만 복구하고, JSON 형식이 아닐 경우 텍스트를 파싱하여 딕셔너리 리스트로 변환.
     """
+    # 응답에서 불필요한 태그 제거 (수동 파싱용)
+    cleaned_response = response.strip().replace("```json", "").replace("```", "")
+    
     try:
-        # JSON 형식인지 확인하고 파싱
-        return json.loads(response)
-    except json.JSONDecodeError:
-        # JSON이 아닐 경우 텍스트 파싱
-        logger.warning("OpenAI Response is not JSON. Attempting to parse manually.")
+        # JSON 파싱 시도 (잘린 배열은 완성된 항목까지만 복구)
+        parsed_data, complete = loads_partial(response)
+        if not complete:
+            logger.warning("OpenAI Response was truncated. Recovered complete items only.")
+        logger.debug(f"Successfully parsed JSON: {parsed_data}")
+        return parsed_data
+    except json.JSONDecodeError as e:
+        logger.warning(f"OpenAI Response is not valid JSON: {e}. Attempting to parse manually.")
+        # 수동 파싱 로직 (배열 처리 가능하도록 개선)
         parsed_data = []
-        lines = response.split("\n")
         current_item = {}
+        lines = cleaned_response.split("\n")
         for line in lines:
             line = line.strip()
-            if ":" in line:
-                key, value = line.split(":", 1)
-                # 키와 값을 깨끗하게 정리 (따옴표, 쉼표 제거)
-                key = key.strip().strip('"')
-                value = value.strip().strip('",')
-                current_item[key] = value
-            elif not line:
+            if line.startswith("{"):
+                current_item = {}
+            elif line.startswith("}"):
                 if current_item:
                     parsed_data.append(current_item)
                     current_item = {}
-        if current_item:
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                current_item[key.strip().strip('"')] = value.strip().strip('",')
+        if current_item:  # 마지막 항목 추가
             parsed_data.append(current_item)
+        logger.debug(f"Manually parsed data: {parsed_data}")
         return parsed_data
+
+
+def split_resume_text(extracted_text, chunk_size=STAR_CHUNK_SIZE, chunk_overlap=STAR_CHUNK_OVERLAP):
+    """
+    이력서 텍스트를 섹션 경계 우선으로 chunk_size 이하의 청크로 나눕니다.
+    경험 하나가 청크 경계에 걸려도 빠지지 않도록 chunk_overlap만큼 겹치게 자릅니다.
+    """
+    splitter = RecursiveCharacterTextSplitter(
+        separators=RESUME_SECTION_SEPARATORS,
+        is_separator_regex=True,
+        keep_separator=True,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        strip_whitespace=True,
+    )
+    return [chunk for chunk in splitter.split_text(extracted_text or "") if chunk.strip()] or [extracted_text or ""]
+
+
+def normalize_star_items(star_data):
+    """
+    파싱된 응답을 STAR 경험 dict 목록으로 맞춥니다. (단일 객체 응답 허용, dict가 아닌 항목 제거)
+    """
+    if isinstance(star_data, dict):
+        star_data = [star_data]
+    if not isinstance(star_data, list):
+        return []
+    return [item for item in star_data if isinstance(item, dict)]
+
+
+def is_placeholder(value):
+    value = str(value or "").strip().rstrip(".")
+    return not value or value == PLACEHOLDER
+
+
+def merge_star_items(star_items, threshold=SIMILARITY_THRESHOLD):
+    """
+    청크별로 추출된 STAR 경험을 합칩니다. 청크가 겹치는 부분에서 같은 경험이 두 번 나오면
+    situation 유사도로 찾아 하나로 합치고, 비어 있거나 "경험을 입력해주세요"인 필드만 다른 쪽 값으로 채웁니다.
+    """
+    targets = find_duplicate_targets([], [item.get('situation', "") for item in star_items], threshold)
+    merged = {}
+    for i, (item, target) in enumerate(zip(star_items, targets)):
+        if target is None:
+            merged[i] = dict(item)
+            continue
+        base = merged[target]
+        for field in STAR_FIELDS:
+            if is_placeholder(base.get(field)) and not is_placeholder(item.get(field)):
+                base[field] = item[field]
+    return list(merged.values())
+
+
+def extract_star_items(extracted_text, guide_text, chat_model):
+    """
+    이력서 텍스트를 청크로 나눠 청크별 STAR 추출(map)을 스레드 풀에서 동시에 수행한 뒤,
+    결과를 하나로 합치고 중복을 제거(reduce)합니다.
+    청크별 응답은 JSON mode + StarList 스키마로 검증하며, 검증 실패 시에만 재요청하고 마지막으로 parse_star_response를 사용합니다.
+    일부 청크가 실패해도 나머지 결과는 사용하며, 모든 청크가 실패하면 마지막 예외를 다시 발생시킵니다.
+    """
+    chunks = split_resume_text(extracted_text)
+    logger.debug(f"Extracting STAR experiences from {len(chunks)} chunk(s)")
+
+    def _extract(chunk):
+        star_list = predict_structured(
+            chat_model, build_star_prompt(chunk, guide_text), StarList,
+            fallback=lambda response: normalize_star_items(parse_star_response(response)),
+        )
+        return [item.model_dump() for item in star_list.experiences]
+
+    if len(chunks) == 1:
+        return merge_star_items(_extract(chunks[0]))
+
+    def _safe_extract(chunk):
+        try:
+            return _extract(chunk), None
+        except Exception as e:
+            logger.error(f"STAR extraction failed for a resume chunk: {e}")
+            return [], e
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_STAR_EXTRACTION_WORKERS)) as executor:
+        results = list(executor.map(_safe_extract, chunks))
+
+    errors = [error for _, error in results if error is not None]
+    if len(errors) == len(results):
+        raise errors[-1]
+    return merge_star_items([item for items, _ in results for item in items])
+
+
+def plan_star_dedup(existing_stars, star_data):
+    """
+    새 STAR 경험들이 각각 기존 경험(existing) 또는 먼저 처리된 새 경험(incoming) 중 어디에 합쳐질지 계산합니다.
+    Returns:
+        list: 항목별 ["existing", STARExperience id] / ["incoming", 새 경험 인덱스] / None(새로 생성)
+    """
+    targets = find_duplicate_targets(
+        [star.situation for star in existing_stars],
+        [item.get('situation', "") for item in star_data]
+    )
+    plan = []
+    for target in targets:
+        if target is None:
+            plan.append(None)
+        elif target < len(existing_stars):
+            plan.append(["existing", existing_stars[target].id])
+        else:
+            plan.append(["incoming", target - len(existing_stars)])
+    return plan
+
+
+def persist_star_experiences(user, raw_experience, star_data, plan):
+    """
+    plan_star_dedup의 결과대로 기존 경험은 bulk_update로 갱신하고, 새 경험은 bulk_create로 생성합니다.
+    갱신/생성된 STARExperience id 목록을 star_data 순서대로(중복 제거) 반환합니다.
+    """
+    from .models import STARExperience
+    existing_ids = [target[1] for target in plan if target and target[0] == "existing"]
+    existing = STARExperience.objects.in_bulk(existing_ids) if existing_ids else {}
+    existing = {pk: star for pk, star in existing.items() if star.user_id == user.id}
+
+    created = {}
+    to_update, to_create, touched = {}, [], []
+    now = timezone.now()
+    for i, (item, target) in enumerate(zip(star_data, plan)):
+        logger.debug(f"Processing STAR Data: {item}")
+        fields = {field: item.get(field, "") for field in STAR_FIELDS}
+        if target and target[0] == "existing" and target[1] in existing:
+            star = existing[target[1]]
+        elif target and target[0] == "incoming" and target[1] in created:
+            star = created[target[1]]
+        else:
+            # 유사한 것이 없으면(또는 그 사이 삭제되었으면) 새롭게 생성
+            star = STARExperience(user=user, raw_experience=raw_experience, **fields)
+            created[i] = star
+            to_create.append(star)
+            touched.append(star)
+            continue
+        # 기존(또는 이번에 생성될) 데이터 업데이트
+        for field, value in fields.items():
+            setattr(star, field, value)
+        if star.pk:
+            star.updated_at = now
+            to_update[star.pk] = star
+        if star not in touched:
+            touched.append(star)
+
+    with transaction.atomic():
+        STARExperience.objects.bulk_update(list(to_update.values()), [*STAR_FIELDS, 'updated_at'])
+        STARExperience.objects.bulk_create(to_create)
+    logger.debug(f"Updated {len(to_update)} / created {len(to_create)} STARExperiences")
+    return [star.id for star in touched]
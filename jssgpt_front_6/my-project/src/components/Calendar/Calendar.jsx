@@ -13,18 +13,42 @@ function Calendar() {
   const [currentDate, setCurrentDate] = useState(dayjs.utc());
   const [recruitmentEvents, setRecruitmentEvents] = useState([]);
 
+  const startOfMonth = currentDate.startOf('month');
+  const endOfMonth = currentDate.endOf('month');
+
+  // 달력 그리드를 현재 달의 시작 주 일요일부터 마지막 주 토요일까지 포함 (UTC 기준)
+  const calendarStart = startOfMonth.startOf('week');
+  const calendarEnd = endOfMonth.endOf('week');
+  const windowStart = calendarStart.format('YYYY-MM-DD');
+  const windowEnd = calendarEnd.format('YYYY-MM-DD');
+
+  // 달력에 보이는 기간의 공고만 next_cursor를 따라가며 모두 가져옴
   useEffect(() => {
+    let cancelled = false;
     async function fetchEvents() {
       try {
-        const response = await axios.get('/api/recruitment-events/');
-        console.log("API Response:", response.data);
-        setRecruitmentEvents(response.data);
+        const events = [];
+        let cursor = null;
+        do {
+          const response = await axios.get('/api/recruitment-events/', {
+            params: { start: windowStart, end: windowEnd, ...(cursor ? { cursor } : {}) },
+          });
+          events.push(...response.data.results);
+          cursor = response.data.next_cursor;
+        } while (cursor && !cancelled);
+        console.log("API Response:", events);
+        if (!cancelled) {
+          setRecruitmentEvents(events);
+        }
       } catch (error) {
         console.error("Failed to fetch recruitment events:", error);
       }
     }
     fetchEvents();
-  }, []);
+    return () => {
+      cancelled = true;
+    };
+  }, [windowStart, windowEnd]);
 
   const handlePrevMonth = () => {
     setCurrentDate(prev => prev.subtract(1, 'month'));
@@ -33,13 +57,6 @@ function Calendar() {
     setCurrentDate(prev => prev.add(1, 'month'));
   };
 
-  const startOfMonth = currentDate.startOf('month');
-  const endOfMonth = currentDate.endOf('month');
-
-  // 달력 그리드를 현재 달의 시작 주 일요일부터 마지막 주 토요일까지 포함 (UTC 기준)
-  const calendarStart = startOfMonth.startOf('week');
-  const calendarEnd = endOfMonth.endOf('week');
-
   const daysArray = [];
   let day = calendarStart;
   while (day.isBefore(calendarEnd) || day.isSame(calendarEnd, 'day')) {
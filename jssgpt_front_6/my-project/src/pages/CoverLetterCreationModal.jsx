@@ -60,6 +60,19 @@ const CoverLetterCreationModal = ({ recruitJobId, onClose, onGenerationComplete
     setFormData(prev => ({ ...prev, [promptId]: value }));
   };
 
+  const waitForDraftJob = async (statusUrl) => {
+    while (true) {
+      const { data } = await axios.get(statusUrl, { withCredentials: true });
+      if (data.status === 'done') {
+        return data;
+      }
+      if (data.status === 'failed') {
+        throw new Error('Draft generation failed');
+      }
+      await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+  };
+
   const handleSubmit = async () => {
     const csrfToken = getCookie('csrftoken');  // CSRF 토큰 가져오기
     const formPayload = new FormData();
@@ -79,7 +92,7 @@ const CoverLetterCreationModal = ({ recruitJobId, onClose, onGenerationComplete
       // 초안 생성 요청
       setStep(3);
       setLoading(true);
-      await axios.post(
+      const draftResponse = await axios.post(
         `/api/cover-letter/generate-draft/${recruitJobId}/`,
         {},
         {
@@ -87,6 +100,8 @@ const CoverLetterCreationModal = ({ recruitJobId, onClose, onGenerationComplete
           withCredentials: true,
         }
       );
+      // 초안 생성은 백그라운드 작업으로 진행되므로 완료될 때까지 상태를 조회
+      await waitForDraftJob(draftResponse.data.status_url);
       setLoading(false);
       onGenerationComplete();
     } catch (error) {
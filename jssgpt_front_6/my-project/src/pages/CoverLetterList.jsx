@@ -8,20 +8,27 @@ import Footer from '../components/Footer/Footer';
 
 const CoverLetterList = () => {
   const [coverLetters, setCoverLetters] = useState([]);
+  const [page, setPage] = useState(1);
+  const [numPages, setNumPages] = useState(1);
   const [searchQuery, setSearchQuery] = useState('');
   const [error, setError] = useState('');
   const navigate = useNavigate();
 
   useEffect(() => {
-    fetchCoverLetters();
+    fetchCoverLetters(1);
   }, []);
 
-  const fetchCoverLetters = async () => {
+  // 목록은 페이지 단위로 내려오므로 '더 보기'를 누르면 다음 페이지를 이어 붙임
+  const fetchCoverLetters = async (pageToLoad) => {
     try {
       const response = await axios.get('/api/cover-letter/list/', {
+        params: { page: pageToLoad },
         withCredentials: true,
       });
-      setCoverLetters(response.data);
+      const { results, page: loadedPage, num_pages } = response.data;
+      setCoverLetters((prev) => (loadedPage === 1 ? results : [...prev, ...results]));
+      setPage(loadedPage);
+      setNumPages(num_pages);
     } catch (err) {
       console.error(err);
       setError('자기소개서 목록을 불러오지 못했습니다.');
@@ -103,6 +110,14 @@ const CoverLetterList = () => {
             </div>
           ))}
         </div>
+
+        {page < numPages && (
+          <div className={styles.loadMoreContainer}>
+            <button className={styles.searchButton} onClick={() => fetchCoverLetters(page + 1)}>
+              더 보기
+            </button>
+          </div>
+        )}
       </div>
       <Footer />
     </>
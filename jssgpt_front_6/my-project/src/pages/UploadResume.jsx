@@ -25,6 +25,20 @@ const UploadResume = () => {
     setSelectedFile(file);
   };
 
+  // 백그라운드 이력서 처리 작업이 끝날 때까지 2초 간격으로 상태 조회
+  const waitForIngestionJob = async (statusUrl) => {
+    while (true) {
+      const { data } = await axios.get(statusUrl, { withCredentials: true });
+      if (data.status === 'done') {
+        return data;
+      }
+      if (data.status === 'failed') {
+        throw new Error('Resume ingestion failed');
+      }
+      await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+  };
+
   const handleUpload = async (e) => {
     e.preventDefault();
     if (!selectedFile) {
@@ -51,7 +65,8 @@ const UploadResume = () => {
         }
       );
 
-      if (response.data.message) {
+      if (response.data.status_url) {
+        await waitForIngestionJob(response.data.status_url);
         setSuccessMessage('이력서 업로드가 완료되었습니다!');
         setTimeout(() => navigate('/experience-edit'), 2000);
       } else {